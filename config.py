@@ -15,6 +15,7 @@ class Cfg:
     screen_width: int = 800
     screen_height: int = 600
     fps: int = 60
+    precise_timing: bool = False  # Busy-wait the frame limiter for exact pacing (costs CPU/battery)
     reference_height: int = 600
 
     # Color palette
@@ -63,6 +64,7 @@ class Cfg:
     bullet_trail_length: int = 8
     enemy_bullet_trail_length: int = 6
     enemy_bullet_speed_mult: float = 0.8
+    collision_vectorize_threshold: int = 256  # bullet x target pairs before numpy collision path
 
     # Asteroid settings
     asteroid_min_size: int = 1
@@ -79,6 +81,7 @@ class Cfg:
     asteroid_vertex_count: int = 8
     asteroid_shape_variance_min: int = 8
     asteroid_shape_variance_max: int = 12
+    polygon_vectorize_threshold: int = 8  # asteroids on screen before numpy polygon path
 
     # Boss settings
     boss_health: int = 50
@@ -198,12 +201,13 @@ class Cfg:
     particle_respawn_spiral_max: int = 60
     particle_respawn_center_chance: float = 0.3
     particle_respawn_center_spread: int = 10
-    particle_streak_attraction_distance: int = 100
+    particle_streak_attraction_distance: int = 100  # Compared against squared distance
     particle_streak_attraction_force: float = 0.15
     particle_streak_min_life: int = 5
     particle_dash_trail_life: int = 20
     particle_powerup_flash_duration: int = 20
     particle_powerup_flash_max: int = 30
+    particle_batch_threshold: int = 16
 
     # UI layout
     ui_margin: int = 10
@@ -253,6 +257,7 @@ class Cfg:
     floating_text_speed: int = 2
     floating_text_friction: float = 0.95
     floating_text_spread: int = 10
+    floating_text_fade_steps: int = 12
     level_text_scale_min: float = 0.5
     level_text_scale_max: float = 2.0
     level_text_appear_threshold: float = 0.3
@@ -267,6 +272,7 @@ class Cfg:
     combo_edge_thickness_base: int = 30
     combo_edge_thickness_step: int = 8
     combo_edge_alpha_decay: float = 0.3
+    combo_edge_max_alpha: int = 50
     pause_fade_speed: int = 15
     game_over_fade_speed: int = 3
 
@@ -391,6 +397,9 @@ class Cfg:
     glow_layer_alpha_base: int = 50
     glow_layer_alpha_step: int = 15
     glow_layer_radius_step: int = 2
+    glow_sprite_intensity_steps: int = 16
+    glow_sprite_cache_size: int = 128
+    dash_segment_cache_size: int = 8
     respawn_spiral_layers: int = 3
     respawn_spiral_radius_start: int = 50
     respawn_spiral_radius_step: int = 3
@@ -4,9 +4,10 @@ Data structures for the Asteroids game.
 This module contains all enums and dataclasses used throughout the game.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Deque
 
 
 class PowerUpType(Enum):
@@ -55,8 +56,8 @@ class ShipState:
     x: float
     y: float
     angle: float = 0.0
-    vel_x: float = 0.0
-    vel_y: float = 0.0
+    vx: float = 0.0
+    vy: float = 0.0
     invulnerable: float = 0
     rapid_fire: float = 0
     triple_shot: float = 0
@@ -66,10 +67,11 @@ class ShipState:
     respawning: float = 0
     aura_pulse: float = 0.0
     dashing: float = 0
-    dash_trail: List[Dict[str, Any]] = field(default_factory=list)
+    # Bounded FIFO; creators pass deque(maxlen=Cfg.dash_trail_max_length)
+    dash_trail: Deque[Dict[str, Any]] = field(default_factory=deque)
 
 
-@dataclass
+@dataclass(slots=True)
 class Asteroid:
     """Asteroid game object."""
 
@@ -89,7 +91,7 @@ class Asteroid:
     hit_flash: float = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Bullet:
     """Projectile fired by ship or enemies."""
 
@@ -98,10 +100,11 @@ class Bullet:
     vx: float
     vy: float
     life: float
-    trail: List[Tuple[float, float]] = field(default_factory=list)
+    # Bounded FIFO; creators pass deque(maxlen=...) sized by the bullet's trail length
+    trail: Deque[Tuple[float, float]] = field(default_factory=deque)
 
 
-@dataclass
+@dataclass(slots=True)
 class Enemy:
     """Enemy ship game object."""
 
@@ -119,7 +122,7 @@ class Enemy:
     hit_flash: float = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PowerUp:
     """Collectible power-up game object."""
 
@@ -132,7 +135,7 @@ class PowerUp:
     pulse: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Particle:
     """Visual effect particle."""
 
@@ -146,7 +149,7 @@ class Particle:
     type: Optional[ParticleType] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FloatingText:
     """UI floating text effect."""
 
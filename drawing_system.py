@@ -23,6 +23,11 @@ from data_structures import (
 
 # Do NOT import from main to avoid circular imports
 
+# Sin/cos lookup tables at 0.1 degree resolution (same layout as main.py's tables)
+SIN_COS_STEPS = 3600
+SIN_TABLE: Tuple[float, ...] = tuple(math.sin(math.radians(i / 10)) for i in range(SIN_COS_STEPS))
+COS_TABLE: Tuple[float, ...] = tuple(math.cos(math.radians(i / 10)) for i in range(SIN_COS_STEPS))
+
 
 class DrawingSystem:
     """Centralized drawing system for the Asteroids game."""
@@ -38,6 +43,7 @@ class DrawingSystem:
         self.fonts = fonts
         self.text_cache = text_cache
         self.get_scale_factor = scale_factor_fn
+        self.glow_sprite_cache: Dict[Tuple[int, Tuple[int, int, int], int, int], pygame.Surface] = {}
 
     def glow(
         self,
@@ -80,6 +86,62 @@ class DrawingSystem:
             )
             surface.blit(glow_surface, (int(pos[0] - scaled_radius), int(pos[1] - scaled_radius)))
 
+    def glow_sprite(
+        self,
+        radius: float,
+        color: Tuple[int, int, int],
+        intensity: float = 1.0,
+        layers: Optional[int] = None,
+    ) -> Optional[pygame.Surface]:
+        """Get a cached pre-rendered glow sprite with all layers composited.
+
+        Intensity is quantized to 1/Cfg.glow_sprite_intensity_steps so pulsing
+        glows reuse a small set of sprites. The cache is cleared when it grows
+        past Cfg.glow_sprite_cache_size entries.
+
+        Args:
+            radius: Glow radius
+            color: RGB color tuple
+            intensity: Glow intensity (0-1)
+            layers: Number of glow layers (defaults to config value)
+
+        Returns:
+            SRCALPHA surface of size (2 * radius, 2 * radius), or None if radius is 0
+        """
+        if layers is None:
+            layers = Cfg.glow_default_layers
+
+        scaled_radius = int(radius)
+        if scaled_radius <= 0:
+            return None
+
+        steps = Cfg.glow_sprite_intensity_steps
+        intensity_step = round(intensity * steps)
+        key = (scaled_radius, color, intensity_step, layers)
+        sprite = self.glow_sprite_cache.get(key)
+        if sprite is not None:
+            return sprite
+
+        if len(self.glow_sprite_cache) >= Cfg.glow_sprite_cache_size:
+            self.glow_sprite_cache.clear()
+
+        quantized_intensity = intensity_step / steps
+        sprite = pygame.Surface((scaled_radius * 2, scaled_radius * 2), pygame.SRCALPHA)
+        for i in range(layers):
+            alpha = int(
+                (Cfg.glow_layer_alpha_base - i * Cfg.glow_layer_alpha_step) * quantized_intensity
+            )
+            layer_radius = scaled_radius - i * Cfg.glow_layer_radius_step
+            if alpha <= 0 or layer_radius <= 0:
+                continue
+
+            layer = pygame.Surface((scaled_radius * 2, scaled_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(layer, (*color, alpha), (scaled_radius, scaled_radius), layer_radius)
+            sprite.blit(layer, (0, 0))
+
+        self.glow_sprite_cache[key] = sprite
+        return sprite
+
     def polygon_with_flash(
         self,
         surface: pygame.Surface,
@@ -156,19 +218,30 @@ class DrawingSystem:
         # Border
         pygame.draw.rect(surface, Cfg.colors["white"], (bar_x, bar_y, bar_width, bar_height), 1)
 
-    def floating_text(self, surface: pygame.Surface, text_obj: FloatingText) -> None:
-        """Draw a floating text effect.
+    def floating_texts(self, surface: pygame.Surface, texts: List[FloatingText]) -> None:
+        """Draw all floating texts with a single batched blit.
+
+        Fade is quantized into Cfg.floating_text_fade_steps buckets so each
+        (text, faded color) pair is a cached surface rather than a fresh render.
 
         Args:
             surface: Surface to draw on
-            text_obj: FloatingText object
+            texts: FloatingText objects to draw
         """
-        alpha = text_obj.life / Cfg.floating_text_life
-        color = tuple(int(c * alpha) for c in text_obj.color)
+        if not texts:
+            return
 
-        text_surface = self.fonts["small"].render(text_obj.text, True, color)
-        text_rect = text_surface.get_rect(center=(int(text_obj.x), int(text_obj.y)))
-        surface.blit(text_surface, text_rect)
+        font = self.fonts["small"]
+        steps = Cfg.floating_text_fade_steps
+        blit_list: List[Tuple[pygame.Surface, Union[Tuple[int, int], pygame.Rect]]] = []
+        for text_obj in texts:
+            bucket = math.ceil(steps * text_obj.life / Cfg.floating_text_life) / steps
+            color = tuple(int(c * bucket) for c in text_obj.color)
+            text_surface = self.text_cache.get_text(text_obj.text, font, color)
+            text_rect = text_surface.get_rect(center=(int(text_obj.x), int(text_obj.y)))
+            blit_list.append((text_surface, text_rect))
+
+        surface.blits(blit_list, doreturn=False)
 
     def enemy_health_pips(self, surface: pygame.Surface, enemy: Enemy) -> None:
         """Draw health pips for an enemy.
@@ -192,8 +265,9 @@ class DrawingSystem:
 
     # Helper methods
     def _get_sin_cos(self, angle: float) -> Tuple[float, float]:
-        """Get sin and cos values for an angle."""
-        return math.sin(math.radians(angle)), math.cos(math.radians(angle))
+        """Get tabulated sin and cos values for an angle with 0.1 degree precision."""
+        idx = round(angle * 10) % SIN_COS_STEPS
+        return SIN_TABLE[idx], COS_TABLE[idx]
 
     def _calculate_pulse(
         self, time: float, frequency: float = 0.1, amplitude: float = 0.5, offset: float = 0.5
@@ -261,46 +335,66 @@ class DrawingSystem:
         return value * self.get_scale_factor()
 
     # Object Drawing Methods
-    def draw_asteroid(
-        self, surface: pygame.Surface, asteroid: Asteroid, get_polygon_points_func
+    def draw_asteroids(
+        self,
+        surface: pygame.Surface,
+        asteroids: List[Asteroid],
+        polygons: List[List[Tuple[float, float]]],
     ) -> None:
-        """Draw an asteroid entity.
+        """Draw all asteroid entities.
+
+        Glows come from cached glow sprites and go out in a single blits()
+        call beneath the outlines, instead of one multi-layer glow per asteroid.
 
         Args:
             surface: Surface to draw on
-            asteroid: Asteroid to draw
-            get_polygon_points_func: Function to get polygon points
+            asteroids: Asteroids to draw
+            polygons: Precomputed polygon points per asteroid (see get_polygons_batch in main.py)
         """
-        points = get_polygon_points_func(
-            asteroid, Cfg.asteroid_vertex_count, asteroid.radius, asteroid.shape
-        )
-
-        if asteroid.is_boss:
-            base_color = Cfg.colors["boss"]
-            glow_color = (255, 100, 100)
-        elif asteroid.has_crystals:
-            base_color = (150, 200, 255)
-            glow_color = Cfg.colors["crystal"]
-        else:
-            base_color = Cfg.colors["asteroid"]
-            glow_color = tuple(int(c * 0.7) for c in Cfg.colors["star"])[:3]
+        if not asteroids:
+            return
 
         scale_factor = self.get_scale_factor()
-        glow_intensity = 0.6 + (asteroid.size / Cfg.asteroid_max_size) * 0.4
-        glow_color_list = [int(c * glow_intensity) for c in glow_color]
-        glow_color = (glow_color_list[0], glow_color_list[1], glow_color_list[2])
+        plain_glow_color = tuple(int(c * 0.7) for c in Cfg.colors["star"])[:3]
+
+        glow_blits: List[Tuple[pygame.Surface, Union[Tuple[int, int], pygame.Rect]]] = []
+        base_colors = []
+        for asteroid in asteroids:
+            if asteroid.is_boss:
+                base_color = Cfg.colors["boss"]
+                glow_color = (255, 100, 100)
+            elif asteroid.has_crystals:
+                base_color = (150, 200, 255)
+                glow_color = Cfg.colors["crystal"]
+            else:
+                base_color = Cfg.colors["asteroid"]
+                glow_color = plain_glow_color
+            base_colors.append(base_color)
+
+            glow_intensity = 0.6 + (asteroid.size / Cfg.asteroid_max_size) * 0.4
+            glow_color = (
+                int(glow_color[0] * glow_intensity),
+                int(glow_color[1] * glow_intensity),
+                int(glow_color[2] * glow_intensity),
+            )
+            radius = int(asteroid.size * 15 * scale_factor)
+            sprite = self.glow_sprite(radius, glow_color)
+            if sprite is not None:
+                glow_blits.append((sprite, (int(asteroid.x - radius), int(asteroid.y - radius))))
 
-        self.glow(surface, (asteroid.x, asteroid.y), asteroid.size * 15 * scale_factor, glow_color)
-        self.polygon_with_flash(surface, asteroid, points, base_color)
+        surface.blits(glow_blits, doreturn=False)
 
-        if asteroid.is_boss and asteroid.health:
-            self.health_bar(
-                surface,
-                asteroid,
-                Cfg.boss_health_bar_width,
-                Cfg.boss_health_bar_height,
-                int(asteroid.radius + Cfg.boss_health_bar_offset),
-            )
+        for asteroid, points, base_color in zip(asteroids, polygons, base_colors):
+            self.polygon_with_flash(surface, asteroid, points, base_color)
+
+            if asteroid.is_boss and asteroid.health:
+                self.health_bar(
+                    surface,
+                    asteroid,
+                    Cfg.boss_health_bar_width,
+                    Cfg.boss_health_bar_height,
+                    int(asteroid.radius + Cfg.boss_health_bar_offset),
+                )
 
     def draw_enemy(
         self,
@@ -410,14 +504,30 @@ class DrawingSystem:
             self.draw_respawn_animation(surface, ship, game_state)
             return
 
+        # Respawning ships returned above, so only the blink phase is checked
         if (
             ship.invulnerable > 0
             and ship.invulnerable % Cfg.ship_invulnerability_blink_interval
             >= Cfg.ship_invulnerability_blink_visible_frames
-            and ship.respawning == 0
         ):
             return
 
+        scale_factor = self.get_scale_factor()
+
+        # Fast path for the common case: nothing active around the ship
+        if not (
+            ship.dash_trail
+            or game_state["finisher"]["ready"]
+            or ship.rapid_fire > 0
+            or ship.triple_shot > 0
+            or ship.shield_active > 0
+            or ship.powerup_flash > 0
+        ):
+            self.glow(surface, (ship.x, ship.y), 20 * scale_factor, Cfg.colors["blue_glow"])
+            self.draw_ship_body(surface, ship, game_state)
+            self.draw_thruster_flame(surface, ship, keys, controller_input, game_state)
+            return
+
         self.draw_dash_trail(surface, ship)
 
         if game_state["finisher"]["ready"]:
@@ -425,8 +535,6 @@ class DrawingSystem:
 
         self.draw_powerup_auras(surface, ship, game_state)
 
-        scale_factor = self.get_scale_factor()
-
         if ship.shield_active > 0:
             self.glow(surface, (ship.x, ship.y), 30 * scale_factor, (0, 255, 0))
             pygame.draw.circle(
@@ -481,11 +589,17 @@ class DrawingSystem:
             surface: Surface to draw on
             ship: Ship state
         """
-        for i, trail in enumerate(ship.dash_trail):
-            alpha = trail["life"] / Cfg.particle_dash_trail_life
-            ghost_points = self._get_ship_points(trail["x"], trail["y"], trail["angle"], 0.8)
-
-            ghost_color = tuple(int(c * alpha) for c in Cfg.colors["dash"])
+        dash_r, dash_g, dash_b = Cfg.colors["dash"]
+        inv_life = 1.0 / Cfg.particle_dash_trail_life
+        for trail in ship.dash_trail:
+            # Ghosts never move, so their outline is built once and kept on the trail entry
+            ghost_points = trail.get("points")
+            if ghost_points is None:
+                ghost_points = self._get_ship_points(trail["x"], trail["y"], trail["angle"], 0.8)
+                trail["points"] = ghost_points
+
+            alpha = trail["life"] * inv_life
+            ghost_color = (int(dash_r * alpha), int(dash_g * alpha), int(dash_b * alpha))
             pygame.draw.polygon(surface, ghost_color, ghost_points, 1)
 
     def draw_finisher_aura(
@@ -501,14 +615,22 @@ class DrawingSystem:
         pulse = self._calculate_pulse(ship.aura_pulse, 1.0, 0.3, 0.7)
         scale_factor = self.get_scale_factor()
 
+        # All eight glows are identical, so render one sprite and blit it eight times
+        sprite = self.glow_sprite(10 * scale_factor, Cfg.colors["gold"], pulse)
+        if sprite is None:
+            return
+
+        half = sprite.get_width() // 2
+        rotation = game_state["effects"]["aura_rotation"]
+        radius = (self._scaled(Cfg.ship_radius) + 15 * scale_factor) * pulse
+        blit_list: List[Tuple[pygame.Surface, Union[Tuple[int, int], pygame.Rect]]] = []
         for i in range(8):
-            angle = game_state["effects"]["aura_rotation"] + i * 45
-            sin_a, cos_a = self._get_sin_cos(angle)
-            radius = (self._scaled(Cfg.ship_radius) + 15 * scale_factor) * pulse
+            sin_a, cos_a = self._get_sin_cos(rotation + i * 45)
             px = ship.x + cos_a * radius
             py = ship.y + sin_a * radius
+            blit_list.append((sprite, (int(px - half), int(py - half))))
 
-            self.glow(surface, (px, py), 10 * scale_factor, Cfg.colors["gold"], pulse)
+        surface.blits(blit_list, doreturn=False)
 
     def draw_powerup_flash(self, surface: pygame.Surface, ship: ShipState) -> None:
         """Draw powerup collection flash effect.
@@ -575,8 +697,14 @@ class DrawingSystem:
 
         scale_factor = self.get_scale_factor()
         sin_a, cos_a = self._get_sin_cos(ship.angle)
+        sin_left, cos_left = self._get_sin_cos(ship.angle + Cfg.ship_flame_angle)
+        sin_right, cos_right = self._get_sin_cos(ship.angle - Cfg.ship_flame_angle)
+
+        back_indent = self._scaled(Cfg.ship_back_indent)
+        base_x = ship.x - back_indent * cos_a
+        base_y = ship.y - back_indent * sin_a
 
-        flame_length = self._scaled(Cfg.ship_back_indent) + random.randint(
+        flame_length = back_indent + random.randint(
             int(Cfg.flame_length_min * scale_factor), int(Cfg.flame_length_max * scale_factor)
         )
         flame_width = random.randint(
@@ -584,35 +712,15 @@ class DrawingSystem:
         )
 
         flame_tip = (ship.x - flame_length * cos_a, ship.y - flame_length * sin_a)
-
-        sin_flame_left, cos_flame_left = self._get_sin_cos(ship.angle + Cfg.ship_flame_angle)
-        sin_flame_right, cos_flame_right = self._get_sin_cos(ship.angle - Cfg.ship_flame_angle)
-
-        flame_base_left = (
-            ship.x - self._scaled(Cfg.ship_back_indent) * cos_a + flame_width * cos_flame_left,
-            ship.y - self._scaled(Cfg.ship_back_indent) * sin_a + flame_width * sin_flame_left,
-        )
-
-        flame_base_right = (
-            ship.x - self._scaled(Cfg.ship_back_indent) * cos_a + flame_width * cos_flame_right,
-            ship.y - self._scaled(Cfg.ship_back_indent) * sin_a + flame_width * sin_flame_right,
-        )
-
+        flame_base_left = (base_x + flame_width * cos_left, base_y + flame_width * sin_left)
+        flame_base_right = (base_x + flame_width * cos_right, base_y + flame_width * sin_right)
         pygame.draw.polygon(surface, (255, 100, 0), [flame_tip, flame_base_left, flame_base_right])
 
-        inner_flame_tip = (
-            ship.x - (flame_length * 0.7) * cos_a,
-            ship.y - (flame_length * 0.7) * sin_a,
-        )
+        inner_length = flame_length * 0.7
         inner_width = flame_width * 0.6
-        inner_base_left = (
-            ship.x - self._scaled(Cfg.ship_back_indent) * cos_a + inner_width * cos_flame_left,
-            ship.y - self._scaled(Cfg.ship_back_indent) * sin_a + inner_width * sin_flame_left,
-        )
-        inner_base_right = (
-            ship.x - self._scaled(Cfg.ship_back_indent) * cos_a + inner_width * cos_flame_right,
-            ship.y - self._scaled(Cfg.ship_back_indent) * sin_a + inner_width * sin_flame_right,
-        )
+        inner_flame_tip = (ship.x - inner_length * cos_a, ship.y - inner_length * sin_a)
+        inner_base_left = (base_x + inner_width * cos_left, base_y + inner_width * sin_left)
+        inner_base_right = (base_x + inner_width * cos_right, base_y + inner_width * sin_right)
         pygame.draw.polygon(
             surface, (255, 255, 150), [inner_flame_tip, inner_base_left, inner_base_right]
         )
@@ -628,31 +736,33 @@ class DrawingSystem:
             game_state: Current game state
         """
         scale_factor = self.get_scale_factor()
+        rotation = game_state["effects"]["aura_rotation"]
 
         if ship.rapid_fire > 0:
             pulse = self._calculate_pulse(ship.aura_pulse, 1.0, 0.3, 0.7)
             radius = int(35 * pulse * scale_factor)
 
+            # Triangle centers and triangle corners share the same three 120-degree directions
+            directions = [self._get_sin_cos(rotation + i * 120) for i in range(3)]
+            triangle_size = 5 * scale_factor
+            corners = [(cos_t * triangle_size, sin_t * triangle_size) for sin_t, cos_t in directions]
+
             for i in range(3):
-                angle = game_state["effects"]["aura_rotation"] + i * 120
-                sin_a, cos_a = self._get_sin_cos(angle)
+                sin_a, cos_a = directions[i]
                 x = ship.x + cos_a * radius
                 y = ship.y + sin_a * radius
-
-                triangle_size = 5 * scale_factor
-                points = []
-                for j in range(3):
-                    t_angle = angle + j * 120
-                    t_sin, t_cos = self._get_sin_cos(t_angle)
-                    points.append((x + t_cos * triangle_size, y + t_sin * triangle_size))
+                points = [
+                    (x + corners[(i + j) % 3][0], y + corners[(i + j) % 3][1]) for j in range(3)
+                ]
                 pygame.draw.polygon(surface, (255, 100, 0), points, 1)
 
         if ship.triple_shot > 0:
             pulse = self._calculate_pulse(ship.aura_pulse * 0.8, 1.0, 0.3, 0.7)
             radius = int(40 * pulse * scale_factor)
 
+            counter_rotation = rotation * -1.5
             for i in range(3):
-                angle = game_state["effects"]["aura_rotation"] * -1.5 + i * 120
+                angle = counter_rotation + i * 120
                 sin_a, cos_a = self._get_sin_cos(angle)
                 x = ship.x + cos_a * radius
                 y = ship.y + sin_a * radius
@@ -768,7 +878,7 @@ class DrawingSystem:
             surface: Surface to draw on
             particle_pool: Particle pool containing particles to draw
         """
-        for particle in particle_pool.get_active_particles():
+        for particle in particle_pool.iter_active():
             life_ratio = max(0, min(1, particle.life / Cfg.particle_base_life))
 
             particle_type = particle.type
@@ -76,11 +76,20 @@ import random
 import sys
 import json
 import os
+import bisect
+from collections import defaultdict, deque
 from enum import Enum, auto
-from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Any, Union, Protocol, Callable, TypeVar, Generic
 from dataclasses import dataclass, field
 
+# Try to import numpy for batched particle generation
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Import sound system
 import sound_system
 from sound_system import (
@@ -131,6 +140,60 @@ from drawing_system import DrawingSystem
 g_screen_width: int = 800
 g_screen_height: int = 600
 g_scale_factor: float = 1.0
+g_inv_screen_diagonal: float = 1.0 / 1000.0  # 1 / sqrt(w^2 + h^2), refreshed on resize
+g_area_factor: float = 1.0  # min(2, sqrt(play area / reference area)), refreshed on resize
+g_powerup_lifetime: int = Cfg.powerup_lifetime  # Area-scaled powerup lifetime, refreshed on resize
+
+# Gameplay Cfg values used every frame, pre-multiplied by g_scale_factor on resize
+# (g_scaled_cfg["bullet_radius"] == scaled(Cfg.bullet_radius))
+SCALED_CFG_KEYS: Tuple[str, ...] = (
+    "ship_radius",
+    "ship_max_speed",
+    "ship_nose_length",
+    "max_screen_shake",
+    "enemy_speed",
+    "enemy_radius",
+    "bullet_radius",
+    "bullet_speed",
+    "asteroid_collision_margin",
+    "powerup_visual_radius",
+    "powerup_pickup_radius",
+    "floating_text_spread",
+    "floating_text_speed",
+)
+g_scaled_cfg: Dict[str, float] = {key: float(getattr(Cfg, key)) for key in SCALED_CFG_KEYS}
+
+# HUD layout Cfg values, pre-scaled on resize: floats in g_ui_scaled, truncated pixels in g_ui_px
+# (g_ui_px["ui_margin"] == int(scaled(Cfg.ui_margin)))
+UI_SCALED_CFG_KEYS: Tuple[str, ...] = (
+    "ui_margin",
+    "ui_element_spacing",
+    "ui_high_score_y_offset",
+    "ui_combo_pip_spacing",
+    "ui_combo_pip_radius",
+    "ui_combo_pip_y_offset",
+    "ui_dash_bar_width",
+    "ui_dash_bar_height",
+    "ui_finisher_bar_width",
+    "ui_finisher_bar_height",
+    "ui_sound_status_y_offset",
+    "ui_powerup_indicator_y_base",
+    "ui_powerup_indicator_spacing",
+    "ui_upgrade_menu_y_start",
+    "ui_upgrade_menu_item_height",
+    "ui_game_over_y_offset",
+    "ui_pause_menu_y_start",
+    "ui_pause_menu_line_spacing",
+    "ui_pause_menu_achievement_offset",
+)
+g_ui_scaled: Dict[str, float] = {key: float(getattr(Cfg, key)) for key in UI_SCALED_CFG_KEYS}
+g_ui_px: Dict[str, int] = {key: int(getattr(Cfg, key)) for key in UI_SCALED_CFG_KEYS}
+
+# HUD bar rects: x/width/height are set on resize, y and fill width per frame
+g_dash_bar_rect = pygame.Rect(0, 0, 0, 0)
+g_dash_fill_rect = pygame.Rect(0, 0, 0, 0)
+g_finisher_bar_rect = pygame.Rect(0, 0, 0, 0)
+g_finisher_fill_rect = pygame.Rect(0, 0, 0, 0)
 
 # Pygame objects
 g_screen: Optional[pygame.Surface] = None
@@ -190,10 +253,13 @@ g_game_state = {
         "execution_timer": 0,
         "phase": FinisherPhase.IDLE,
         "target": None,
+        "target_index": -1,
+        "damage_frames": (),
         "shockwave_radius": 0,
         "lock_on_progress": 0.0,
         "impact_x": 0,
         "impact_y": 0,
+        "cached_target": None,  # Dash-line target, refreshed once per update_game_state
     },
     # Level state
     "untouchable_level": True,
@@ -213,6 +279,9 @@ g_floating_texts: List[FloatingText] = []
 g_enemies: List[Enemy] = []
 g_enemy_bullets: List[Bullet] = []
 
+# Vectorized random source for large particle bursts (None without numpy)
+g_rng: Optional[Any] = np.random.default_rng() if NUMPY_AVAILABLE else None
+
 # Visual effects are now in visual_effects module
 
 # Sounds are imported from sound_system module
@@ -232,9 +301,15 @@ def scaled(value: float) -> float:
     return value * g_scale_factor
 
 
-@lru_cache(maxsize=3600)
+# Sin/cos lookup tables at 0.1 degree resolution, indexed by round(angle * 10) % SIN_COS_STEPS.
+# Hot creation paths index these directly instead of calling get_sin_cos.
+SIN_COS_STEPS = 3600
+SIN_TABLE: Tuple[float, ...] = tuple(math.sin(math.radians(i / 10)) for i in range(SIN_COS_STEPS))
+COS_TABLE: Tuple[float, ...] = tuple(math.cos(math.radians(i / 10)) for i in range(SIN_COS_STEPS))
+
+
 def get_sin_cos(angle: float) -> Tuple[float, float]:
-    """Get cached sin/cos values for an angle with 0.1 degree precision.
+    """Get tabulated sin/cos values for an angle with 0.1 degree precision.
 
     Args:
         angle: Angle in degrees
@@ -242,9 +317,8 @@ def get_sin_cos(angle: float) -> Tuple[float, float]:
     Returns:
         Tuple of (sin, cos) values
     """
-    angle = round(angle, 1) % 360
-    rad = math.radians(angle)
-    return (math.sin(rad), math.cos(rad))
+    idx = round(angle * 10) % SIN_COS_STEPS
+    return (SIN_TABLE[idx], COS_TABLE[idx])
 
 
 def wrap_position(entity: Union[Dict[str, Any], ShipState, Asteroid, Enemy, PowerUp]) -> None:
@@ -287,6 +361,99 @@ def distance_squared(obj1: Any, obj2: Any) -> float:
     return dx * dx + dy * dy
 
 
+def distance_squared_xy(x: float, y: float, obj: Any) -> float:
+    """Calculate squared distance from a raw point to an object.
+
+    Avoids wrapping the point in a temporary dict for distance_squared.
+
+    Args:
+        x: Point X coordinate
+        y: Point Y coordinate
+        obj: Object with x/y attributes
+
+    Returns:
+        Squared distance between point and object
+    """
+    dx = x - obj.x
+    dy = y - obj.y
+    return dx * dx + dy * dy
+
+
+def build_spatial_hash(entities: List[Any], cell_size: float) -> Dict[Tuple[int, int], List[int]]:
+    """Bucket entity indices into a uniform grid for broad-phase collision checks.
+
+    Args:
+        entities: Objects with x/y attributes
+        cell_size: Grid cell edge length; must be at least the largest collision distance
+
+    Returns:
+        Dictionary mapping (cell_x, cell_y) to indices into entities
+    """
+    grid: Dict[Tuple[int, int], List[int]] = {}
+    for i, entity in enumerate(entities):
+        key = (int(entity.x // cell_size), int(entity.y // cell_size))
+        bucket = grid.get(key)
+        if bucket is None:
+            grid[key] = [i]
+        else:
+            bucket.append(i)
+    return grid
+
+
+def query_spatial_hash(
+    grid: Dict[Tuple[int, int], List[int]], x: float, y: float, cell_size: float
+) -> List[int]:
+    """Get candidate indices from the 3x3 block of cells around a point.
+
+    Args:
+        grid: Grid built by build_spatial_hash with the same cell_size
+        x: Query X position
+        y: Query Y position
+        cell_size: Grid cell edge length
+
+    Returns:
+        Indices of entities that may be within cell_size of the point
+    """
+    cx = int(x // cell_size)
+    cy = int(y // cell_size)
+    candidates: List[int] = []
+    for gx in (cx - 1, cx, cx + 1):
+        for gy in (cy - 1, cy, cy + 1):
+            bucket = grid.get((gx, gy))
+            if bucket:
+                candidates.extend(bucket)
+    return candidates
+
+
+def find_bullet_hits_vectorized(
+    bullets: List[Bullet], targets: List[Any], bullet_radius: float, margin: float = 0.0
+) -> List[List[int]]:
+    """Find every overlapping bullet/target pair with one numpy broadcast.
+
+    Requires numpy (check NUMPY_AVAILABLE first).
+
+    Args:
+        bullets: Bullets to test
+        targets: Objects with x/y/radius attributes
+        bullet_radius: Scaled bullet radius
+        margin: Extra reach added to each target radius
+
+    Returns:
+        [bullet_index, target_index] pairs ordered by bullet, then target
+    """
+    bullet_count = len(bullets)
+    target_count = len(targets)
+    bx = np.fromiter((b.x for b in bullets), float, bullet_count)
+    by = np.fromiter((b.y for b in bullets), float, bullet_count)
+    tx = np.fromiter((t.x for t in targets), float, target_count)
+    ty = np.fromiter((t.y for t in targets), float, target_count)
+    reach = np.fromiter((t.radius for t in targets), float, target_count) + (bullet_radius + margin)
+
+    dx = bx[:, None] - tx[None, :]
+    dy = by[:, None] - ty[None, :]
+    return np.argwhere(dx * dx + dy * dy < reach * reach).tolist()
+
+
 def check_collision(obj1: Any, obj2: Any, r1: float, r2: float) -> bool:
     """Check if two circular objects are colliding.
 
@@ -324,8 +491,8 @@ def get_ship_points(
 
     return [
         (
-            x + scaled(Cfg.ship_nose_length) * cos_a * scale_mult,
-            y + scaled(Cfg.ship_nose_length) * sin_a * scale_mult,
+            x + g_scaled_cfg["ship_nose_length"] * cos_a * scale_mult,
+            y + g_scaled_cfg["ship_nose_length"] * sin_a * scale_mult,
         ),
         (
             x + scaled(Cfg.ship_wing_length) * cos_wing_left * scale_mult,
@@ -429,6 +596,7 @@ class TextCache:
         self.cache: Dict[Tuple[str, int, Tuple[int, int, int]], Tuple[pygame.Surface, int]] = {}
         self.frame_count: int = 0
         self.max_age: int = 300
+        self.max_entries: int = 512
 
     def get_text(
         self, text: str, font: pygame.font.Font, color: Tuple[int, int, int]
@@ -442,14 +610,22 @@ class TextCache:
 
         Returns:
             Rendered text surface
+
+        Side effects:
+            Evicts the least recently used entry when the cache is full
         """
         key = (text, id(font), color)
 
-        if key in self.cache:
-            surface, _ = self.cache[key]
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            # Re-inserting keeps the dict in least-to-most recently used order
+            surface = entry[0]
             self.cache[key] = (surface, self.frame_count)
             return surface
 
+        if len(self.cache) >= self.max_entries:
+            del self.cache[next(iter(self.cache))]
+
         surface = font.render(text, True, color)
         self.cache[key] = (surface, self.frame_count)
         return surface
@@ -814,6 +990,11 @@ def create_game_context() -> GameContext:
 # Wrapper functions to maintain compatibility during migration
 def check_achievement_wrapper(achievement_id: str) -> bool:
     """Wrapper for check_achievement during migration."""
+    # Most calls come from per-kill paths for achievements that are long unlocked;
+    # skip building a GameContext for those
+    if achievement_id in g_game_state["achievements_unlocked"]:
+        return False
+
     ctx = create_game_context()
     return g_progression.check_achievement(achievement_id, ctx)
 
@@ -887,7 +1068,11 @@ def init_ship_state() -> ShipState:
         Writes to g_ship, reads g_screen_width/height
     """
     global g_ship
-    g_ship = ShipState(x=g_screen_width // 2, y=g_screen_height // 2)
+    g_ship = ShipState(
+        x=g_screen_width // 2,
+        y=g_screen_height // 2,
+        dash_trail=deque(maxlen=Cfg.dash_trail_max_length),
+    )
     return g_ship
 
 
@@ -895,15 +1080,37 @@ def update_scaled_values() -> None:
     """Update all scale-dependent values when resolution changes.
 
     Side effects:
-        Updates g_scale_factor, fonts, clears text cache
+        Updates g_scale_factor, cached screen-size values, fonts, clears text cache
 
     Globals:
-        Writes to g_scale_factor, g_font, g_big_font, g_small_font, g_tiny_font
-        Reads g_screen_height
+        Writes to g_scale_factor, g_inv_screen_diagonal, g_area_factor, g_powerup_lifetime,
+        g_scaled_cfg, g_ui_scaled, g_ui_px, g_dash_bar_rect, g_dash_fill_rect,
+        g_finisher_bar_rect, g_finisher_fill_rect, g_font, g_big_font, g_small_font, g_tiny_font
+        Reads g_screen_width, g_screen_height
     """
     global g_scale_factor, g_font, g_big_font, g_small_font, g_tiny_font, g_drawing
+    global g_inv_screen_diagonal, g_area_factor, g_powerup_lifetime
 
     g_scale_factor = min(2.0, g_screen_height / Cfg.reference_height)
+    for key in SCALED_CFG_KEYS:
+        g_scaled_cfg[key] = getattr(Cfg, key) * g_scale_factor
+    for key in UI_SCALED_CFG_KEYS:
+        g_ui_scaled[key] = getattr(Cfg, key) * g_scale_factor
+        g_ui_px[key] = int(g_ui_scaled[key])
+    g_dash_bar_rect.update(g_ui_px["ui_margin"], 0, g_ui_px["ui_dash_bar_width"], g_ui_px["ui_dash_bar_height"])
+    g_dash_fill_rect.update(g_dash_bar_rect)
+    g_finisher_bar_rect.update(
+        g_ui_px["ui_margin"], 0, g_ui_px["ui_finisher_bar_width"], g_ui_px["ui_finisher_bar_height"]
+    )
+    g_finisher_fill_rect.update(g_finisher_bar_rect)
+    g_inv_screen_diagonal = 1.0 / math.sqrt(g_screen_width**2 + g_screen_height**2)
+
+    # Play-area scaling used by particle counts and powerup lifetime
+    area_multiplier = (g_screen_width * g_screen_height) / (Cfg.screen_width * Cfg.screen_height)
+    g_area_factor = min(2.0, math.sqrt(area_multiplier))
+    g_powerup_lifetime = int(
+        Cfg.powerup_lifetime * (1 + (area_multiplier - 1) * Cfg.powerup_area_scaling_factor)
+    )
 
     if pygame.font and pygame.font.get_init():
         g_font = pygame.font.Font(None, int(36 * g_scale_factor))
@@ -976,6 +1183,19 @@ def check_controller_connection() -> None:
         pass
 
 
+# Input returned while no controller is usable; shared across frames, callers only read it
+NO_CONTROLLER_INPUT: Dict[str, Any] = {
+    "turn": 0,
+    "thrust": False,
+    "reverse": False,
+    "shoot": False,
+    "dash": False,
+}
+
+# Keyboard state rendered while paused or in a menu; every key reads as released
+NO_KEYS_PRESSED: Dict[int, bool] = defaultdict(bool)
+
+
 def get_controller_input() -> Dict[str, Any]:
     """Get current controller input state.
 
@@ -986,7 +1206,7 @@ def get_controller_input() -> Dict[str, Any]:
         Reads g_controller_connected, g_controller
     """
     if not g_controller_connected or not g_controller:
-        return {"turn": 0, "thrust": False, "reverse": False, "shoot": False, "dash": False}
+        return NO_CONTROLLER_INPUT
 
     try:
         turn = 0
@@ -1025,7 +1245,7 @@ def get_controller_input() -> Dict[str, Any]:
         }
     except pygame.error:
         check_controller_connection()
-        return {"turn": 0, "thrust": False, "reverse": False, "shoot": False, "dash": False}
+        return NO_CONTROLLER_INPUT
 
 
 # === [WINDOW MANAGEMENT] ===
@@ -1040,10 +1260,10 @@ def handle_resize(new_width: int, new_height: int) -> None:
 
     Side effects:
         Updates g_screen, g_screen_width, g_screen_height, calls update_scaled_values(),
-        create_vignette(), create_starfield(), clears particles
+        create_vignette(), create_starfield(), clears particles and cached overlay surfaces
 
     Globals:
-        Writes to g_screen, g_screen_width, g_screen_height
+        Writes to g_screen, g_screen_width, g_screen_height, g_overlay_surfaces
     """
     global g_screen, g_screen_width, g_screen_height
 
@@ -1059,15 +1279,34 @@ def handle_resize(new_width: int, new_height: int) -> None:
         "screen_width": g_screen_width,
         "screen_height": g_screen_height,
         "scale_factor": g_scale_factor,
+        "rng": g_rng,
     }
     vfx.init_visual_effects(ctx)
 
     g_particle_pool.clear()
+    g_overlay_surfaces.clear()
     g_game_state["effects"]["level_transition"] = 0
 
 
 # === [OBJECT CREATION] ===
 
+# Random powerup drop table: one uniform draw is bisected into the cumulative
+# weights. Crystal first, then the four regular types sharing the remaining
+# drop chance equally, and None (no drop) for the rest of [0, 1).
+_RANDOM_POWERUP_TYPES: Tuple[Optional[PowerUpType], ...] = (
+    PowerUpType.CRYSTAL,
+    PowerUpType.RAPID,
+    PowerUpType.TRIPLE,
+    PowerUpType.SHIELD,
+    PowerUpType.LIFE,
+    None,
+)
+_RANDOM_POWERUP_CUMULATIVE: Tuple[float, ...] = tuple(
+    Cfg.powerup_crystal_chance
+    + (1.0 - Cfg.powerup_crystal_chance) * Cfg.powerup_drop_chance * i / 4
+    for i in range(5)
+)
+
 
 def create_asteroid(
     x: Optional[float] = None,
@@ -1176,7 +1415,7 @@ def create_enemy(x: Optional[float] = None, y: Optional[float] = None) -> Enemy:
                 if y is None:
                     y = random.choice([margin, g_screen_height - margin])
 
-            if g_ship and distance_squared({"x": x, "y": y}, g_ship) >= min_spawn_distance**2:
+            if g_ship and distance_squared_xy(x, y, g_ship) >= min_spawn_distance**2:
                 break
             attempts += 1
 
@@ -1196,7 +1435,7 @@ def create_enemy(x: Optional[float] = None, y: Optional[float] = None) -> Enemy:
         max_health=Cfg.enemy_health,
         ai_type=random.choice(list(EnemyAIType)),
         orbit_angle=random.uniform(0, 360),
-        radius=scaled(Cfg.enemy_radius),
+        radius=g_scaled_cfg["enemy_radius"],
     )
 
 
@@ -1212,26 +1451,14 @@ def create_powerup(x: float, y: float, force_type: Optional[PowerUpType] = None)
         Appends to global g_powerups list
 
     Globals:
-        Writes to g_powerups, reads g_screen_width/height, g_scale_factor
+        Writes to g_powerups, reads g_powerup_lifetime, g_scale_factor
     """
-    if force_type == PowerUpType.CRYSTAL or (
-        force_type is None and random.random() < Cfg.powerup_crystal_chance
-    ):
-        powerup_type = PowerUpType.CRYSTAL
-    elif force_type:
+    if force_type:
         powerup_type = force_type
-    elif random.random() < Cfg.powerup_drop_chance:
-        powerup_type = random.choice(
-            [PowerUpType.RAPID, PowerUpType.TRIPLE, PowerUpType.SHIELD, PowerUpType.LIFE]
-        )
     else:
-        return
-
-    # Scale powerup lifetime based on play area
-    area_multiplier = (g_screen_width * g_screen_height) / (Cfg.screen_width * Cfg.screen_height)
-    lifetime = int(
-        Cfg.powerup_lifetime * (1 + (area_multiplier - 1) * Cfg.powerup_area_scaling_factor)
-    )
+        powerup_type = _RANDOM_POWERUP_TYPES[bisect.bisect_right(_RANDOM_POWERUP_CUMULATIVE, random.random())]
+        if powerup_type is None:
+            return
 
     g_powerups.append(
         PowerUp(
@@ -1240,7 +1467,7 @@ def create_powerup(x: float, y: float, force_type: Optional[PowerUpType] = None)
             vx=random.uniform(-1, 1) * g_scale_factor,
             vy=random.uniform(-1, 1) * g_scale_factor,
             type=powerup_type,
-            lifetime=lifetime,
+            lifetime=g_powerup_lifetime,
         )
     )
 
@@ -1269,20 +1496,43 @@ def create_particles(x: float, y: float, config: Dict[str, Any]) -> None:
     life_variance = config.get("life_variance", Cfg.particle_life_variance)
     particle_type = config.get("type", None)
 
-    for _ in range(count):
-        speed = random.uniform(*speed_range) * g_scale_factor
-        angle = random.uniform(0, 360)
-        sin_a, cos_a = get_sin_cos(angle)
+    # Skip random/trig work for particles the pool cannot supply
+    count = min(count, g_particle_pool.free_count())
+    if count <= 0:
+        return
 
-        particle = g_particle_pool.get()
-        if particle:
+    # --- [Batched path: draw all random values in a few vectorized calls] ---
+    if NUMPY_AVAILABLE and count >= Cfg.particle_batch_threshold:
+        speeds = g_rng.uniform(speed_range[0], speed_range[1], count) * g_scale_factor
+        radians = g_rng.uniform(0.0, 2 * math.pi, count)
+        vxs = (speeds * np.cos(radians)).tolist()
+        vys = (speeds * np.sin(radians)).tolist()
+        lives = (life_base + g_rng.integers(0, life_variance + 1, count)).tolist()
+
+        for particle, vx, vy, life in zip(g_particle_pool.get_many(count), vxs, vys, lives):
             particle.x = x
             particle.y = y
-            particle.vx = speed * cos_a
-            particle.vy = speed * sin_a
-            particle.life = life_base + random.randint(0, life_variance)
+            particle.vx = vx
+            particle.vy = vy
+            particle.life = life
             particle.color = color_base
             particle.type = particle_type
+        return
+
+    for _ in range(count):
+        particle = g_particle_pool.get()
+        if not particle:
+            break
+
+        speed = random.uniform(*speed_range) * g_scale_factor
+        idx = int(random.random() * SIN_COS_STEPS)
+        particle.x = x
+        particle.y = y
+        particle.vx = speed * COS_TABLE[idx]
+        particle.vy = speed * SIN_TABLE[idx]
+        particle.life = life_base + random.randint(0, life_variance)
+        particle.color = color_base
+        particle.type = particle_type
 
 
 def create_explosion(
@@ -1305,11 +1555,12 @@ def create_explosion(
         Adds screen shake, plays sound, creates particles
 
     Globals:
-        Writes to g_game_state['effects']['screen_shake'], reads g_ship, g_screen_width/height
+        Writes to g_game_state['effects']['screen_shake'], reads g_ship, g_inv_screen_diagonal,
+        g_area_factor
     """
     shake_amount = count // 5
     g_game_state["effects"]["screen_shake"] = min(
-        g_game_state["effects"]["screen_shake"] + shake_amount, scaled(Cfg.max_screen_shake)
+        g_game_state["effects"]["screen_shake"] + shake_amount, g_scaled_cfg["max_screen_shake"]
     )
 
     volume_scale = 1.0
@@ -1321,9 +1572,8 @@ def create_explosion(
         volume_scale = 1.3
 
     if g_ship:
-        distance = math.sqrt(distance_squared({"x": x, "y": y}, g_ship))
-        max_distance = math.sqrt(g_screen_width**2 + g_screen_height**2)
-        distance_factor = 1.0 - (distance / max_distance) * 0.3
+        distance = math.sqrt(distance_squared_xy(x, y, g_ship))
+        distance_factor = 1.0 - distance * g_inv_screen_diagonal * 0.3
         volume_scale *= distance_factor
 
     if is_enemy:
@@ -1335,10 +1585,7 @@ def create_explosion(
     else:
         play_sound("explosion_large", x, volume_scale)
 
-    area_factor = min(
-        2.0, math.sqrt((g_screen_width * g_screen_height) / (Cfg.screen_width * Cfg.screen_height))
-    )
-    scaled_count = int(count * (0.7 + 0.3 * area_factor))
+    scaled_count = int(count * (0.7 + 0.3 * g_area_factor))
 
     create_particles(
         x,
@@ -1352,6 +1599,22 @@ def create_explosion(
     )
 
 
+# Fixed directions of the finisher shockwave ring, evenly spaced around the circle
+SHOCKWAVE_RING_SIN_COS: Tuple[Tuple[float, float], ...] = tuple(
+    (
+        math.sin(math.radians(i * 360 / Cfg.particle_shockwave_rings)),
+        math.cos(math.radians(i * 360 / Cfg.particle_shockwave_rings)),
+    )
+    for i in range(Cfg.particle_shockwave_rings)
+)
+
+# (unscaled speed, life, color) for each concentric finisher ring, innermost first
+FINISHER_RING_PROFILES: Tuple[Tuple[float, int, Tuple[int, int, int]], ...] = tuple(
+    (3 + ring * 2, 30 - ring * 5, Cfg.colors["gold"] if ring == 0 else (255, 200, 100))
+    for ring in range(Cfg.finisher_ring_count)
+)
+
+
 def create_finisher_explosion(x: float, y: float) -> None:
     """Create spectacular finisher explosion effect.
 
@@ -1365,46 +1628,61 @@ def create_finisher_explosion(x: float, y: float) -> None:
     Globals:
         Writes to g_particle_pool, reads g_scale_factor
     """
-    # Golden core explosion
-    for i in range(Cfg.finisher_particle_count):
-        speed = random.uniform(1, 15) * g_scale_factor
-        angle = random.uniform(0, 360)
-        sin_a, cos_a = get_sin_cos(angle)
-
+    # Golden core explosion (only as many particles as the pool can supply)
+    count = min(Cfg.finisher_particle_count, g_particle_pool.free_count())
+    if NUMPY_AVAILABLE:
+        # Draw every speed, angle, life, and color channel up front
+        speeds = g_rng.uniform(1, 15, count) * g_scale_factor * 0.5
+        radians = g_rng.uniform(0.0, 2 * math.pi, count)
+        vxs = (speeds * np.cos(radians)).tolist()
+        vys = (speeds * np.sin(radians)).tolist()
+        lives = (Cfg.particle_base_life + g_rng.integers(10, 41, count)).tolist()
+        greens = g_rng.integers(150, 216, count).tolist()
+        blues = g_rng.integers(200, 256, count).tolist()
+    else:
+        vxs, vys, lives, greens, blues = [], [], [], [], []
+        for _ in range(count):
+            speed = random.uniform(1, 15) * g_scale_factor * 0.5
+            sin_a, cos_a = get_sin_cos(random.uniform(0, 360))
+            vxs.append(speed * cos_a)
+            vys.append(speed * sin_a)
+            lives.append(Cfg.particle_base_life + random.randint(10, 40))
+            greens.append(random.randint(150, 215))
+            blues.append(random.randint(200, 255))
+
+    for i, particle in enumerate(g_particle_pool.get_many(count)):
         if i < Cfg.finisher_core_particles:
             color = Cfg.colors["gold"]
         elif i < Cfg.finisher_mid_particles:
-            color = (255, random.randint(150, 215), 0)
+            color = (255, greens[i], 0)
         else:
-            color = (255, 255, random.randint(200, 255))
+            color = (255, 255, blues[i])
 
-        particle = g_particle_pool.get()
-        if particle:
+        particle.x = x
+        particle.y = y
+        particle.vx = vxs[i]
+        particle.vy = vys[i]
+        particle.life = lives[i]
+        particle.color = color
+        particle.type = ParticleType.FINISHER
+
+    # Shockwave ring particles
+    if not g_particle_pool.free_count():
+        return
+    rings = [(speed * g_scale_factor, life, color) for speed, life, color in FINISHER_RING_PROFILES]
+    for sin_a, cos_a in SHOCKWAVE_RING_SIN_COS:
+        for speed, life, color in rings:
+            particle = g_particle_pool.get()
+            if not particle:
+                return
             particle.x = x
             particle.y = y
-            particle.vx = speed * cos_a * 0.5
-            particle.vy = speed * sin_a * 0.5
-            particle.life = Cfg.particle_base_life + random.randint(10, 40)
+            particle.vx = cos_a * speed
+            particle.vy = sin_a * speed
+            particle.life = life
             particle.color = color
             particle.type = ParticleType.FINISHER
 
-    # Shockwave ring particles
-    for i in range(Cfg.particle_shockwave_rings):
-        angle = i * (360 / Cfg.particle_shockwave_rings)
-        sin_a, cos_a = get_sin_cos(angle)
-
-        for ring in range(Cfg.finisher_ring_count):
-            speed = (3 + ring * 2) * g_scale_factor
-            particle = g_particle_pool.get()
-            if particle:
-                particle.x = x
-                particle.y = y
-                particle.vx = cos_a * speed
-                particle.vy = sin_a * speed
-                particle.life = 30 - ring * 5
-                particle.color = Cfg.colors["gold"] if ring == 0 else (255, 200, 100)
-                particle.type = ParticleType.FINISHER
-
 
 def create_dash_trail() -> None:
     """Create trail particles when dashing.
@@ -1418,29 +1696,29 @@ def create_dash_trail() -> None:
     if g_ship.dashing <= 0:
         return
 
+    # Bounded deque drops the oldest entry itself once dash_trail_max_length is reached
     g_ship.dash_trail.append(
         {"x": g_ship.x, "y": g_ship.y, "angle": g_ship.angle, "life": Cfg.particle_dash_trail_life}
     )
 
-    if len(g_ship.dash_trail) > Cfg.dash_trail_max_length:
-        g_ship.dash_trail.pop(0)
+    sin_a, cos_a = get_sin_cos(g_ship.angle + 90)
 
     for _ in range(Cfg.dash_trail_particle_count):
+        particle = g_particle_pool.get()
+        if not particle:
+            break
+
         offset = (
             random.uniform(-Cfg.dash_trail_offset_range, Cfg.dash_trail_offset_range)
             * g_scale_factor
         )
-        sin_a, cos_a = get_sin_cos(g_ship.angle + 90)
-
-        particle = g_particle_pool.get()
-        if particle:
-            particle.x = g_ship.x + sin_a * offset
-            particle.y = g_ship.y + cos_a * offset
-            particle.vx = -g_ship.vel_x * 0.3 + random.uniform(-1, 1)
-            particle.vy = -g_ship.vel_y * 0.3 + random.uniform(-1, 1)
-            particle.life = 15
-            particle.color = Cfg.colors["dash"]
-            particle.type = ParticleType.DASH
+        particle.x = g_ship.x + sin_a * offset
+        particle.y = g_ship.y + cos_a * offset
+        particle.vx = -g_ship.vx * 0.3 + random.uniform(-1, 1)
+        particle.vy = -g_ship.vy * 0.3 + random.uniform(-1, 1)
+        particle.life = 15
+        particle.color = Cfg.colors["dash"]
+        particle.type = ParticleType.DASH
 
 
 def create_powerup_streak(
@@ -1463,7 +1741,7 @@ def create_powerup_streak(
         Creates particles
 
     Globals:
-        Writes to g_particle_pool, reads g_screen_width/height, g_scale_factor
+        Writes to g_particle_pool, reads g_area_factor, g_scale_factor
     """
     dx = target_x - powerup_x
     dy = target_y - powerup_y
@@ -1473,13 +1751,13 @@ def create_powerup_streak(
         dx /= distance
         dy /= distance
 
-        area_factor = min(
-            2.0,
-            math.sqrt((g_screen_width * g_screen_height) / (Cfg.screen_width * Cfg.screen_height)),
-        )
-        particle_count = int(15 * area_factor)
+        particle_count = int(15 * g_area_factor)
 
         for i in range(particle_count):
+            particle = g_particle_pool.get()
+            if not particle:
+                break
+
             progress = i / particle_count
             start_x = powerup_x + dx * distance * progress * 0.3
             start_y = powerup_y + dy * distance * progress * 0.3
@@ -1492,17 +1770,15 @@ def create_powerup_streak(
 
             speed = (3 + progress * 4) * g_scale_factor
 
-            particle = g_particle_pool.get()
-            if particle:
-                particle.x = start_x + random.uniform(-5, 5) * g_scale_factor
-                particle.y = start_y + random.uniform(-5, 5) * g_scale_factor
-                particle.vx = vel_x * speed
-                particle.vy = vel_y * speed
-                particle.life = 20 + i * 2
-                particle.color = color
-                particle.type = ParticleType.STREAK
-
-    burst_count = int(8 * min(2.0, area_factor))
+            particle.x = start_x + random.uniform(-5, 5) * g_scale_factor
+            particle.y = start_y + random.uniform(-5, 5) * g_scale_factor
+            particle.vx = vel_x * speed
+            particle.vy = vel_y * speed
+            particle.life = 20 + i * 2
+            particle.color = color
+            particle.type = ParticleType.STREAK
+
+    burst_count = int(8 * g_area_factor)
     create_particles(
         powerup_x,
         powerup_y,
@@ -1526,28 +1802,38 @@ def create_thruster_particles() -> None:
     Globals:
         Reads g_ship, writes to g_particle_pool
     """
-    sin_a, cos_a = get_sin_cos(g_ship.angle)
-    base_x = g_ship.x - scaled(Cfg.ship_nose_length * 0.8) * cos_a
-    base_y = g_ship.y - scaled(Cfg.ship_nose_length * 0.8) * sin_a
+    if not g_particle_pool.free_count():
+        return
+
+    idx = round(g_ship.angle * 10) % SIN_COS_STEPS
+    sin_a = SIN_TABLE[idx]
+    cos_a = COS_TABLE[idx]
+    exhaust_offset = g_scaled_cfg["ship_nose_length"] * 0.8
+    base_x = g_ship.x - exhaust_offset * cos_a
+    base_y = g_ship.y - exhaust_offset * sin_a
+
+    # Jitter scales: a 16-bit field in [0, 65535] maps onto [-spread, +spread]
+    pos_step = 2 * Cfg.particle_thruster_spread / 65535.0
+    vel_step = 2 * Cfg.particle_thruster_velocity_spread / 65535.0
+    exhaust_vx = -cos_a * Cfg.particle_thruster_speed * g_scale_factor
+    exhaust_vy = -sin_a * Cfg.particle_thruster_speed * g_scale_factor
 
     for _ in range(Cfg.particle_thruster_count):
         particle = g_particle_pool.get()
-        if particle:
-            particle.x = base_x + random.randint(
-                -Cfg.particle_thruster_spread, Cfg.particle_thruster_spread
-            )
-            particle.y = base_y + random.randint(
-                -Cfg.particle_thruster_spread, Cfg.particle_thruster_spread
-            )
-            particle.vx = -cos_a * Cfg.particle_thruster_speed * g_scale_factor + random.uniform(
-                -Cfg.particle_thruster_velocity_spread, Cfg.particle_thruster_velocity_spread
-            )
-            particle.vy = -sin_a * Cfg.particle_thruster_speed * g_scale_factor + random.uniform(
-                -Cfg.particle_thruster_velocity_spread, Cfg.particle_thruster_velocity_spread
-            )
-            particle.life = 20
-            particle.color = (255, 200, 0)
-            particle.type = None
+        if not particle:
+            break
+
+        # One RNG call split into four 16-bit fields: x/y offset, vx/vy jitter
+        bits = random.getrandbits(64)
+        particle.x = base_x + (bits & 0xFFFF) * pos_step - Cfg.particle_thruster_spread
+        particle.y = base_y + ((bits >> 16) & 0xFFFF) * pos_step - Cfg.particle_thruster_spread
+        particle.vx = (
+            exhaust_vx + ((bits >> 32) & 0xFFFF) * vel_step - Cfg.particle_thruster_velocity_spread
+        )
+        particle.vy = exhaust_vy + (bits >> 48) * vel_step - Cfg.particle_thruster_velocity_spread
+        particle.life = 20
+        particle.color = (255, 200, 0)
+        particle.type = None
 
 
 def create_respawn_particles() -> None:
@@ -1561,6 +1847,10 @@ def create_respawn_particles() -> None:
     """
     # Inward spiral particles
     for _ in range(Cfg.particle_respawn_rate):
+        particle = g_particle_pool.get()
+        if not particle:
+            return
+
         angle = random.uniform(0, 360)
         distance = (
             random.uniform(Cfg.particle_respawn_spiral_min, Cfg.particle_respawn_spiral_max)
@@ -1568,15 +1858,13 @@ def create_respawn_particles() -> None:
         )
         sin_a, cos_a = get_sin_cos(angle)
 
-        particle = g_particle_pool.get()
-        if particle:
-            particle.x = g_ship.x + cos_a * distance
-            particle.y = g_ship.y + sin_a * distance
-            particle.vx = -cos_a * 2 * g_scale_factor + random.uniform(-0.5, 0.5)
-            particle.vy = -sin_a * 2 * g_scale_factor + random.uniform(-0.5, 0.5)
-            particle.life = 30
-            particle.color = Cfg.colors["blue_glow"]
-            particle.type = ParticleType.RESPAWN
+        particle.x = g_ship.x + cos_a * distance
+        particle.y = g_ship.y + sin_a * distance
+        particle.vx = -cos_a * 2 * g_scale_factor + random.uniform(-0.5, 0.5)
+        particle.vy = -sin_a * 2 * g_scale_factor + random.uniform(-0.5, 0.5)
+        particle.life = 30
+        particle.color = Cfg.colors["blue_glow"]
+        particle.type = ParticleType.RESPAWN
 
         # Occasional center sparkle
         if random.random() < Cfg.particle_respawn_center_chance:
@@ -1605,6 +1893,10 @@ def create_respawn_particles() -> None:
 
 # === [COMBAT MECHANICS] ===
 
+# Rotation of the side barrels for triple shot (sum-of-angles identity, no per-shot trig)
+TRIPLE_SHOT_SPREAD_SIN = math.sin(math.radians(Cfg.triple_shot_spread))
+TRIPLE_SHOT_SPREAD_COS = math.cos(math.radians(Cfg.triple_shot_spread))
+
 
 def shoot_bullet(
     is_enemy: bool = False, enemy_x: float = 0.0, enemy_y: float = 0.0, enemy_angle: float = 0.0
@@ -1630,19 +1922,25 @@ def shoot_bullet(
 
         g_enemy_bullets.append(
             Bullet(
-                x=enemy_x + scaled(Cfg.ship_nose_length) * cos_a,
-                y=enemy_y + scaled(Cfg.ship_nose_length) * sin_a,
-                vx=cos_a * scaled(Cfg.bullet_speed) * Cfg.enemy_bullet_speed_mult,
-                vy=sin_a * scaled(Cfg.bullet_speed) * Cfg.enemy_bullet_speed_mult,
+                x=enemy_x + g_scaled_cfg["ship_nose_length"] * cos_a,
+                y=enemy_y + g_scaled_cfg["ship_nose_length"] * sin_a,
+                vx=cos_a * g_scaled_cfg["bullet_speed"] * Cfg.enemy_bullet_speed_mult,
+                vy=sin_a * g_scaled_cfg["bullet_speed"] * Cfg.enemy_bullet_speed_mult,
                 life=Cfg.bullet_lifetime,
+                trail=deque(maxlen=Cfg.enemy_bullet_trail_length),
             )
         )
     else:
         play_sound("shoot", g_ship.x, 1.0, g_screen_width)
 
-        sin_a, cos_a = get_sin_cos(g_ship.angle)
-        flash_x = g_ship.x + scaled(Cfg.ship_nose_length) * cos_a
-        flash_y = g_ship.y + scaled(Cfg.ship_nose_length) * sin_a
+        idx = round(g_ship.angle * 10) % SIN_COS_STEPS
+        sin_a = SIN_TABLE[idx]
+        cos_a = COS_TABLE[idx]
+        scale = g_scale_factor
+        nose_length = g_scaled_cfg["ship_nose_length"]
+        bullet_speed = g_scaled_cfg["bullet_speed"]
+        flash_x = g_ship.x + nose_length * cos_a
+        flash_y = g_ship.y + nose_length * sin_a
 
         # Muzzle flash particles
         particle_count = (
@@ -1651,43 +1949,59 @@ def shoot_bullet(
             else Cfg.particle_muzzle_flash_base
         )
         for _ in range(particle_count):
-            angle = g_ship.angle + random.uniform(-15, 15)
-            sin_p, cos_p = get_sin_cos(angle)
+            idx = round((g_ship.angle + random.uniform(-15, 15)) * 10) % SIN_COS_STEPS
             particle = g_particle_pool.get()
             if particle:
                 particle.x = flash_x
                 particle.y = flash_y
-                particle.vx = cos_p * 3 * g_scale_factor + random.uniform(-1, 1)
-                particle.vy = sin_p * 3 * g_scale_factor + random.uniform(-1, 1)
+                particle.vx = COS_TABLE[idx] * 3 * scale + random.uniform(-1, 1)
+                particle.vy = SIN_TABLE[idx] * 3 * scale + random.uniform(-1, 1)
                 particle.life = 10
                 particle.color = (255, 255, 150) if g_ship.rapid_fire > 0 else (255, 200, 100)
                 particle.type = None
 
-        if g_ship.triple_shot > 0:
-            for angle_offset in [-Cfg.triple_shot_spread, 0, Cfg.triple_shot_spread]:
-                angle = g_ship.angle + angle_offset
-                sin_a, cos_a = get_sin_cos(angle)
+        # Center barrel (sin_a/cos_a still hold the ship heading)
+        center = Bullet(
+            x=g_ship.x + nose_length * cos_a,
+            y=g_ship.y + nose_length * sin_a,
+            vx=cos_a * bullet_speed,
+            vy=sin_a * bullet_speed,
+            life=Cfg.bullet_lifetime,
+            trail=deque(maxlen=Cfg.bullet_trail_length),
+        )
 
-                g_bullets.append(
+        if g_ship.triple_shot > 0:
+            # Left barrel: heading - spread
+            cos_l = cos_a * TRIPLE_SHOT_SPREAD_COS + sin_a * TRIPLE_SHOT_SPREAD_SIN
+            sin_l = sin_a * TRIPLE_SHOT_SPREAD_COS - cos_a * TRIPLE_SHOT_SPREAD_SIN
+            # Right barrel: heading + spread
+            cos_r = cos_a * TRIPLE_SHOT_SPREAD_COS - sin_a * TRIPLE_SHOT_SPREAD_SIN
+            sin_r = sin_a * TRIPLE_SHOT_SPREAD_COS + cos_a * TRIPLE_SHOT_SPREAD_SIN
+
+            # Whole volley lands in one extend
+            g_bullets.extend(
+                (
+                    center,
                     Bullet(
-                        x=g_ship.x + scaled(Cfg.ship_nose_length) * cos_a,
-                        y=g_ship.y + scaled(Cfg.ship_nose_length) * sin_a,
-                        vx=cos_a * scaled(Cfg.bullet_speed),
-                        vy=sin_a * scaled(Cfg.bullet_speed),
+                        x=g_ship.x + nose_length * cos_l,
+                        y=g_ship.y + nose_length * sin_l,
+                        vx=cos_l * bullet_speed,
+                        vy=sin_l * bullet_speed,
                         life=Cfg.bullet_lifetime,
-                    )
-                )
-        else:
-            sin_a, cos_a = get_sin_cos(g_ship.angle)
-            g_bullets.append(
-                Bullet(
-                    x=g_ship.x + scaled(Cfg.ship_nose_length) * cos_a,
-                    y=g_ship.y + scaled(Cfg.ship_nose_length) * sin_a,
-                    vx=cos_a * scaled(Cfg.bullet_speed),
-                    vy=sin_a * scaled(Cfg.bullet_speed),
-                    life=Cfg.bullet_lifetime,
+                        trail=deque(maxlen=Cfg.bullet_trail_length),
+                    ),
+                    Bullet(
+                        x=g_ship.x + nose_length * cos_r,
+                        y=g_ship.y + nose_length * sin_r,
+                        vx=cos_r * bullet_speed,
+                        vy=sin_r * bullet_speed,
+                        life=Cfg.bullet_lifetime,
+                        trail=deque(maxlen=Cfg.bullet_trail_length),
+                    ),
                 )
             )
+        else:
+            g_bullets.append(center)
 
         fire_rate_mult = get_fire_rate_multiplier_wrapper()
         base_rate = Cfg.rapid_fire_rate if g_ship.rapid_fire > 0 else Cfg.normal_fire_rate
@@ -1742,20 +2056,23 @@ def add_combo() -> None:
         ):
             combo["pulse"] = min(Cfg.combo_max_pulse, combo["current"] * 2)
             g_game_state["effects"]["screen_shake"] = min(
-                g_game_state["effects"]["screen_shake"] + 8, scaled(Cfg.max_screen_shake)
+                g_game_state["effects"]["screen_shake"] + 8, g_scaled_cfg["max_screen_shake"]
             )
             play_sound("powerup_life", g_ship.x, 0.8)
             create_floating_text(g_ship.x, g_ship.y + 20, "10TH KILL!", (255, 255, 100))
 
         elif combo["current"] in Cfg.combo_milestone_thresholds:
             g_game_state["effects"]["screen_shake"] = min(
-                g_game_state["effects"]["screen_shake"] + 5, scaled(Cfg.max_screen_shake)
+                g_game_state["effects"]["screen_shake"] + 5, g_scaled_cfg["max_screen_shake"]
             )
             play_sound("powerup_life", g_ship.x, 0.6)
 
 
 # === [FINISHER MECHANICS] ===
 
+# Fractions of the impact phase at which the shockwave deals damage
+FINISHER_DAMAGE_POINTS = (0.3, 0.6)
+
 
 def check_finisher_collision(ship_pos: ShipState, dash_angle: float) -> Optional[Enemy]:
     """Check if a dash would hit an enemy for finisher execution.
@@ -1771,7 +2088,7 @@ def check_finisher_collision(ship_pos: ShipState, dash_angle: float) -> Optional
         Reads g_enemies
     """
     sin_a, cos_a = get_sin_cos(dash_angle)
-    dash_distance = scaled(Cfg.ship_max_speed) * Cfg.dash_speed_multiplier * Cfg.dash_duration
+    dash_distance = g_scaled_cfg["ship_max_speed"] * Cfg.dash_speed_multiplier * Cfg.dash_duration
 
     start_x, start_y = ship_pos.x, ship_pos.y
     end_x = start_x + cos_a * dash_distance
@@ -1801,7 +2118,7 @@ def check_finisher_collision(ship_pos: ShipState, dash_angle: float) -> Optional
         dist_y = enemy.y - closest_y
         dist_sq = dist_x * dist_x + dist_y * dist_y
 
-        collision_radius = enemy.radius + scaled(Cfg.ship_radius)
+        collision_radius = enemy.radius + g_scaled_cfg["ship_radius"]
 
         if dist_sq <= collision_radius * collision_radius and t < min_t:
             min_t = t
@@ -1810,6 +2127,28 @@ def check_finisher_collision(ship_pos: ShipState, dash_angle: float) -> Optional
     return closest_enemy
 
 
+def find_enemy_index(enemy: Enemy, hint: int) -> int:
+    """Find an enemy's index in g_enemies, trying a cached index first.
+
+    Args:
+        enemy: Enemy to locate (compared by identity)
+        hint: Previously known index, or -1 if unknown
+
+    Returns:
+        Index of enemy in g_enemies, or -1 if it is no longer present
+
+    Globals:
+        Reads g_enemies
+    """
+    if 0 <= hint < len(g_enemies) and g_enemies[hint] is enemy:
+        return hint
+
+    for i, candidate in enumerate(g_enemies):
+        if candidate is enemy:
+            return i
+    return -1
+
+
 def start_finisher_execution(target: Enemy) -> None:
     """Begin finisher move execution sequence.
 
@@ -1829,17 +2168,23 @@ def start_finisher_execution(target: Enemy) -> None:
     finisher_state["phase"] = FinisherPhase.LOCK_ON
     finisher_state["execution_timer"] = Cfg.finisher_lock_on_time
     finisher_state["target"] = target
+    finisher_state["target_index"] = find_enemy_index(target, -1)
     finisher_state["lock_on_progress"] = 0.0
 
     dx = target.x - g_ship.x
     dy = target.y - g_ship.y
-    angle_to_target = math.degrees(math.atan2(dy, dx))
-    g_ship.angle = angle_to_target
+    g_ship.angle = math.degrees(math.atan2(dy, dx))
 
-    sin_a, cos_a = get_sin_cos(g_ship.angle)
-    dash_distance = scaled(Cfg.ship_max_speed) * Cfg.dash_speed_multiplier * Cfg.dash_duration
-    finisher_state["impact_x"] = g_ship.x + cos_a * dash_distance / 2
-    finisher_state["impact_y"] = g_ship.y + sin_a * dash_distance / 2
+    # Impact direction is the normalized target vector; no angle -> sin/cos round-trip needed
+    distance = math.hypot(dx, dy)
+    if distance > 0:
+        cos_a = dx / distance
+        sin_a = dy / distance
+    else:
+        sin_a, cos_a = get_sin_cos(g_ship.angle)
+    half_dash = g_scaled_cfg["ship_max_speed"] * Cfg.dash_speed_multiplier * Cfg.dash_duration / 2
+    finisher_state["impact_x"] = g_ship.x + cos_a * half_dash
+    finisher_state["impact_y"] = g_ship.y + sin_a * half_dash
 
     total_finisher_frames = (
         Cfg.finisher_lock_on_time
@@ -1899,8 +2244,14 @@ def update_finisher() -> None:
 
             g_game_state["time_scale"] = Cfg.finisher_time_scale
 
+            # Shockwave damage lands on two fixed frames of the impact phase
+            finisher_state["damage_frames"] = tuple(
+                int(Cfg.finisher_impact_time * (1.0 - point)) for point in FINISHER_DAMAGE_POINTS
+            )
+
             target = finisher_state["target"]
-            if target and target in g_enemies:
+            target_index = find_enemy_index(target, finisher_state["target_index"]) if target else -1
+            if target_index >= 0:
                 create_finisher_explosion(target.x, target.y)
                 create_floating_text(target.x, target.y - 30, "EXECUTED!", Cfg.colors["gold"])
 
@@ -1921,40 +2272,40 @@ def update_finisher() -> None:
 
                 g_game_state["combo"]["timer"] = Cfg.combo_timeout
 
-                g_enemies.remove(target)
+                # Swap-pop removal: enemy order is irrelevant, avoids a list shift
+                g_enemies[target_index] = g_enemies[-1]
+                g_enemies.pop()
 
         elif finisher_state["phase"] == FinisherPhase.IMPACT:
-            # Update shockwave
-            max_radius = Cfg.finisher_shockwave_radius * g_scale_factor
-            progress = 1.0 - (finisher_state["execution_timer"] / Cfg.finisher_impact_time)
-            finisher_state["shockwave_radius"] = (
-                10 * g_scale_factor + (max_radius - 10 * g_scale_factor) * progress
-            )
-
-            # Apply damage at specific points
-            damage_points = [0.3, 0.6]
-            for dmg_point in damage_points:
-                if dmg_point <= progress < dmg_point + 0.02:
-                    apply_shockwave_damage(
-                        finisher_state["impact_x"],
-                        finisher_state["impact_y"],
-                        finisher_state["shockwave_radius"],
-                    )
-
-            if finisher_state["execution_timer"] <= 1:
-                finisher_state["phase"] = FinisherPhase.POST_IMPACT
-                finisher_state["execution_timer"] = Cfg.finisher_post_impact_time
-                g_game_state["time_scale"] = 1.0
+            # Transition to post-impact
+            finisher_state["phase"] = FinisherPhase.POST_IMPACT
+            finisher_state["execution_timer"] = Cfg.finisher_post_impact_time
+            g_game_state["time_scale"] = 1.0
 
         elif finisher_state["phase"] == FinisherPhase.POST_IMPACT:
             # Cleanup
             finisher_state["executing"] = False
             finisher_state["phase"] = FinisherPhase.IDLE
             finisher_state["target"] = None
+            finisher_state["target_index"] = -1
             finisher_state["shockwave_radius"] = 0
             finisher_state["lock_on_progress"] = 0.0
             g_ship.dashing = 0
 
+    if finisher_state["phase"] == FinisherPhase.IMPACT:
+        # Expand shockwave
+        min_radius = 10 * g_scale_factor
+        max_radius = Cfg.finisher_shockwave_radius * g_scale_factor
+        progress = 1.0 - (finisher_state["execution_timer"] / Cfg.finisher_impact_time)
+        finisher_state["shockwave_radius"] = min_radius + (max_radius - min_radius) * progress
+
+        if finisher_state["execution_timer"] in finisher_state["damage_frames"]:
+            apply_shockwave_damage(
+                finisher_state["impact_x"],
+                finisher_state["impact_y"],
+                finisher_state["shockwave_radius"],
+            )
+
     if finisher_state["phase"] == FinisherPhase.LOCK_ON:
         finisher_state["lock_on_progress"] = 1.0 - (
             finisher_state["execution_timer"] / Cfg.finisher_lock_on_time
@@ -1976,35 +2327,43 @@ def apply_shockwave_damage(x: float, y: float, radius: float) -> None:
     Globals:
         Reads/writes g_enemies, g_game_state
     """
-    for enemy in g_enemies[:]:
-        dist_sq = distance_squared({"x": x, "y": y}, enemy)
+    global g_enemies
 
-        if dist_sq < radius * radius:
+    if not g_enemies:
+        return
+
+    dead = set()
+    radius_sq = radius * radius
+    close_range = radius * Cfg.finisher_shockwave_close_range
+    knockback_force = Cfg.finisher_knockback_force * g_scale_factor
+
+    for i, enemy in enumerate(g_enemies):
+        dx = enemy.x - x
+        dy = enemy.y - y
+        dist_sq = dx * dx + dy * dy
+
+        if dist_sq < radius_sq:
             dist = math.sqrt(dist_sq)
 
-            damage = (
-                Cfg.finisher_damage_close
-                if dist < radius * Cfg.finisher_shockwave_close_range
-                else Cfg.finisher_damage_far
-            )
+            damage = Cfg.finisher_damage_close if dist < close_range else Cfg.finisher_damage_far
             enemy.health -= damage
             enemy.hit_flash = Cfg.asteroid_hit_flash_duration
 
             if dist > 0:
-                knockback_force = (
-                    (1 - dist / radius) * Cfg.finisher_knockback_force * g_scale_factor
-                )
-                dx = enemy.x - x
-                dy = enemy.y - y
-                enemy.vx += (dx / dist) * knockback_force
-                enemy.vy += (dy / dist) * knockback_force
+                # Falloff and normalization folded into one scalar applied to dx/dy
+                push = (1 - dist / radius) * knockback_force / dist
+                enemy.vx += dx * push
+                enemy.vy += dy * push
 
             if enemy.health <= 0:
-                g_enemies.remove(enemy)
+                dead.add(i)
                 create_explosion(enemy.x, enemy.y, 20, Cfg.colors["enemy"], True)
                 g_game_state["score"] += Cfg.enemy_score
                 add_combo()
 
+    if dead:
+        g_enemies = [e for i, e in enumerate(g_enemies) if i not in dead]
+
 
 # === [COLLISION DETECTION] ===
 
@@ -2012,6 +2371,10 @@ def apply_shockwave_damage(x: float, y: float, radius: float) -> None:
 def is_ship_vulnerable() -> bool:
     """Check if ship can take damage.
 
+    Deliberately computed from live state rather than cached: invulnerable and
+    dashing are written by input handling, the finisher, damage and respawn,
+    and collisions only ask once per frame.
+
     Returns:
         True if ship is vulnerable
 
@@ -2044,46 +2407,77 @@ def handle_bullet_collisions() -> None:
     """
     global g_bullets, g_asteroids, g_enemies
 
+    # Common between shots: nothing to test, skip the bookkeeping allocations
+    if not g_bullets:
+        return
+
     bullets_to_remove = set()
     asteroids_to_remove = set()
     asteroids_to_add = []
     enemies_to_remove = set()
 
-    # --- [Bullet-asteroid collisions] ---
-    for i, bullet in enumerate(g_bullets):
-        if i in bullets_to_remove:
-            continue
+    bullet_radius = g_scaled_cfg["bullet_radius"]
+    margin = g_scaled_cfg["asteroid_collision_margin"]
 
-        for j, asteroid in enumerate(g_asteroids):
-            if j in asteroids_to_remove:
+    # --- [Bullet-asteroid collisions] ---
+    if NUMPY_AVAILABLE and len(g_bullets) * len(g_asteroids) >= Cfg.collision_vectorize_threshold:
+        # Positions do not move during this pass, so all hits can be found up front
+        for i, j in find_bullet_hits_vectorized(g_bullets, g_asteroids, bullet_radius, margin):
+            if i in bullets_to_remove or j in asteroids_to_remove:
                 continue
-
-            margin = scaled(Cfg.asteroid_collision_margin)
-            if check_collision(
-                bullet, asteroid, scaled(Cfg.bullet_radius), asteroid.radius + margin
-            ):
-                bullets_to_remove.add(i)
-                handle_asteroid_hit(asteroid, j, asteroids_to_remove, asteroids_to_add)
-                break
+            bullets_to_remove.add(i)
+            handle_asteroid_hit(g_asteroids[j], j, asteroids_to_remove, asteroids_to_add)
+    elif g_bullets and g_asteroids:
+        # Broad phase: a grid with cells as wide as the largest hit distance means
+        # any asteroid a bullet can touch sits in the 3x3 cells around that bullet
+        cell_size = max(asteroid.radius for asteroid in g_asteroids) + margin + bullet_radius
+        grid = build_spatial_hash(g_asteroids, cell_size)
+
+        for i, bullet in enumerate(g_bullets):
+            for j in query_spatial_hash(grid, bullet.x, bullet.y, cell_size):
+                if j in asteroids_to_remove:
+                    continue
+
+                asteroid = g_asteroids[j]
+                if check_collision(bullet, asteroid, bullet_radius, asteroid.radius + margin):
+                    bullets_to_remove.add(i)
+                    handle_asteroid_hit(asteroid, j, asteroids_to_remove, asteroids_to_add)
+                    break
 
     # --- [Bullet-enemy collisions] ---
-    for i, bullet in enumerate(g_bullets):
-        if i in bullets_to_remove:
-            continue
-
-        for j, enemy in enumerate(g_enemies):
-            if j in enemies_to_remove:
+    # Checked after the asteroid pass, which may spawn enemies
+    if NUMPY_AVAILABLE and len(g_bullets) * len(g_enemies) >= Cfg.collision_vectorize_threshold:
+        for i, j in find_bullet_hits_vectorized(g_bullets, g_enemies, bullet_radius):
+            if i in bullets_to_remove or j in enemies_to_remove:
+                continue
+            bullets_to_remove.add(i)
+            handle_enemy_hit(g_enemies[j], j, enemies_to_remove)
+    elif g_bullets and g_enemies:
+        cell_size = max(enemy.radius for enemy in g_enemies) + bullet_radius
+        grid = build_spatial_hash(g_enemies, cell_size)
+
+        for i, bullet in enumerate(g_bullets):
+            if i in bullets_to_remove:
                 continue
 
-            if check_collision(bullet, enemy, scaled(Cfg.bullet_radius), enemy.radius):
-                bullets_to_remove.add(i)
-                handle_enemy_hit(enemy, j, enemies_to_remove)
-                break
-
-    g_bullets = [b for i, b in enumerate(g_bullets) if i not in bullets_to_remove]
-    g_asteroids = [a for i, a in enumerate(g_asteroids) if i not in asteroids_to_remove]
+            for j in query_spatial_hash(grid, bullet.x, bullet.y, cell_size):
+                if j in enemies_to_remove:
+                    continue
+
+                enemy = g_enemies[j]
+                if check_collision(bullet, enemy, bullet_radius, enemy.radius):
+                    bullets_to_remove.add(i)
+                    handle_enemy_hit(enemy, j, enemies_to_remove)
+                    break
+
+    # Most frames have no hits; only rebuild lists that actually lost entries
+    if bullets_to_remove:
+        g_bullets = [b for i, b in enumerate(g_bullets) if i not in bullets_to_remove]
+    if asteroids_to_remove:
+        g_asteroids = [a for i, a in enumerate(g_asteroids) if i not in asteroids_to_remove]
     g_asteroids.extend(asteroids_to_add)
-    g_enemies = [e for i, e in enumerate(g_enemies) if i not in enemies_to_remove]
+    if enemies_to_remove:
+        g_enemies = [e for i, e in enumerate(g_enemies) if i not in enemies_to_remove]
 
 
 def handle_ship_collisions_if_vulnerable() -> None:
@@ -2107,9 +2501,19 @@ def handle_ship_asteroid_collisions() -> None:
     Globals:
         Reads g_ship, g_asteroids
     """
+    if not g_asteroids:
+        return
+
+    # Ship position and reach are fixed for the pass; test squared distances inline
+    ship_x = g_ship.x
+    ship_y = g_ship.y
+    reach_base = g_scaled_cfg["ship_radius"] + g_scaled_cfg["asteroid_collision_margin"]
+
     for asteroid in g_asteroids:
-        margin = scaled(Cfg.asteroid_collision_margin)
-        if check_collision(g_ship, asteroid, scaled(Cfg.ship_radius), asteroid.radius + margin):
+        dx = asteroid.x - ship_x
+        dy = asteroid.y - ship_y
+        reach = reach_base + asteroid.radius
+        if dx * dx + dy * dy < reach * reach:
             if handle_ship_damage():
                 break
 
@@ -2123,17 +2527,24 @@ def handle_ship_enemy_collisions() -> None:
     Globals:
         Reads g_ship, reads/writes g_enemies
     """
-    global g_enemies
-    enemies_to_remove = []
+    if not g_enemies:
+        return
+
+    # Hits are rare and stop at the first damaging one (a shield can absorb one
+    # and let the scan continue), so delete in place instead of rebuilding the list
+    hit_indices = []
+    ship_radius = g_scaled_cfg["ship_radius"]
 
     for i, enemy in enumerate(g_enemies):
-        if check_collision(g_ship, enemy, scaled(Cfg.ship_radius), enemy.radius):
-            enemies_to_remove.append(i)
+        if check_collision(g_ship, enemy, ship_radius, enemy.radius):
+            hit_indices.append(i)
             create_explosion(enemy.x, enemy.y, 20, Cfg.colors["enemy"], is_enemy=True)
             if handle_ship_damage():
                 break
 
-    g_enemies = [e for i, e in enumerate(g_enemies) if i not in enemies_to_remove]
+    # Indices are ascending; delete from the back so earlier ones stay valid
+    for i in reversed(hit_indices):
+        del g_enemies[i]
 
 
 def handle_ship_bullet_collisions() -> None:
@@ -2145,16 +2556,22 @@ def handle_ship_bullet_collisions() -> None:
     Globals:
         Reads g_ship, reads/writes g_enemy_bullets
     """
-    global g_enemy_bullets
-    enemy_bullets_to_remove = set()
+    if not g_enemy_bullets:
+        return
+
+    hit_indices = []
+    ship_radius = g_scaled_cfg["ship_radius"]
+    enemy_bullet_radius = g_scaled_cfg["bullet_radius"] * 2
 
     for i, bullet in enumerate(g_enemy_bullets):
-        if check_collision(g_ship, bullet, scaled(Cfg.ship_radius), scaled(Cfg.bullet_radius) * 2):
-            enemy_bullets_to_remove.add(i)
+        if check_collision(g_ship, bullet, ship_radius, enemy_bullet_radius):
+            hit_indices.append(i)
             if handle_ship_damage():
                 break
 
-    g_enemy_bullets = [b for i, b in enumerate(g_enemy_bullets) if i not in enemy_bullets_to_remove]
+    # Indices are ascending; delete from the back so earlier ones stay valid
+    for i in reversed(hit_indices):
+        del g_enemy_bullets[i]
 
 
 def handle_asteroid_hit(asteroid: Asteroid, index: int, to_remove: set, to_add: list) -> None:
@@ -2284,7 +2701,7 @@ def handle_ship_damage() -> bool:
         g_game_state["effects"]["damage_flash"] = Cfg.shield_flash_duration
         g_game_state["effects"]["damage_flash_color"] = Cfg.colors["shield_flash"]
         g_game_state["effects"]["screen_shake"] = min(
-            g_game_state["effects"]["screen_shake"] + 10, scaled(Cfg.max_screen_shake)
+            g_game_state["effects"]["screen_shake"] + 10, g_scaled_cfg["max_screen_shake"]
         )
         create_explosion(g_ship.x, g_ship.y, 20, (0, 200, 255))
         play_sound("explosion_medium", g_ship.x, 0.8)
@@ -2318,13 +2735,17 @@ def handle_powerup_collisions() -> None:
         Reads g_ship, reads/writes g_powerups, g_game_state
     """
     global g_powerups
-    powerups_to_remove = []
+
+    if not g_powerups:
+        return
+
+    powerups_to_remove = set()
+    pickup_radius = g_scaled_cfg["powerup_pickup_radius"]
+    powerup_radius = g_scaled_cfg["powerup_visual_radius"]
 
     for i, powerup in enumerate(g_powerups):
-        if check_collision(
-            g_ship, powerup, scaled(Cfg.powerup_pickup_radius), scaled(Cfg.powerup_visual_radius)
-        ):
-            powerups_to_remove.append(i)
+        if check_collision(g_ship, powerup, pickup_radius, powerup_radius):
+            powerups_to_remove.add(i)
 
             powerup_color = Cfg.powerup_types[powerup.type]["color"]
             create_powerup_streak(powerup.x, powerup.y, g_ship.x, g_ship.y, powerup_color)
@@ -2343,7 +2764,8 @@ def handle_powerup_collisions() -> None:
                     g_game_state["high_score"] = g_game_state["score"]
                 create_floating_text(powerup.x, powerup.y, "+50", powerup_color)
 
-    g_powerups = [p for i, p in enumerate(g_powerups) if i not in powerups_to_remove]
+    if powerups_to_remove:
+        g_powerups = [p for i, p in enumerate(g_powerups) if i not in powerups_to_remove]
 
 
 # === [LLM EXTENSION POINT: Add new powerup effects here] ===
@@ -2376,12 +2798,13 @@ def apply_powerup(powerup_type: PowerUpType) -> None:
     g_ship.powerup_flash = Cfg.particle_powerup_flash_duration
     g_ship.powerup_flash_color = Cfg.powerup_types[powerup_type]["color"]
     g_game_state["effects"]["screen_shake"] = min(
-        g_game_state["effects"]["screen_shake"] + 3, scaled(Cfg.max_screen_shake)
+        g_game_state["effects"]["screen_shake"] + 3, g_scaled_cfg["max_screen_shake"]
     )
 
-    # Apply powerup effect using lookup table
-    if powerup_type in POWERUP_EFFECTS:
-        POWERUP_EFFECTS[powerup_type]()
+    # Apply powerup effect using lookup table (single lookup; CRYSTAL has no entry)
+    effect = POWERUP_EFFECTS.get(powerup_type)
+    if effect is not None:
+        effect()
 
 
 def handle_life_powerup() -> None:
@@ -2396,88 +2819,69 @@ def handle_life_powerup() -> None:
     g_game_state["lives"] = min(g_game_state["lives"] + 1, Cfg.ship_max_lives)
     g_ship.powerup_flash = Cfg.particle_powerup_flash_max
     g_game_state["effects"]["screen_shake"] = min(
-        g_game_state["effects"]["screen_shake"] + 5, scaled(Cfg.max_screen_shake)
+        g_game_state["effects"]["screen_shake"] + 5, g_scaled_cfg["max_screen_shake"]
     )
 
 
 # === [MOVEMENT AND PHYSICS] ===
 
 
-def update_entity_physics(entity: Any, config: Dict[str, Any]) -> None:
+def update_entity_physics(entity: Any, config: Dict[str, Any], time_scale: float) -> None:
     """Update physics for any game entity.
 
     Args:
-        entity: Game object to update
+        entity: Game object to update (anything with x/y/vx/vy)
         config: Dictionary with 'wrap' key for screen wrapping
+        time_scale: Current g_game_state['time_scale'], read once by the caller
 
     Side effects:
         Modifies entity position, angle, hit_flash
-
-    Globals:
-        Reads g_game_state['time_scale']
     """
-    if hasattr(entity, "vx"):
-        entity.x += entity.vx * g_game_state["time_scale"]
-        entity.y += entity.vy * g_game_state["time_scale"]
-    elif hasattr(entity, "vel_x"):
-        entity.x += entity.vel_x * g_game_state["time_scale"]
-        entity.y += entity.vel_y * g_game_state["time_scale"]
+    entity.x += entity.vx * time_scale
+    entity.y += entity.vy * time_scale
 
     if config.get("wrap", True):
         wrap_position(entity)
 
     if hasattr(entity, "angle") and hasattr(entity, "spin"):
-        entity.angle += entity.spin * g_game_state["time_scale"]
+        entity.angle += entity.spin * time_scale
 
     if hasattr(entity, "hit_flash") and entity.hit_flash > 0:
         entity.hit_flash = update_timer(entity.hit_flash)
 
 
-def apply_friction(entity: Any, friction_value: float) -> None:
+def apply_friction(entity: Any, friction_value: float, time_scale: float) -> None:
     """Apply friction to entity velocity.
 
     Args:
-        entity: Object with velocity
+        entity: Object with vx/vy velocity
         friction_value: Friction coefficient (0-1)
+        time_scale: Current g_game_state['time_scale'], read once by the caller
 
     Side effects:
         Modifies entity velocity
-
-    Globals:
-        Reads g_game_state['time_scale']
     """
-    friction_factor = friction_value ** g_game_state["time_scale"]
+    friction_factor = friction_value**time_scale
 
-    if hasattr(entity, "vx"):
-        entity.vx *= friction_factor
-        entity.vy *= friction_factor
-    elif hasattr(entity, "vel_x"):
-        entity.vel_x *= friction_factor
-        entity.vel_y *= friction_factor
+    entity.vx *= friction_factor
+    entity.vy *= friction_factor
 
 
 def apply_speed_limit(entity: Any, max_speed: float) -> None:
     """Limit entity speed to maximum value.
 
     Args:
-        entity: Object with velocity
+        entity: Object with vx/vy velocity
         max_speed: Maximum allowed speed
 
     Side effects:
         Modifies entity velocity to enforce speed limit
     """
-    if hasattr(entity, "vx"):
-        speed_sq = entity.vx**2 + entity.vy**2
-        if speed_sq > max_speed**2:
-            speed = math.sqrt(speed_sq)
-            entity.vx = (entity.vx / speed) * max_speed
-            entity.vy = (entity.vy / speed) * max_speed
-    elif hasattr(entity, "vel_x"):
-        speed_sq = entity.vel_x**2 + entity.vel_y**2
-        if speed_sq > max_speed**2:
-            speed = math.sqrt(speed_sq)
-            entity.vel_x = (entity.vel_x / speed) * max_speed
-            entity.vel_y = (entity.vel_y / speed) * max_speed
+    speed_sq = entity.vx * entity.vx + entity.vy * entity.vy
+    if speed_sq > max_speed * max_speed:
+        scale = max_speed / math.sqrt(speed_sq)
+        entity.vx *= scale
+        entity.vy *= scale
 
 
 def update_ship(keys: dict, controller_input: Dict[str, Any]) -> None:
@@ -2502,6 +2906,8 @@ def update_ship(keys: dict, controller_input: Dict[str, Any]) -> None:
         create_respawn_particles()
         return
 
+    time_scale = g_game_state["time_scale"]
+
     # --- [Dash handling] ---
     if g_ship.dashing > 0:
         if g_game_state["finisher"]["executing"]:
@@ -2510,9 +2916,10 @@ def update_ship(keys: dict, controller_input: Dict[str, Any]) -> None:
             g_ship.dashing = update_timer(g_ship.dashing)
         create_dash_trail()
 
-        sin_a, cos_a = get_sin_cos(g_ship.angle)
-        g_ship.vel_x = cos_a * scaled(Cfg.ship_max_speed) * Cfg.dash_speed_multiplier
-        g_ship.vel_y = sin_a * scaled(Cfg.ship_max_speed) * Cfg.dash_speed_multiplier
+        idx = round(g_ship.angle * 10) % SIN_COS_STEPS
+        dash_speed = g_scaled_cfg["ship_max_speed"] * Cfg.dash_speed_multiplier
+        g_ship.vx = COS_TABLE[idx] * dash_speed
+        g_ship.vy = SIN_TABLE[idx] * dash_speed
 
         g_ship.invulnerable = max(g_ship.invulnerable, g_ship.dashing)
     else:
@@ -2525,10 +2932,12 @@ def update_ship(keys: dict, controller_input: Dict[str, Any]) -> None:
 
         turn_input += controller_input["turn"]
         turn_input = max(-2, min(2, turn_input))
-        g_ship.angle += turn_input * Cfg.ship_turn_speed * g_game_state["time_scale"]
+        g_ship.angle += turn_input * Cfg.ship_turn_speed * time_scale
         g_ship.angle = g_ship.angle % 360
 
-        sin_a, cos_a = get_sin_cos(g_ship.angle)
+        idx = round(g_ship.angle * 10) % SIN_COS_STEPS
+        sin_a = SIN_TABLE[idx]
+        cos_a = COS_TABLE[idx]
         thrust = 0
 
         if keys[pygame.K_UP] or controller_input["thrust"]:
@@ -2549,14 +2958,14 @@ def update_ship(keys: dict, controller_input: Dict[str, Any]) -> None:
             g_game_state["thrust_sound_playing"] = False
 
         if thrust != 0:
-            g_ship.vel_x += cos_a * scaled(thrust) * g_game_state["time_scale"]
-            g_ship.vel_y += sin_a * scaled(thrust) * g_game_state["time_scale"]
+            g_ship.vx += cos_a * scaled(thrust) * time_scale
+            g_ship.vy += sin_a * scaled(thrust) * time_scale
 
-        apply_speed_limit(g_ship, scaled(Cfg.ship_max_speed) * get_speed_multiplier_wrapper())
-        apply_friction(g_ship, Cfg.ship_friction)
+        apply_speed_limit(g_ship, g_scaled_cfg["ship_max_speed"] * get_speed_multiplier_wrapper())
+        apply_friction(g_ship, Cfg.ship_friction, time_scale)
 
-    g_ship.x += g_ship.vel_x * g_game_state["time_scale"]
-    g_ship.y += g_ship.vel_y * g_game_state["time_scale"]
+    g_ship.x += g_ship.vx * time_scale
+    g_ship.y += g_ship.vy * time_scale
     wrap_position(g_ship)
 
     update_dash_trail()
@@ -2572,9 +2981,13 @@ def update_dash_trail() -> None:
     Globals:
         Reads/writes g_ship, reads g_game_state['time_scale']
     """
-    for trail in g_ship.dash_trail:
+    dash_trail = g_ship.dash_trail
+    for trail in dash_trail:
         trail["life"] = update_timer(trail["life"])
-    g_ship.dash_trail = [t for t in g_ship.dash_trail if t["life"] > 0]
+
+    # Entries share one lifetime and age together, so expired ones are always the oldest
+    while dash_trail and dash_trail[0]["life"] <= 0:
+        dash_trail.popleft()
 
 
 def update_ship_timers() -> None:
@@ -2594,11 +3007,10 @@ def update_ship_timers() -> None:
     g_game_state["bullet_cooldown"] = update_timer(g_game_state["bullet_cooldown"])
     g_game_state["dash"]["cooldown"] = update_timer(g_game_state["dash"]["cooldown"])
 
-    g_ship.aura_pulse += Cfg.powerup_aura_pulse_speed * g_game_state["time_scale"]
-    g_game_state["effects"]["aura_rotation"] = (
-        g_game_state["effects"]["aura_rotation"]
-        + Cfg.powerup_aura_rotation_speed * g_game_state["time_scale"]
-    ) % 360
+    time_scale = g_game_state["time_scale"]
+    effects = g_game_state["effects"]
+    g_ship.aura_pulse += Cfg.powerup_aura_pulse_speed * time_scale
+    effects["aura_rotation"] = (effects["aura_rotation"] + Cfg.powerup_aura_rotation_speed * time_scale) % 360
 
 
 def reset_ship() -> None:
@@ -2617,14 +3029,14 @@ def reset_ship() -> None:
     g_ship.x = g_screen_width // 2
     g_ship.y = g_screen_height // 2
     g_ship.angle = 0
-    g_ship.vel_x = 0
-    g_ship.vel_y = 0
+    g_ship.vx = 0
+    g_ship.vy = 0
     g_ship.invulnerable = Cfg.ship_invulnerability_time
     g_ship.powerup_flash = 0
     g_ship.respawning = Cfg.ship_respawn_duration
     g_ship.aura_pulse = 0
     g_ship.dashing = 0
-    g_ship.dash_trail = []
+    g_ship.dash_trail.clear()
 
 
 # === [ENEMY AI] ===
@@ -2637,109 +3049,114 @@ def update_enemies() -> None:
         Updates enemy AI, physics, and shooting
 
     Globals:
-        Reads/writes g_enemies
+        Reads/writes g_enemies, reads g_game_state['time_scale']
     """
+    time_scale = g_game_state["time_scale"]
+
     for enemy in g_enemies:
         if enemy.hit_flash > 0:
             enemy.hit_flash = update_timer(enemy.hit_flash)
 
-        update_enemy_ai(enemy)
-        apply_enemy_physics(enemy)
-        update_enemy_shooting(enemy)
+        update_enemy_ai(enemy, time_scale)
+        apply_enemy_physics(enemy, time_scale)
+        update_enemy_shooting(enemy, time_scale)
 
 
-def update_enemy_ai(enemy: Enemy) -> None:
+def update_enemy_ai(enemy: Enemy, time_scale: float) -> None:
     """Update enemy AI behavior.
 
     Args:
         enemy: Enemy to update
+        time_scale: Current g_game_state['time_scale'], read once by the caller
 
     Side effects:
         Modifies enemy velocity and angle
 
     Globals:
-        Reads g_ship, g_game_state['time_scale']
+        Reads g_ship
     """
     dx = g_ship.x - enemy.x
     dy = g_ship.y - enemy.y
-    distance = math.sqrt(dx * dx + dy * dy)
-
-    if distance > 0:
-        dx /= distance
-        dy /= distance
-
-    min_distance = Cfg.enemy_min_distance * g_scale_factor
     ai_config = Cfg.enemy_ai[enemy.ai_type.value]
 
     if enemy.ai_type == EnemyAIType.HUNTER:
         # --- [Hunter AI: approach or retreat based on distance] ---
-        if distance > min_distance:
-            rate = ai_config["approach_rate"] * scaled(Cfg.enemy_speed) * g_game_state["time_scale"]
-            enemy.vx += dx * rate
-            enemy.vy += dy * rate
+        dist_sq = dx * dx + dy * dy
+        min_distance = Cfg.enemy_min_distance * g_scale_factor
+        # Only this branch needs the unit direction, so only it pays for the sqrt
+        inv_distance = 1.0 / math.sqrt(dist_sq) if dist_sq > 0 else 1.0
+        if dist_sq > min_distance * min_distance:
+            rate = ai_config["approach_rate"] * g_scaled_cfg["enemy_speed"] * time_scale
         else:
-            rate = ai_config["retreat_rate"] * scaled(Cfg.enemy_speed) * g_game_state["time_scale"]
-            enemy.vx -= dx * rate
-            enemy.vy -= dy * rate
+            rate = -ai_config["retreat_rate"] * g_scaled_cfg["enemy_speed"] * time_scale
+        enemy.vx += dx * inv_distance * rate
+        enemy.vy += dy * inv_distance * rate
     else:  # Circler
         # --- [Circler AI: orbit around player] ---
-        enemy.orbit_angle += ai_config["orbit_speed"] * g_game_state["time_scale"]
+        enemy.orbit_angle += ai_config["orbit_speed"] * time_scale
         orbit_radius = ai_config["orbit_radius"] * g_scale_factor
 
-        orbit_cos, orbit_sin = get_sin_cos(enemy.orbit_angle)
-        target_x = g_ship.x + orbit_cos * orbit_radius
-        target_y = g_ship.y + orbit_sin * orbit_radius
+        # Orbit point uses (sin, cos) for (x, y), which sets the orbit direction
+        idx = round(enemy.orbit_angle * 10) % SIN_COS_STEPS
+        target_x = g_ship.x + SIN_TABLE[idx] * orbit_radius
+        target_y = g_ship.y + COS_TABLE[idx] * orbit_radius
 
         dx_target = target_x - enemy.x
         dy_target = target_y - enemy.y
         dist = math.sqrt(dx_target * dx_target + dy_target * dy_target)
 
         if dist > 0:
-            rate = ai_config["approach_rate"] * scaled(Cfg.enemy_speed) * g_game_state["time_scale"]
+            rate = ai_config["approach_rate"] * g_scaled_cfg["enemy_speed"] * time_scale
             enemy.vx += (dx_target / dist) * rate
             enemy.vy += (dy_target / dist) * rate
 
+    # atan2 is scale-invariant, so the raw offset gives the same heading as the unit vector
     enemy.angle = math.degrees(math.atan2(dy, dx))
 
 
-def apply_enemy_physics(enemy: Enemy) -> None:
+def apply_enemy_physics(enemy: Enemy, time_scale: float) -> None:
     """Apply physics to enemy entity.
 
     Args:
         enemy: Enemy to update
+        time_scale: Current g_game_state['time_scale'], read once by the caller
 
     Side effects:
         Modifies enemy velocity and position via apply_speed_limit,
         apply_friction, and update_entity_physics
     """
-    apply_speed_limit(enemy, scaled(Cfg.enemy_speed) * Cfg.enemy_speed_reduction)
-    apply_friction(enemy, Cfg.enemy_friction)
-    update_entity_physics(enemy, {"wrap": True})
+    apply_speed_limit(enemy, g_scaled_cfg["enemy_speed"] * Cfg.enemy_speed_reduction)
+    apply_friction(enemy, Cfg.enemy_friction, time_scale)
+    update_entity_physics(enemy, {"wrap": True}, time_scale)
 
 
-def update_enemy_shooting(enemy: Enemy) -> None:
+def update_enemy_shooting(enemy: Enemy, time_scale: float) -> None:
     """Update enemy shooting behavior.
 
     Args:
         enemy: Enemy to update
+        time_scale: Current g_game_state['time_scale'], read once by the caller
 
     Side effects:
         Modifies enemy.fire_cooldown, may call shoot_bullet()
 
     Globals:
-        Reads g_ship, g_game_state['time_scale']
+        Reads g_ship
     """
-    enemy.fire_cooldown = update_timer(enemy.fire_cooldown)
+    if enemy.fire_cooldown > 0:
+        enemy.fire_cooldown = max(0, enemy.fire_cooldown - time_scale)
+    else:
+        enemy.fire_cooldown = 0
 
     if enemy.fire_cooldown <= 0:
         dx = g_ship.x - enemy.x
         dy = g_ship.y - enemy.y
-        distance = math.sqrt(dx * dx + dy * dy)
+        dist_sq = dx * dx + dy * dy
 
         min_fire_distance = Cfg.enemy_min_fire_distance * g_scale_factor
         max_fire_distance = Cfg.enemy_max_fire_distance * g_scale_factor
 
-        if min_fire_distance < distance < max_fire_distance:
+        if min_fire_distance * min_fire_distance < dist_sq < max_fire_distance * max_fire_distance:
             aim_angle = enemy.angle + random.uniform(
                 -Cfg.enemy_aim_inaccuracy, Cfg.enemy_aim_inaccuracy
             )
@@ -2774,8 +3191,42 @@ def update_asteroids() -> None:
     Globals:
         Reads/writes g_asteroids
     """
+    time_scale = g_game_state["time_scale"]
     for asteroid in g_asteroids:
-        update_entity_physics(asteroid, {"wrap": True})
+        update_entity_physics(asteroid, {"wrap": True}, time_scale)
+
+
+def advance_bullets(bullets: List[Bullet]) -> List[Bullet]:
+    """Move bullets one frame and collect the ones still alive and on screen.
+
+    Movement, trail, lifetime and culling happen in a single pass. Trails are
+    bounded deques, so appending drops the oldest point automatically.
+
+    Args:
+        bullets: Bullets to advance
+
+    Returns:
+        New list of surviving bullets
+
+    Globals:
+        Reads g_screen_width/height, g_game_state['time_scale']
+    """
+    time_scale = g_game_state["time_scale"]
+    width = g_screen_width
+    height = g_screen_height
+    survivors = []
+
+    for bullet in bullets:
+        bullet.trail.append((bullet.x, bullet.y))
+
+        x = bullet.x = bullet.x + bullet.vx * time_scale
+        y = bullet.y = bullet.y + bullet.vy * time_scale
+        life = bullet.life = max(0, bullet.life - time_scale)
+
+        if life > 0 and 0 <= x <= width and 0 <= y <= height:
+            survivors.append(bullet)
+
+    return survivors
 
 
 def update_bullets() -> None:
@@ -2788,21 +3239,7 @@ def update_bullets() -> None:
         Reads/writes g_bullets, reads g_screen_width/height, g_game_state['time_scale']
     """
     global g_bullets
-
-    for bullet in g_bullets:
-        bullet.trail.append((bullet.x, bullet.y))
-        if len(bullet.trail) > Cfg.bullet_trail_length:
-            bullet.trail.pop(0)
-
-        bullet.x += bullet.vx * g_game_state["time_scale"]
-        bullet.y += bullet.vy * g_game_state["time_scale"]
-        bullet.life = update_timer(bullet.life)
-
-    g_bullets = [
-        b
-        for b in g_bullets
-        if b.life > 0 and 0 <= b.x <= g_screen_width and 0 <= b.y <= g_screen_height
-    ]
+    g_bullets = advance_bullets(g_bullets)
 
 
 def update_enemy_bullets() -> None:
@@ -2815,21 +3252,7 @@ def update_enemy_bullets() -> None:
         Reads/writes g_enemy_bullets, reads g_screen_width/height, g_game_state['time_scale']
     """
     global g_enemy_bullets
-
-    for bullet in g_enemy_bullets:
-        bullet.trail.append((bullet.x, bullet.y))
-        if len(bullet.trail) > Cfg.enemy_bullet_trail_length:
-            bullet.trail.pop(0)
-
-        bullet.x += bullet.vx * g_game_state["time_scale"]
-        bullet.y += bullet.vy * g_game_state["time_scale"]
-        bullet.life = update_timer(bullet.life)
-
-    g_enemy_bullets = [
-        b
-        for b in g_enemy_bullets
-        if b.life > 0 and 0 <= b.x <= g_screen_width and 0 <= b.y <= g_screen_height
-    ]
+    g_enemy_bullets = advance_bullets(g_enemy_bullets)
 
 
 def update_powerups() -> None:
@@ -2843,12 +3266,18 @@ def update_powerups() -> None:
     """
     global g_powerups
 
+    time_scale = g_game_state["time_scale"]
+    survivors = []
+
+    # Move, age and cull in one pass
     for powerup in g_powerups:
-        update_entity_physics(powerup, {"wrap": True})
+        update_entity_physics(powerup, {"wrap": True}, time_scale)
         powerup.lifetime = update_timer(powerup.lifetime)
-        powerup.pulse += 0.2 * g_game_state["time_scale"]
+        powerup.pulse += 0.2 * time_scale
+        if powerup.lifetime > 0:
+            survivors.append(powerup)
 
-    g_powerups = [p for p in g_powerups if p.lifetime > 0]
+    g_powerups = survivors
 
 
 # === [VISUAL EFFECTS] ===
@@ -2884,6 +3313,10 @@ def update_combo_system() -> None:
     """
     combo = g_game_state["combo"]
 
+    # Idle: no combo running and the pulse has faded out
+    if combo["timer"] <= 0 and combo["pulse"] <= 0:
+        return
+
     if combo["timer"] > 0:
         combo["timer"] = update_timer(combo["timer"])
         if combo["timer"] <= 0:
@@ -2907,13 +3340,14 @@ def update_finisher_meter() -> None:
     """
     finisher = g_game_state["finisher"]
 
-    if g_game_state["combo"]["current"] == 0 and finisher["meter"] > 0:
-        decay_per_frame = 2.0 / Cfg.fps
-        finisher["meter"] = max(
-            0.0, finisher["meter"] - decay_per_frame * g_game_state["time_scale"]
-        )
-        if finisher["meter"] < 100.0:
-            finisher["ready"] = False
+    # Meter only decays while it has charge and no combo is running
+    if finisher["meter"] <= 0 or g_game_state["combo"]["current"] != 0:
+        return
+
+    decay_per_frame = 2.0 / Cfg.fps
+    finisher["meter"] = max(0.0, finisher["meter"] - decay_per_frame * g_game_state["time_scale"])
+    if finisher["meter"] < 100.0:
+        finisher["ready"] = False
 
 
 def create_floating_text(
@@ -2931,20 +3365,20 @@ def create_floating_text(
         Appends to global g_floating_texts list
 
     Globals:
-        Writes to g_floating_texts
+        Reads g_scaled_cfg, writes to g_floating_texts
     """
     if color is None:
         color = Cfg.colors["score_text"]
 
+    spread = g_scaled_cfg["floating_text_spread"]
     g_floating_texts.append(
         FloatingText(
-            x=x
-            + random.randint(-Cfg.floating_text_spread, Cfg.floating_text_spread) * g_scale_factor,
+            x=x + (random.random() * 2.0 - 1.0) * spread,
             y=y,
             text=text,
             color=color,
             life=Cfg.floating_text_life,
-            vy=-Cfg.floating_text_speed * g_scale_factor,
+            vy=-g_scaled_cfg["floating_text_speed"],
         )
     )
 
@@ -2958,19 +3392,19 @@ def update_floating_texts() -> None:
     Globals:
         Reads/writes g_floating_texts, reads g_game_state['time_scale']
     """
-    global g_floating_texts
+    time_scale = g_game_state["time_scale"]
+    friction = Cfg.floating_text_friction
+    survivors = []
 
-    write_idx = 0
     for text in g_floating_texts:
-        text.y += text.vy * g_game_state["time_scale"]
+        text.y += text.vy * time_scale
         text.life = update_timer(text.life)
-        text.vy *= Cfg.floating_text_friction
+        text.vy *= friction
 
         if text.life > 0:
-            g_floating_texts[write_idx] = text
-            write_idx += 1
+            survivors.append(text)
 
-    del g_floating_texts[write_idx:]
+    g_floating_texts[:] = survivors
 
 
 # === [LEVEL MANAGEMENT] ===
@@ -3023,17 +3457,60 @@ def start_new_level() -> None:
 # === [OBJECT DRAWING] ===
 
 
-def get_polygon_points(
-    obj: Any,
+def get_polygon_points_xy(
+    x: float,
+    y: float,
+    angle: float,
     num_points: int,
     base_radius: float,
     shape_offsets: Optional[list] = None,
-    angle_override: Optional[float] = None,
 ) -> List[Tuple[float, float]]:
-    """Generate polygon points for an object.
+    """Generate polygon points around a position.
+
+    The first vertex comes from the sin/cos tables; each following vertex is
+    the previous direction rotated by one fixed step, so there is no table
+    lookup per vertex.
 
     Args:
-        obj: Object with position (and optionally angle)
+        x: Center x coordinate
+        y: Center y coordinate
+        angle: Rotation of the first vertex in degrees
+        num_points: Number of polygon vertices
+        base_radius: Base radius of polygon
+        shape_offsets: List of radius offsets for each vertex
+
+    Returns:
+        List of (x, y) tuples forming polygon
+    """
+    step = math.radians(360 / num_points)
+    step_cos = math.cos(step)
+    step_sin = math.sin(step)
+    sin_a, cos_a = get_sin_cos(angle)
+
+    directions = []
+    for _ in range(num_points):
+        directions.append((cos_a, sin_a))
+        cos_a, sin_a = cos_a * step_cos - sin_a * step_sin, sin_a * step_cos + cos_a * step_sin
+
+    if shape_offsets:
+        return [
+            (x + (base_radius + offset) * dir_x, y + (base_radius + offset) * dir_y)
+            for (dir_x, dir_y), offset in zip(directions, shape_offsets)
+        ]
+    return [(x + base_radius * dir_x, y + base_radius * dir_y) for dir_x, dir_y in directions]
+
+
+def get_polygon_points(
+    obj: Union[Asteroid, Enemy],
+    num_points: int,
+    base_radius: float,
+    shape_offsets: Optional[list] = None,
+    angle_override: Optional[float] = None,
+) -> List[Tuple[float, float]]:
+    """Generate polygon points for an entity.
+
+    Args:
+        obj: Entity with x, y and angle attributes (dicts are not supported)
         num_points: Number of polygon vertices
         base_radius: Base radius of polygon
         shape_offsets: List of radius offsets for each vertex
@@ -3042,25 +3519,43 @@ def get_polygon_points(
     Returns:
         List of (x, y) tuples forming polygon
     """
-    points = []
+    angle = obj.angle if angle_override is None else angle_override
+    return get_polygon_points_xy(obj.x, obj.y, angle, num_points, base_radius, shape_offsets)
 
-    if angle_override is not None:
-        angle = angle_override
-    else:
-        angle = getattr(obj, "angle", 0)
 
-    x = getattr(obj, "x", obj["x"] if isinstance(obj, dict) else 0)
-    y = getattr(obj, "y", obj["y"] if isinstance(obj, dict) else 0)
+def get_polygons_batch(asteroids: List[Asteroid]) -> List[List[Tuple[float, float]]]:
+    """Generate polygon points for every asteroid in one pass.
 
-    for i in range(num_points):
-        point_angle = (360 / num_points) * i + angle
-        sin_a, cos_a = get_sin_cos(point_angle)
-        radius = base_radius + (shape_offsets[i] if shape_offsets else 0)
-        points.append((x + radius * cos_a, y + radius * sin_a))
-    return points
+    With numpy and at least Cfg.polygon_vectorize_threshold asteroids, all
+    vertices are computed as one (N, vertex_count) array operation; otherwise
+    each asteroid goes through get_polygon_points.
 
+    Args:
+        asteroids: Asteroids to build polygons for
+
+    Returns:
+        One list of (x, y) tuples per asteroid, in the same order
+    """
+    num_points = Cfg.asteroid_vertex_count
+    if not NUMPY_AVAILABLE or len(asteroids) < Cfg.polygon_vectorize_threshold:
+        return [get_polygon_points(a, num_points, a.radius, a.shape) for a in asteroids]
+
+    count = len(asteroids)
+    xs = np.fromiter((a.x for a in asteroids), float, count)
+    ys = np.fromiter((a.y for a in asteroids), float, count)
+    angles = np.fromiter((a.angle for a in asteroids), float, count)
+    radii = np.fromiter((a.radius for a in asteroids), float, count)[:, None] + np.array(
+        [a.shape for a in asteroids], dtype=float
+    )
 
-# draw_asteroid DELETED - now handled by g_drawing.draw_asteroid()
+    thetas = np.radians(angles[:, None] + np.arange(num_points) * (360 / num_points))
+    points = np.empty((count, num_points, 2))
+    points[:, :, 0] = xs[:, None] + radii * np.cos(thetas)
+    points[:, :, 1] = ys[:, None] + radii * np.sin(thetas)
+    return points.tolist()
+
+
+# draw_asteroid DELETED - now handled by g_drawing.draw_asteroids()
 
 # draw_enemy DELETED - now handled by g_drawing.draw_enemy()
 
@@ -3181,7 +3676,7 @@ def draw_finisher_aura(surface: pygame.Surface) -> None:
     for i in range(8):
         angle = g_game_state["effects"]["aura_rotation"] + i * 45
         sin_a, cos_a = get_sin_cos(angle)
-        radius = (scaled(Cfg.ship_radius) + 15 * g_scale_factor) * pulse
+        radius = (g_scaled_cfg["ship_radius"] + 15 * g_scale_factor) * pulse
         px = g_ship.x + cos_a * radius
         py = g_ship.y + sin_a * radius
 
@@ -3372,7 +3867,7 @@ def draw_finisher_target_indicator(surface: pygame.Surface) -> None:
     if not finisher_state["ready"] or finisher_state["executing"] or not g_enemies:
         return
 
-    target = check_finisher_collision(g_ship, g_ship.angle)
+    target = finisher_state["cached_target"]
     if not target:
         return
 
@@ -3388,6 +3883,32 @@ def draw_finisher_target_indicator(surface: pygame.Surface) -> None:
     draw_dash_preview(surface, target, pulse)
 
 
+# Corner bracket offsets relative to the target, keyed by (reticle_radius, bracket_length)
+g_reticle_bracket_offsets: Dict[Tuple[int, int], Tuple[Tuple[Tuple[int, int], ...], ...]] = {}
+
+
+def build_reticle_bracket_offsets(
+    reticle_radius: int, bracket_length: int
+) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """Build the four corner bracket polylines of the target reticle around (0, 0).
+
+    Args:
+        reticle_radius: Distance from center to each corner
+        bracket_length: Length of each bracket arm
+
+    Returns:
+        Four 3-point polylines (top-left, top-right, bottom-left, bottom-right)
+    """
+    r = reticle_radius
+    b = bracket_length
+    return (
+        ((-r, -r + b), (-r, -r), (-r + b, -r)),
+        ((r - b, -r), (r, -r), (r, -r + b)),
+        ((-r, r - b), (-r, r), (-r + b, r)),
+        ((r - b, r), (r, r), (r, r - b)),
+    )
+
+
 def draw_target_reticle(surface: pygame.Surface, target: Enemy, pulse: float) -> None:
     """Draw targeting reticle on finisher target.
 
@@ -3395,36 +3916,74 @@ def draw_target_reticle(surface: pygame.Surface, target: Enemy, pulse: float) ->
         surface: Surface to draw on
         target: Target enemy
         pulse: Pulse animation value
+
+    Globals:
+        Reads/writes g_reticle_bracket_offsets
     """
     reticle_radius = int((target.radius + 10) * g_scale_factor)
     bracket_length = int(reticle_radius * Cfg.finisher_reticle_bracket_ratio)
     bracket_thickness = max(2, int(Cfg.finisher_reticle_thickness * g_scale_factor))
 
-    corners = [
-        [
-            (target.x - reticle_radius, target.y - reticle_radius + bracket_length),
-            (target.x - reticle_radius, target.y - reticle_radius),
-            (target.x - reticle_radius + bracket_length, target.y - reticle_radius),
-        ],
-        [
-            (target.x + reticle_radius - bracket_length, target.y - reticle_radius),
-            (target.x + reticle_radius, target.y - reticle_radius),
-            (target.x + reticle_radius, target.y - reticle_radius + bracket_length),
-        ],
-        [
-            (target.x - reticle_radius, target.y + reticle_radius - bracket_length),
-            (target.x - reticle_radius, target.y + reticle_radius),
-            (target.x - reticle_radius + bracket_length, target.y + reticle_radius),
-        ],
-        [
-            (target.x + reticle_radius - bracket_length, target.y + reticle_radius),
-            (target.x + reticle_radius, target.y + reticle_radius),
-            (target.x + reticle_radius, target.y + reticle_radius - bracket_length),
-        ],
-    ]
+    offsets = g_reticle_bracket_offsets.get((reticle_radius, bracket_length))
+    if offsets is None:
+        offsets = build_reticle_bracket_offsets(reticle_radius, bracket_length)
+        g_reticle_bracket_offsets[(reticle_radius, bracket_length)] = offsets
+
+    color = Cfg.colors["gold"]
+    x = target.x
+    y = target.y
+    for corner in offsets:
+        pygame.draw.lines(
+            surface, color, False, [(x + dx, y + dy) for dx, dy in corner], bracket_thickness
+        )
+
 
-    for corner in corners:
-        pygame.draw.lines(surface, Cfg.colors["gold"], False, corner, bracket_thickness)
+# Dashed-line segment offsets relative to the ship, keyed by (sin/cos table index, dash_distance, segments)
+g_dash_segment_offsets: Dict[
+    Tuple[int, float, int], Tuple[Tuple[float, float, float, float], ...]
+] = {}
+
+
+def get_dash_segment_offsets(
+    angle: float, dash_distance: float, segments: int
+) -> Tuple[Tuple[float, float, float, float], ...]:
+    """Get the dashed trajectory line as segment offsets relative to the ship.
+
+    The dash pattern only changes when the heading crosses a 0.1 degree table
+    step or the scale changes, so the geometry is cached by table index and
+    callers just translate it each frame.
+
+    Args:
+        angle: Ship heading in degrees
+        dash_distance: Full length of the dashed line
+        segments: Number of segments the line is split into (every other one is drawn)
+
+    Returns:
+        (start_dx, start_dy, end_dx, end_dy) tuples, one per drawn segment
+
+    Globals:
+        Reads/writes g_dash_segment_offsets
+    """
+    idx = round(angle * 10) % SIN_COS_STEPS
+    key = (idx, dash_distance, segments)
+    offsets = g_dash_segment_offsets.get(key)
+    if offsets is not None:
+        return offsets
+
+    if len(g_dash_segment_offsets) >= Cfg.dash_segment_cache_size:
+        g_dash_segment_offsets.clear()
+
+    dir_x = COS_TABLE[idx] * dash_distance
+    dir_y = SIN_TABLE[idx] * dash_distance
+    inv_segments = 1.0 / segments
+    offsets = tuple(
+        (dir_x * start_t, dir_y * start_t, dir_x * end_t, dir_y * end_t)
+        for start_t, end_t in (
+            (i * inv_segments, min((i + 1) * inv_segments, 1.0)) for i in range(0, segments, 2)
+        )
+    )
+    g_dash_segment_offsets[key] = offsets
+    return offsets
 
 
 def draw_dash_preview(surface: pygame.Surface, target: Enemy, pulse: float) -> None:
@@ -3436,35 +3995,25 @@ def draw_dash_preview(surface: pygame.Surface, target: Enemy, pulse: float) -> N
         pulse: Pulse animation value
 
     Globals:
-        Reads g_ship
+        Reads g_ship, g_scaled_cfg
     """
-    sin_a, cos_a = get_sin_cos(g_ship.angle)
-    dash_distance = scaled(Cfg.ship_max_speed) * Cfg.dash_speed_multiplier * Cfg.dash_duration
-
-    segments = Cfg.finisher_dash_preview_segments
-    for i in range(segments):
-        if i % 2 == 0:
-            start_t = i / segments
-            end_t = min((i + 1) / segments, 1.0)
-
-            start_x = g_ship.x + cos_a * dash_distance * start_t
-            start_y = g_ship.y + sin_a * dash_distance * start_t
-            end_x = g_ship.x + cos_a * dash_distance * end_t
-            end_y = g_ship.y + sin_a * dash_distance * end_t
-
-            alpha = int(Cfg.finisher_dash_preview_alpha * pulse)
-            dim_gold = (
-                int(Cfg.colors["gold"][0] * alpha / 255),
-                int(Cfg.colors["gold"][1] * alpha / 255),
-                int(Cfg.colors["gold"][2] * alpha / 255),
-            )
-            pygame.draw.line(
-                surface,
-                dim_gold,
-                (int(start_x), int(start_y)),
-                (int(end_x), int(end_y)),
-                max(1, int(2 * g_scale_factor)),
-            )
+    dash_distance = g_scaled_cfg["ship_max_speed"] * Cfg.dash_speed_multiplier * Cfg.dash_duration
+    offsets = get_dash_segment_offsets(g_ship.angle, dash_distance, Cfg.finisher_dash_preview_segments)
+
+    alpha = int(Cfg.finisher_dash_preview_alpha * pulse)
+    gold = Cfg.colors["gold"]
+    dim_gold = (int(gold[0] * alpha / 255), int(gold[1] * alpha / 255), int(gold[2] * alpha / 255))
+    thickness = max(1, int(2 * g_scale_factor))
+
+    for start_dx, start_dy, end_dx, end_dy in offsets:
+        start_x = g_ship.x + start_dx
+        start_y = g_ship.y + start_dy
+        end_x = g_ship.x + end_dx
+        end_y = g_ship.y + end_dy
+
+        pygame.draw.line(
+            surface, dim_gold, (int(start_x), int(start_y)), (int(end_x), int(end_y)), thickness
+        )
 
 
 def draw_lock_on_indicator(surface: pygame.Surface) -> None:
@@ -3484,31 +4033,27 @@ def draw_lock_on_indicator(surface: pygame.Surface) -> None:
     ):
         return
 
-    sin_a, cos_a = get_sin_cos(g_ship.angle)
-    dash_distance = scaled(Cfg.ship_max_speed) * Cfg.dash_speed_multiplier * Cfg.dash_duration
+    dash_distance = g_scaled_cfg["ship_max_speed"] * Cfg.dash_speed_multiplier * Cfg.dash_duration
+    offsets = get_dash_segment_offsets(g_ship.angle, dash_distance, 20)
 
     pulse = abs(math.sin(finisher_state["lock_on_progress"] * math.pi * 3))
     line_color = (255, int(215 * pulse), 0)
 
-    segments = 20
-    for i in range(segments):
-        if i % 2 == 0:
-            start_t = i / segments
-            end_t = (i + 1) / segments
+    thickness = max(1, int((1 + finisher_state["lock_on_progress"] * 2) * g_scale_factor))
 
-            start_x = g_ship.x + cos_a * dash_distance * start_t
-            start_y = g_ship.y + sin_a * dash_distance * start_t
-            seg_end_x = g_ship.x + cos_a * dash_distance * end_t
-            seg_end_y = g_ship.y + sin_a * dash_distance * end_t
+    for start_dx, start_dy, end_dx, end_dy in offsets:
+        start_x = g_ship.x + start_dx
+        start_y = g_ship.y + start_dy
+        seg_end_x = g_ship.x + end_dx
+        seg_end_y = g_ship.y + end_dy
 
-            thickness = max(1, int((1 + finisher_state["lock_on_progress"] * 2) * g_scale_factor))
-            pygame.draw.line(
-                surface,
-                line_color,
-                (int(start_x), int(start_y)),
-                (int(seg_end_x), int(seg_end_y)),
-                thickness,
-            )
+        pygame.draw.line(
+            surface,
+            line_color,
+            (int(start_x), int(start_y)),
+            (int(seg_end_x), int(seg_end_y)),
+            thickness,
+        )
 
     draw_lock_on_reticle(surface, finisher_state["target"], finisher_state["lock_on_progress"])
 
@@ -3548,58 +4093,79 @@ def draw_lock_on_reticle(surface: pygame.Surface, target: Enemy, progress: float
         return
 
     rotation = progress * 360
+    color = Cfg.colors["gold"]
+    corner_length = reticle_size // 3
+    thickness = max(1, int(2 * g_scale_factor))
     for i in range(4):
-        angle = rotation + i * 90
-        sin_r, cos_r = get_sin_cos(angle)
-
-        corner_length = reticle_size // 3
+        sin_r, cos_r = get_sin_cos(rotation + i * 90)
         start_x = target.x + cos_r * reticle_size
         start_y = target.y + sin_r * reticle_size
+        start = (int(start_x), int(start_y))
 
         pygame.draw.line(
             surface,
-            Cfg.colors["gold"],
-            (int(start_x), int(start_y)),
+            color,
+            start,
             (int(start_x - cos_r * corner_length), int(start_y - sin_r * corner_length)),
-            max(1, int(2 * g_scale_factor)),
+            thickness,
         )
         pygame.draw.line(
             surface,
-            Cfg.colors["gold"],
-            (int(start_x), int(start_y)),
+            color,
+            start,
             (int(start_x + sin_r * corner_length), int(start_y - cos_r * corner_length)),
-            max(1, int(2 * g_scale_factor)),
+            thickness,
         )
 
 
+# Reusable SRCALPHA scratch surface for shockwave rings, grown on demand
+g_shockwave_surface: Optional[pygame.Surface] = None
+
+
 def draw_shockwave(surface: pygame.Surface, x: float, y: float, radius: float) -> None:
     """Draw expanding shockwave effect.
 
+    Each ring is drawn into the top-left corner of a scratch surface just
+    large enough for the shockwave and blitted centered on (x, y), instead
+    of allocating a full-screen alpha surface per ring per frame.
+
     Args:
         surface: Surface to draw on
         x: Center X
         y: Center Y
         radius: Shockwave radius
+
+    Globals:
+        Reads/writes g_shockwave_surface
     """
+    global g_shockwave_surface
+
     if radius <= 0:
         return
 
+    # Outermost glow circle reaches ring_radius + 4
+    half = int(radius) + 6
+    size = half * 2
+    if g_shockwave_surface is None or g_shockwave_surface.get_width() < size:
+        g_shockwave_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    ring_surface = g_shockwave_surface
+    ring_area = pygame.Rect(0, 0, size, size)
+    dest = (int(x) - half, int(y) - half)
+
+    max_radius = Cfg.finisher_shockwave_radius * g_scale_factor
+    progress = radius / max_radius
     for i in range(3):
         ring_radius = int(radius - i * 10 * g_scale_factor)
         if ring_radius > 0:
-            max_radius = Cfg.finisher_shockwave_radius * g_scale_factor
-            progress = radius / max_radius
             alpha = int(200 * (1 - progress) * (1 - i * 0.3))
 
             if alpha > 0:
-                ring_surface = pygame.Surface(
-                    (surface.get_width(), surface.get_height()), pygame.SRCALPHA
-                )
+                ring_surface.fill((0, 0, 0, 0), ring_area)
 
                 pygame.draw.circle(
                     ring_surface,
                     (*Cfg.colors["gold"], alpha),
-                    (int(x), int(y)),
+                    (half, half),
                     ring_radius,
                     max(1, int(3 * g_scale_factor)),
                 )
@@ -3611,29 +4177,29 @@ def draw_shockwave(surface: pygame.Surface, x: float, y: float, radius: float) -
                             pygame.draw.circle(
                                 ring_surface,
                                 (*Cfg.colors["gold"], glow_alpha),
-                                (int(x), int(y)),
+                                (half, half),
                                 ring_radius + j * 2,
                                 1,
                             )
 
-                surface.blit(ring_surface, (0, 0))
+                surface.blit(ring_surface, dest, ring_area)
 
 
 # === [UI DRAWING] ===
 
 
-def draw_ui_text(
-    surface: pygame.Surface,
+def queue_ui_text(
+    blit_list: List[Tuple[pygame.Surface, Union[Tuple[int, int], pygame.Rect]]],
     text: str,
     x: int,
     y: int,
     font_obj: Optional[pygame.font.Font] = None,
     color: Tuple[int, int, int] = Cfg.colors["white"],
 ) -> pygame.Surface:
-    """Draw UI text with caching.
+    """Queue cached UI text for a later batched Surface.blits call.
 
     Args:
-        surface: Surface to draw on
+        blit_list: List of (surface, position) pairs to append to
         text: Text to render
         x: X position
         y: Y position
@@ -3649,7 +4215,7 @@ def draw_ui_text(
     if font_obj is None:
         font_obj = g_font
     text_surface = g_text_cache.get_text(text, font_obj, color)
-    surface.blit(text_surface, (x, y))
+    blit_list.append((text_surface, (x, y)))
     return text_surface
 
 
@@ -3662,27 +4228,32 @@ def draw_ui(surface: pygame.Surface) -> None:
     Globals:
         Reads g_game_state, g_ship
     """
-    margin = int(scaled(Cfg.ui_margin))
-    spacing = int(scaled(Cfg.ui_element_spacing))
+    margin = g_ui_px["ui_margin"]
+    spacing = g_ui_px["ui_element_spacing"]
     y_offset = margin
 
-    draw_score_and_combo(surface, y_offset)
+    # HUD text is collected here and blitted in one call; glows and pips still draw directly
+    blit_list: List[Tuple[pygame.Surface, Union[Tuple[int, int], pygame.Rect]]] = []
 
-    draw_high_score(surface)
+    draw_score_and_combo(surface, y_offset, blit_list)
+
+    draw_high_score(blit_list)
 
     y_offset += spacing
-    draw_ui_text(
-        surface, f"Lives: {'♥' * g_game_state['lives']}", margin, y_offset, g_font, (255, 100, 100)
+    queue_ui_text(
+        blit_list, f"Lives: {'♥' * g_game_state['lives']}", margin, y_offset, g_font, (255, 100, 100)
     )
 
     y_offset += spacing
-    draw_ui_text(surface, f"Level: {g_game_state['level']}", margin, y_offset)
+    queue_ui_text(blit_list, f"Level: {g_game_state['level']}", margin, y_offset)
 
     y_offset += spacing
-    draw_ui_text(
-        surface, f"◆ {g_game_state['crystals']}", margin, y_offset, g_font, Cfg.colors["crystal"]
+    queue_ui_text(
+        blit_list, f"◆ {g_game_state['crystals']}", margin, y_offset, g_font, Cfg.colors["crystal"]
     )
 
+    surface.blits(blit_list, doreturn=False)
+
     y_offset += spacing
     draw_dash_indicator(surface, y_offset)
 
@@ -3696,12 +4267,18 @@ def draw_ui(surface: pygame.Surface) -> None:
     draw_wave_warning(surface)
 
 
-def draw_score_and_combo(surface: pygame.Surface, y_offset: int) -> None:
+def draw_score_and_combo(
+    surface: pygame.Surface, y_offset: int, blit_list: List[Tuple[pygame.Surface, Union[Tuple[int, int], pygame.Rect]]]
+) -> None:
     """Draw score and combo counter.
 
+    The score and combo text are queued on blit_list; the combo glow and
+    progress pips are drawn directly and end up underneath the text.
+
     Args:
-        surface: Surface to draw on
+        surface: Surface to draw glow and pips on
         y_offset: Starting Y position
+        blit_list: List of (surface, position) pairs to append text to
 
     Globals:
         Reads g_game_state, g_text_cache, g_font
@@ -3711,7 +4288,7 @@ def draw_score_and_combo(surface: pygame.Surface, y_offset: int) -> None:
     score_text = g_text_cache.get_text(
         f"Score: {g_game_state['score']}", g_font, Cfg.colors["white"]
     )
-    surface.blit(score_text, (int(scaled(Cfg.ui_margin)), y_offset))
+    blit_list.append((score_text, (g_ui_px["ui_margin"], y_offset)))
 
     if combo["current"] > 1:
         kills_until_pulse = Cfg.combo_pulse_interval - (combo["kills"] % Cfg.combo_pulse_interval)
@@ -3727,7 +4304,7 @@ def draw_score_and_combo(surface: pygame.Surface, y_offset: int) -> None:
 
         combo_text = g_text_cache.get_text(f"x{combo['current']}", g_font, combo_color)
         combo_rect = combo_text.get_rect(
-            left=int(scaled(Cfg.ui_margin) + score_text.get_width() + 10), top=int(y_offset)
+            left=int(g_ui_scaled["ui_margin"] + score_text.get_width() + 10), top=int(y_offset)
         )
 
         if combo["current"] >= Cfg.combo_text_threshold:
@@ -3740,7 +4317,7 @@ def draw_score_and_combo(surface: pygame.Surface, y_offset: int) -> None:
                     surface, (combo_rect.centerx, combo_rect.centery), glow_radius, combo_color
                 )
 
-        surface.blit(combo_text, combo_rect)
+        blit_list.append((combo_text, combo_rect))
 
         if combo["current"] >= Cfg.combo_text_threshold:
             draw_combo_progress(surface, combo_rect.right + int(10 * g_scale_factor), y_offset)
@@ -3759,32 +4336,32 @@ def draw_combo_progress(surface: pygame.Surface, x_start: int, y_offset: int) ->
     """
     combo = g_game_state["combo"]
     kills_in_cycle = combo["kills"] % Cfg.combo_pulse_interval
-    pip_y = int(y_offset + Cfg.ui_combo_pip_y_offset * g_scale_factor)
+    pip_y = int(y_offset + g_ui_scaled["ui_combo_pip_y_offset"])
 
     for i in range(Cfg.combo_pulse_interval):
-        pip_x = int(x_start + i * Cfg.ui_combo_pip_spacing * g_scale_factor)
+        pip_x = int(x_start + i * g_ui_scaled["ui_combo_pip_spacing"])
         if i < kills_in_cycle:
             pygame.draw.circle(
                 surface,
                 Cfg.colors["gold"],
                 (pip_x, pip_y),
-                int(Cfg.ui_combo_pip_radius * g_scale_factor),
+                g_ui_px["ui_combo_pip_radius"],
             )
         else:
             pygame.draw.circle(
                 surface,
                 (100, 100, 100),
                 (pip_x, pip_y),
-                int(Cfg.ui_combo_pip_radius * g_scale_factor),
+                g_ui_px["ui_combo_pip_radius"],
                 1,
             )
 
 
-def draw_high_score(surface: pygame.Surface) -> None:
-    """Draw high score display.
+def draw_high_score(blit_list: List[Tuple[pygame.Surface, Union[Tuple[int, int], pygame.Rect]]]) -> None:
+    """Queue the high score display for a batched blit.
 
     Args:
-        surface: Surface to draw on
+        blit_list: List of (surface, position) pairs to append to
 
     Globals:
         Reads g_game_state, g_text_cache, g_font, g_screen_width
@@ -3795,10 +4372,10 @@ def draw_high_score(surface: pygame.Surface) -> None:
     high_score_rect = high_score_text.get_rect(
         center=(
             g_screen_width // 2,
-            int(scaled(Cfg.ui_margin) + Cfg.ui_high_score_y_offset * g_scale_factor),
+            int(g_ui_scaled["ui_margin"] + g_ui_scaled["ui_high_score_y_offset"]),
         )
     )
-    surface.blit(high_score_text, high_score_rect)
+    blit_list.append((high_score_text, high_score_rect))
 
 
 def draw_dash_indicator(surface: pygame.Surface, y_offset: int) -> None:
@@ -3809,26 +4386,23 @@ def draw_dash_indicator(surface: pygame.Surface, y_offset: int) -> None:
         y_offset: Y position
 
     Globals:
-        Reads g_game_state, g_text_cache
+        Reads g_game_state, g_text_cache, writes g_dash_bar_rect, g_dash_fill_rect
     """
     if g_game_state["dash"]["cooldown"] > 0:
         max_cooldown = Cfg.dash_cooldown - get_dash_cooldown_reduction_wrapper()
         cooldown_percent = 1 - (g_game_state["dash"]["cooldown"] / max_cooldown)
-        bar_width = int(Cfg.ui_dash_bar_width * g_scale_factor)
-        bar_height = int(Cfg.ui_dash_bar_height * g_scale_factor)
-        bar_x = int(scaled(Cfg.ui_margin))
-        bar_y = y_offset
+        bar_rect = g_dash_bar_rect
+        fill_rect = g_dash_fill_rect
+        bar_rect.y = y_offset
+        fill_rect.y = y_offset
+        fill_rect.width = int(bar_rect.width * cooldown_percent)
 
-        pygame.draw.rect(surface, (50, 50, 50), (bar_x, bar_y, bar_width, bar_height))
-        pygame.draw.rect(
-            surface,
-            Cfg.colors["dash"],
-            (bar_x, bar_y, int(bar_width * cooldown_percent), bar_height),
-        )
-        pygame.draw.rect(surface, Cfg.colors["white"], (bar_x, bar_y, bar_width, bar_height), 1)
+        pygame.draw.rect(surface, (50, 50, 50), bar_rect)
+        pygame.draw.rect(surface, Cfg.colors["dash"], fill_rect)
+        pygame.draw.rect(surface, Cfg.colors["white"], bar_rect, 1)
 
         dash_text = g_text_cache.get_text("DASH", g_tiny_font, (150, 150, 150))
-        surface.blit(dash_text, (bar_x, bar_y + bar_height + 2))
+        surface.blit(dash_text, (bar_rect.x, bar_rect.bottom + 2))
     else:
         if g_game_state["finisher"]["ready"]:
             dash_text = g_text_cache.get_text(
@@ -3838,7 +4412,7 @@ def draw_dash_indicator(surface: pygame.Surface, y_offset: int) -> None:
             dash_text = g_text_cache.get_text(
                 "DASH READY (SHIFT)", g_small_font, Cfg.colors["dash"]
             )
-        surface.blit(dash_text, (int(scaled(Cfg.ui_margin)), y_offset))
+        surface.blit(dash_text, (g_ui_px["ui_margin"], y_offset))
 
 
 def draw_finisher_meter(surface: pygame.Surface, y_offset: int) -> None:
@@ -3849,38 +4423,38 @@ def draw_finisher_meter(surface: pygame.Surface, y_offset: int) -> None:
         y_offset: Y position
 
     Globals:
-        Reads g_game_state, g_ship, g_enemies
+        Reads g_game_state, writes g_finisher_bar_rect, g_finisher_fill_rect
     """
     finisher = g_game_state["finisher"]
-    meter_width = int(Cfg.ui_finisher_bar_width * g_scale_factor)
-    meter_height = int(Cfg.ui_finisher_bar_height * g_scale_factor)
-    bar_x = int(scaled(Cfg.ui_margin))
+    bar_rect = g_finisher_bar_rect
+    fill_rect = g_finisher_fill_rect
+    bar_rect.y = y_offset
+    fill_rect.y = y_offset
+    meter_width = bar_rect.width
+    meter_height = bar_rect.height
+    bar_x = bar_rect.x
 
-    has_valid_target = False
-    if finisher["ready"] and not finisher["executing"] and g_enemies:
-        target = check_finisher_collision(g_ship, g_ship.angle)
-        has_valid_target = target is not None
+    has_valid_target = finisher["cached_target"] is not None
 
-    pygame.draw.rect(surface, (50, 50, 50), (bar_x, y_offset, meter_width, meter_height))
+    pygame.draw.rect(surface, (50, 50, 50), bar_rect)
 
-    fill_width = int(meter_width * (finisher["meter"] / 100.0))
+    fill_rect.width = int(meter_width * (finisher["meter"] / 100.0))
     if finisher["ready"]:
+        frame_count = g_game_state["frame_count"]
         if has_valid_target:
-            pulse = calculate_pulse(g_game_state["frame_count"], 0.2)
+            pulse = calculate_pulse(frame_count, 0.2)
             fill_color = (int(255), int(215 + 40 * pulse), int(100 * pulse))
         else:
-            pulse = calculate_pulse(g_game_state["frame_count"], 0.1, 0.3, 0.7)
+            pulse = calculate_pulse(frame_count, 0.1, 0.3, 0.7)
             fill_color = (int(255 * pulse), int(215 * pulse), 0)
     else:
         fill_color = (150, 150, 100)
 
-    pygame.draw.rect(surface, fill_color, (bar_x, y_offset, fill_width, meter_height))
+    pygame.draw.rect(surface, fill_color, fill_rect)
 
     border_color = Cfg.colors["gold"] if has_valid_target else Cfg.colors["white"]
     border_thickness = 2 if has_valid_target else 1
-    pygame.draw.rect(
-        surface, border_color, (bar_x, y_offset, meter_width, meter_height), border_thickness
-    )
+    pygame.draw.rect(surface, border_color, bar_rect, border_thickness)
 
     if finisher["ready"]:
         if has_valid_target:
@@ -3922,10 +4496,9 @@ def draw_system_status(surface: pygame.Surface) -> None:
     )
     sound_text_rect = sound_text.get_rect()
     sound_text_rect.topright = (
-        g_screen_width - int(scaled(Cfg.ui_margin)),
-        int(scaled(Cfg.ui_margin)),
+        g_screen_width - g_ui_px["ui_margin"],
+        g_ui_px["ui_margin"],
     )
-    surface.blit(sound_text, sound_text_rect)
 
     controller_status = "Connected" if g_controller_connected else "Not connected"
     controller_color = (100, 255, 100) if g_controller_connected else (150, 150, 150)
@@ -3934,10 +4507,10 @@ def draw_system_status(surface: pygame.Surface) -> None:
     )
     controller_text_rect = controller_text.get_rect()
     controller_text_rect.topright = (
-        g_screen_width - int(scaled(Cfg.ui_margin)),
-        int(scaled(Cfg.ui_margin) + Cfg.ui_sound_status_y_offset * g_scale_factor),
+        g_screen_width - g_ui_px["ui_margin"],
+        int(g_ui_scaled["ui_margin"] + g_ui_scaled["ui_sound_status_y_offset"]),
     )
-    surface.blit(controller_text, controller_text_rect)
+    surface.blits(((sound_text, sound_text_rect), (controller_text, controller_text_rect)), doreturn=False)
 
 
 def draw_powerup_indicators(surface: pygame.Surface) -> None:
@@ -3949,7 +4522,10 @@ def draw_powerup_indicators(surface: pygame.Surface) -> None:
     Globals:
         Reads g_ship, g_text_cache
     """
-    y_offset = int(scaled(Cfg.ui_margin) + Cfg.ui_powerup_indicator_y_base * g_scale_factor)
+    y_offset = int(g_ui_scaled["ui_margin"] + g_ui_scaled["ui_powerup_indicator_y_base"])
+    x = g_ui_px["ui_margin"]
+    spacing = g_ui_px["ui_powerup_indicator_spacing"]
+    blit_list: List[Tuple[pygame.Surface, Union[Tuple[int, int], pygame.Rect]]] = []
 
     if g_ship.rapid_fire > 0:
         text = g_text_cache.get_text(
@@ -3957,8 +4533,8 @@ def draw_powerup_indicators(surface: pygame.Surface) -> None:
             g_small_font,
             Cfg.powerup_types[PowerUpType.RAPID]["color"],
         )
-        surface.blit(text, (int(scaled(Cfg.ui_margin)), y_offset))
-        y_offset += int(Cfg.ui_powerup_indicator_spacing * g_scale_factor)
+        blit_list.append((text, (x, y_offset)))
+        y_offset += spacing
 
     if g_ship.triple_shot > 0:
         text = g_text_cache.get_text(
@@ -3966,8 +4542,8 @@ def draw_powerup_indicators(surface: pygame.Surface) -> None:
             g_small_font,
             Cfg.powerup_types[PowerUpType.TRIPLE]["color"],
         )
-        surface.blit(text, (int(scaled(Cfg.ui_margin)), y_offset))
-        y_offset += int(Cfg.ui_powerup_indicator_spacing * g_scale_factor)
+        blit_list.append((text, (x, y_offset)))
+        y_offset += spacing
 
     if g_ship.shield_active > 0:
         text = g_text_cache.get_text(
@@ -3975,7 +4551,10 @@ def draw_powerup_indicators(surface: pygame.Surface) -> None:
             g_small_font,
             Cfg.powerup_types[PowerUpType.SHIELD]["color"],
         )
-        surface.blit(text, (int(scaled(Cfg.ui_margin)), y_offset))
+        blit_list.append((text, (x, y_offset)))
+
+    if blit_list:
+        surface.blits(blit_list, doreturn=False)
 
 
 def draw_wave_warning(surface: pygame.Surface) -> None:
@@ -3989,27 +4568,27 @@ def draw_wave_warning(surface: pygame.Surface) -> None:
     """
     if g_game_state["effects"]["wave_warning"] > 0:
         warning_alpha = calculate_fade(abs(math.sin(g_game_state["frame_count"] * 0.1)))
+        # Quantize the flashing tint so the cache holds a handful of surfaces instead of 256
+        warning_alpha = min(255, warning_alpha // 16 * 17)
         warning_color = (255, warning_alpha, warning_alpha)
-        warning_text = g_big_font.render(
-            g_game_state["effects"]["wave_warning_text"], True, warning_color
+        warning_text = g_text_cache.get_text(
+            g_game_state["effects"]["wave_warning_text"], g_big_font, warning_color
         )
         warning_rect = warning_text.get_rect(center=(g_screen_width // 2, g_screen_height // 4))
         surface.blit(warning_text, warning_rect)
 
 
 def draw_floating_texts(surface: pygame.Surface) -> None:
-    """Draw all floating text effects.
+    """Draw all floating text effects in one batched blit.
 
     Args:
         surface: Surface to draw on
 
     Globals:
-        Reads g_floating_texts
+        Reads g_floating_texts, g_drawing
     """
-    for text in g_floating_texts:
-        if g_drawing:
-
-            g_drawing.floating_text(surface, text)
+    if g_drawing:
+        g_drawing.floating_texts(surface, g_floating_texts)
 
 
 # === [VISUAL EFFECTS DRAWING] ===
@@ -4018,6 +4597,30 @@ def draw_floating_texts(surface: pygame.Surface) -> None:
 # === [MENU DRAWING] ===
 
 
+# Full-screen overlay surfaces reused across frames, keyed by (width, height)
+g_overlay_surfaces: Dict[Tuple[int, int], pygame.Surface] = {}
+
+
+def get_overlay_surface() -> pygame.Surface:
+    """Get a reusable screen-sized surface for overlays.
+
+    The surface is returned as-is because callers fill it anyway.
+    Callers must blit the surface before asking for it again.
+
+    Returns:
+        Surface sized to the current screen
+
+    Globals:
+        Reads g_screen_width/height, reads/writes g_overlay_surfaces
+    """
+    key = (g_screen_width, g_screen_height)
+    overlay = g_overlay_surfaces.get(key)
+    if overlay is None:
+        overlay = pygame.Surface(key)
+        g_overlay_surfaces[key] = overlay
+    return overlay
+
+
 def draw_menu_overlay(surface: pygame.Surface, title: str, alpha: int = 200) -> None:
     """Draw a semi-transparent overlay with title.
 
@@ -4029,13 +4632,13 @@ def draw_menu_overlay(surface: pygame.Surface, title: str, alpha: int = 200) ->
     Globals:
         Reads g_screen_width/height, g_big_font
     """
-    overlay = pygame.Surface((g_screen_width, g_screen_height))
+    overlay = get_overlay_surface()
     overlay.set_alpha(alpha)
     overlay.fill((0, 0, 0))
     surface.blit(overlay, (0, 0))
 
     if title:
-        title_text = g_big_font.render(title, True, Cfg.colors["white"])
+        title_text = g_text_cache.get_text(title, g_big_font, Cfg.colors["white"])
         title_rect = title_text.get_rect(center=(g_screen_width // 2, 50 * g_scale_factor))
         surface.blit(title_text, title_rect)
 
@@ -4062,7 +4665,7 @@ def draw_centered_text(
     Globals:
         Reads g_screen_width
     """
-    text_surface = font_obj.render(text, True, color)
+    text_surface = g_text_cache.get_text(text, font_obj, color)
     text_rect = text_surface.get_rect(center=(g_screen_width // 2, y_pos))
     surface.blit(text_surface, text_rect)
     return text_rect
@@ -4098,6 +4701,10 @@ def draw_upgrade_menu(surface: pygame.Surface) -> None:
     )
 
 
+# Upgrade menu order; Cfg.upgrades is fixed at import, so the key order never changes
+UPGRADE_KEYS: Tuple[str, ...] = tuple(Cfg.upgrades)
+
+
 def draw_upgrade_list(surface: pygame.Surface) -> None:
     """Draw list of available upgrades.
 
@@ -4107,10 +4714,10 @@ def draw_upgrade_list(surface: pygame.Surface) -> None:
     Globals:
         Reads g_game_state, g_font, g_small_font, g_screen_width
     """
-    y_offset = Cfg.ui_upgrade_menu_y_start * g_scale_factor
-    upgrade_keys = list(Cfg.upgrades.keys())
+    y_offset = g_ui_scaled["ui_upgrade_menu_y_start"]
+    blit_list: List[Tuple[pygame.Surface, Union[Tuple[int, int], pygame.Rect]]] = []
 
-    for i, upgrade_type in enumerate(upgrade_keys):
+    for i, upgrade_type in enumerate(UPGRADE_KEYS):
         upgrade = Cfg.upgrades[upgrade_type]
         level = g_game_state["upgrade_levels"][upgrade_type]
         max_level = upgrade["max_level"]
@@ -4123,36 +4730,41 @@ def draw_upgrade_list(surface: pygame.Surface) -> None:
                     g_screen_width // 4,
                     y_offset - 10,
                     g_screen_width // 2,
-                    Cfg.ui_upgrade_menu_item_height * g_scale_factor - 20,
+                    g_ui_scaled["ui_upgrade_menu_item_height"] - 20,
                 ),
             )
 
-        name_text = g_font.render(
-            f"{upgrade['name']} (Lv {level}/{max_level})", True, Cfg.colors["white"]
+        name_text = g_text_cache.get_text(
+            f"{upgrade['name']} (Lv {level}/{max_level})", g_font, Cfg.colors["white"]
         )
-        surface.blit(name_text, (g_screen_width // 4 + Cfg.ui_upgrade_menu_padding, y_offset))
+        blit_list.append((name_text, (g_screen_width // 4 + Cfg.ui_upgrade_menu_padding, y_offset)))
 
         if level < max_level:
             cost = calculate_upgrade_cost_wrapper(upgrade_type)
             cost_color = (
                 Cfg.colors["crystal"] if g_game_state["crystals"] >= cost else (255, 100, 100)
             )
-            cost_text = g_font.render(f"Cost: ◆ {cost}", True, cost_color)
+            cost_text = g_text_cache.get_text(f"Cost: ◆ {cost}", g_font, cost_color)
         else:
-            cost_text = g_font.render("MAXED", True, Cfg.colors["gold"])
+            cost_text = g_text_cache.get_text("MAXED", g_font, Cfg.colors["gold"])
 
-        surface.blit(
-            cost_text,
+        blit_list.append(
             (
-                g_screen_width * 3 // 4 - cost_text.get_width() - Cfg.ui_upgrade_menu_padding,
-                y_offset,
-            ),
+                cost_text,
+                (
+                    g_screen_width * 3 // 4 - cost_text.get_width() - Cfg.ui_upgrade_menu_padding,
+                    y_offset,
+                ),
+            )
         )
 
-        desc_text = g_small_font.render(upgrade["description"], True, (200, 200, 200))
-        surface.blit(desc_text, (g_screen_width // 4 + Cfg.ui_upgrade_menu_padding, y_offset + 30))
+        desc_text = g_text_cache.get_text(upgrade["description"], g_small_font, (200, 200, 200))
+        blit_list.append((desc_text, (g_screen_width // 4 + Cfg.ui_upgrade_menu_padding, y_offset + 30)))
 
-        y_offset += Cfg.ui_upgrade_menu_item_height * g_scale_factor
+        y_offset += g_ui_scaled["ui_upgrade_menu_item_height"]
+
+    # Selection highlight rects were drawn in the loop, so the text lands on top of them
+    surface.blits(blit_list, doreturn=False)
 
 
 def draw_game_over(surface: pygame.Surface) -> None:
@@ -4165,22 +4777,23 @@ def draw_game_over(surface: pygame.Surface) -> None:
         Reads/writes g_game_state, reads g_big_font, g_font, g_small_font,
         g_screen_width/height, g_controller_connected
     """
-    g_game_state["effects"]["game_over_alpha"] = min(
-        g_game_state["effects"]["game_over_alpha"] + Cfg.game_over_fade_speed, 128
+    effects = g_game_state["effects"]
+    game_over_alpha = effects["game_over_alpha"] = min(
+        effects["game_over_alpha"] + Cfg.game_over_fade_speed, 128
     )
 
-    overlay = pygame.Surface((g_screen_width, g_screen_height))
-    overlay.set_alpha(g_game_state["effects"]["game_over_alpha"])
+    overlay = get_overlay_surface()
+    overlay.set_alpha(game_over_alpha)
     overlay.fill((0, 0, 0))
     surface.blit(overlay, (0, 0))
 
-    if g_game_state["effects"]["game_over_alpha"] > 64:
+    if game_over_alpha > 64:
         draw_centered_text(
             surface,
             "GAME OVER",
             g_big_font,
             (255, 0, 0),
-            g_screen_height // 2 - Cfg.ui_game_over_y_offset * g_scale_factor,
+            g_screen_height // 2 - g_ui_scaled["ui_game_over_y_offset"],
         )
 
         y_offset = g_screen_height // 2 - 30
@@ -4210,6 +4823,86 @@ def draw_game_over(surface: pygame.Surface) -> None:
             )
 
 
+# Pre-rendered pause menu text: (cache key, composite surface, top-left position)
+g_pause_menu_cache: Tuple[Any, Optional[pygame.Surface], Tuple[int, int]] = (None, None, (0, 0))
+
+
+def get_pause_menu_surface() -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Get the pause menu text pre-rendered into one composite surface.
+
+    The title, control list, stats and achievements line only change with
+    screen size or the displayed values, so they are rendered once per key
+    and reused until one of those changes.
+
+    Returns:
+        Tuple of (composite SRCALPHA surface, top-left blit position)
+
+    Globals:
+        Reads g_game_state, g_big_font, g_font, g_small_font, g_screen_width/height,
+        reads/writes g_pause_menu_cache
+    """
+    global g_pause_menu_cache
+
+    high_score = g_game_state.get("high_score", 0)
+    lifetime_crystals = g_game_state.get("lifetime_crystals", 0)
+    achievements_count = len(g_game_state["achievements_unlocked"])
+    key = (g_screen_width, g_screen_height, high_score, lifetime_crystals, achievements_count)
+    cached_key, cached_surface, cached_pos = g_pause_menu_cache
+    if cached_key == key and cached_surface is not None:
+        return cached_surface, cached_pos
+
+    pause_text = g_big_font.render("PAUSED", True, Cfg.colors["white"])
+    text_rect = pause_text.get_rect(
+        center=(
+            g_screen_width // 2,
+            g_screen_height // 2 - g_ui_scaled["ui_pause_menu_y_start"],
+        )
+    )
+    parts = [(pause_text, text_rect)]
+
+    instructions = [
+        "CONTROLS:",
+        "Arrow Keys - Move",
+        "Space - Shoot",
+        "Shift - Dash / Finisher",
+        "ESC - Resume",
+        "S - Toggle Sound",
+        "U - Upgrades",
+        "Enter - Restart",
+        "",
+        f"High Score: {high_score}",
+        f"Lifetime Crystals: ◆ {lifetime_crystals}",
+    ]
+
+    y_offset = g_screen_height // 2 - 50 * g_scale_factor
+    for instruction in instructions:
+        if instruction:
+            inst_text = g_font.render(instruction, True, Cfg.colors["white"])
+            inst_rect = inst_text.get_rect(center=(g_screen_width // 2, y_offset))
+            parts.append((inst_text, inst_rect))
+        y_offset += g_ui_scaled["ui_pause_menu_line_spacing"]
+
+    achievements_text = g_small_font.render(
+        f"Achievements: {achievements_count}/{len(Cfg.achievements)}",
+        True,
+        Cfg.colors["gold"],
+    )
+    ach_rect = achievements_text.get_rect(
+        center=(
+            g_screen_width // 2,
+            y_offset + g_ui_scaled["ui_pause_menu_achievement_offset"],
+        )
+    )
+    parts.append((achievements_text, ach_rect))
+
+    bounds = text_rect.unionall([rect for _, rect in parts])
+    composite = pygame.Surface(bounds.size, pygame.SRCALPHA)
+    composite.blits([(text, rect.move(-bounds.x, -bounds.y)) for text, rect in parts], doreturn=False)
+
+    g_pause_menu_cache = (key, composite, bounds.topleft)
+    return composite, bounds.topleft
+
+
 def draw_pause_overlay(surface: pygame.Surface) -> None:
     """Draw pause menu overlay.
 
@@ -4217,65 +4910,23 @@ def draw_pause_overlay(surface: pygame.Surface) -> None:
         surface: Surface to draw on
 
     Globals:
-        Reads g_game_state, g_big_font, g_font, g_small_font, g_screen_width/height
+        Reads g_game_state, g_screen_width/height
     """
-    if g_game_state["effects"]["pause_menu_alpha"] <= 0:
+    pause_menu_alpha = g_game_state["effects"]["pause_menu_alpha"]
+    if pause_menu_alpha <= 0:
         return
 
-    overlay = pygame.Surface((g_screen_width, g_screen_height))
-    overlay.set_alpha(int(g_game_state["effects"]["pause_menu_alpha"] * 0.7))
-    overlay.fill((0, 0, 0))
-    surface.blit(overlay, (0, 0))
+    # Blending black at alpha a is the same as scaling RGB by (255 - a) / 255,
+    # so darken in place with one multiply fill instead of fill + alpha blit
+    dim = 255 - int(pause_menu_alpha * 0.7)
+    surface.fill((dim, dim, dim), special_flags=pygame.BLEND_RGB_MULT)
 
-    if g_game_state["effects"]["pause_menu_alpha"] > 128:
-        alpha_ratio = (g_game_state["effects"]["pause_menu_alpha"] - 128) / 127
+    if pause_menu_alpha > 128:
+        alpha_ratio = (pause_menu_alpha - 128) / 127
 
-        pause_text = g_big_font.render("PAUSED", True, Cfg.colors["white"])
-        pause_text.set_alpha(calculate_fade(alpha_ratio))
-        text_rect = pause_text.get_rect(
-            center=(
-                g_screen_width // 2,
-                g_screen_height // 2 - Cfg.ui_pause_menu_y_start * g_scale_factor,
-            )
-        )
-        surface.blit(pause_text, text_rect)
-
-        instructions = [
-            "CONTROLS:",
-            "Arrow Keys - Move",
-            "Space - Shoot",
-            "Shift - Dash / Finisher",
-            "ESC - Resume",
-            "S - Toggle Sound",
-            "U - Upgrades",
-            "Enter - Restart",
-            "",
-            f"High Score: {g_game_state.get('high_score', 0)}",
-            f"Lifetime Crystals: ◆ {g_game_state.get('lifetime_crystals', 0)}",
-        ]
-
-        y_offset = g_screen_height // 2 - 50 * g_scale_factor
-        for instruction in instructions:
-            if instruction:
-                inst_text = g_font.render(instruction, True, Cfg.colors["white"])
-                inst_text.set_alpha(calculate_fade(alpha_ratio))
-                inst_rect = inst_text.get_rect(center=(g_screen_width // 2, y_offset))
-                surface.blit(inst_text, inst_rect)
-            y_offset += Cfg.ui_pause_menu_line_spacing * g_scale_factor
-
-        achievements_text = g_small_font.render(
-            f"Achievements: {len(g_game_state['achievements_unlocked'])}/{len(Cfg.achievements)}",
-            True,
-            Cfg.colors["gold"],
-        )
-        achievements_text.set_alpha(calculate_fade(alpha_ratio))
-        ach_rect = achievements_text.get_rect(
-            center=(
-                g_screen_width // 2,
-                y_offset + Cfg.ui_pause_menu_achievement_offset * g_scale_factor,
-            )
-        )
-        surface.blit(achievements_text, ach_rect)
+        menu_surface, menu_pos = get_pause_menu_surface()
+        menu_surface.set_alpha(calculate_fade(alpha_ratio))
+        surface.blit(menu_surface, menu_pos)
 
 
 # === [RENDERING SYSTEM] ===
@@ -4301,6 +4952,59 @@ def render_frame(shake_x: int, shake_y: int, keys: dict, controller_input: Dict[
     pygame.display.flip()
 
 
+# Pre-rendered combo edge frame: (cache key, SRCALPHA frame surface, edge strip rects)
+g_combo_edge_cache: Tuple[Any, Optional[pygame.Surface], List[pygame.Rect]] = (None, None, [])
+
+
+def get_combo_edge_frame() -> Tuple[pygame.Surface, List[pygame.Rect]]:
+    """Get the three nested combo edge rings pre-rendered into one frame surface.
+
+    Rings are composited once at Cfg.combo_edge_max_alpha and rebuilt only when
+    the screen size changes. The returned strips cover the four screen edges
+    out to the thickest ring, so callers blit just those areas.
+
+    Returns:
+        Tuple of (frame surface, list of edge strip rects)
+
+    Globals:
+        Reads g_screen_width/height, g_scale_factor, reads/writes g_combo_edge_cache
+    """
+    global g_combo_edge_cache
+
+    key = (g_screen_width, g_screen_height, g_scale_factor)
+    cached_key, cached_surface, cached_strips = g_combo_edge_cache
+    if cached_key == key and cached_surface is not None:
+        return cached_surface, cached_strips
+
+    frame = pygame.Surface((g_screen_width, g_screen_height), pygame.SRCALPHA)
+    ring = pygame.Surface((g_screen_width, g_screen_height), pygame.SRCALPHA)
+    for i in range(3):
+        ring.fill((0, 0, 0, 0))
+        thickness = int(
+            (Cfg.combo_edge_thickness_base - i * Cfg.combo_edge_thickness_step) * g_scale_factor
+        )
+        alpha = int(Cfg.combo_edge_max_alpha * (1 - i * Cfg.combo_edge_alpha_decay))
+        color = (*Cfg.colors["gold"], alpha)
+
+        pygame.draw.rect(ring, color, (0, 0, g_screen_width, thickness))
+        pygame.draw.rect(ring, color, (0, g_screen_height - thickness, g_screen_width, thickness))
+        pygame.draw.rect(ring, color, (0, 0, thickness, g_screen_height))
+        pygame.draw.rect(ring, color, (g_screen_width - thickness, 0, thickness, g_screen_height))
+        frame.blit(ring, (0, 0))
+
+    outer = int(Cfg.combo_edge_thickness_base * g_scale_factor)
+    inner_height = max(0, g_screen_height - 2 * outer)
+    strips = [
+        pygame.Rect(0, 0, g_screen_width, outer),
+        pygame.Rect(0, g_screen_height - outer, g_screen_width, outer),
+        pygame.Rect(0, outer, outer, inner_height),
+        pygame.Rect(g_screen_width - outer, outer, outer, inner_height),
+    ]
+
+    g_combo_edge_cache = (key, frame, strips)
+    return frame, strips
+
+
 def apply_combo_pulse(surface: pygame.Surface) -> None:
     """Apply combo pulse screen effect.
 
@@ -4308,38 +5012,24 @@ def apply_combo_pulse(surface: pygame.Surface) -> None:
         surface: Surface to apply effect to
 
     Globals:
-        Reads g_game_state, g_screen_width/height
+        Reads g_game_state, g_screen_width/height, g_combo_edge_cache
     """
-    pulse_alpha = min(Cfg.combo_pulse_max_alpha, g_game_state["combo"]["pulse"] * 5)
-    pulse_surface = pygame.Surface((g_screen_width, g_screen_height))
+    pulse = g_game_state["combo"]["pulse"]
+    pulse_alpha = min(Cfg.combo_pulse_max_alpha, pulse * 5)
+    pulse_surface = get_overlay_surface()
     pulse_surface.set_alpha(pulse_alpha)
     pulse_surface.fill(Cfg.colors["gold"])
     surface.blit(pulse_surface, (0, 0))
 
-    if g_game_state["combo"]["pulse"] > Cfg.combo_edge_pulse_threshold:
+    if pulse > Cfg.combo_edge_pulse_threshold:
         edge_alpha = min(
-            50,
-            (g_game_state["combo"]["pulse"] - Cfg.combo_edge_pulse_threshold)
-            * Cfg.combo_edge_pulse_multiplier,
+            Cfg.combo_edge_max_alpha,
+            (pulse - Cfg.combo_edge_pulse_threshold) * Cfg.combo_edge_pulse_multiplier,
         )
-        for i in range(3):
-            edge_surface = pygame.Surface((g_screen_width, g_screen_height), pygame.SRCALPHA)
-            thickness = int(
-                (Cfg.combo_edge_thickness_base - i * Cfg.combo_edge_thickness_step) * g_scale_factor
-            )
-            alpha = int(edge_alpha * (1 - i * Cfg.combo_edge_alpha_decay))
-            color = (*Cfg.colors["gold"], alpha)
-
-            pygame.draw.rect(edge_surface, color, (0, 0, g_screen_width, thickness))
-            pygame.draw.rect(
-                edge_surface, color, (0, g_screen_height - thickness, g_screen_width, thickness)
-            )
-            pygame.draw.rect(edge_surface, color, (0, 0, thickness, g_screen_height))
-            pygame.draw.rect(
-                edge_surface, color, (g_screen_width - thickness, 0, thickness, g_screen_height)
-            )
-
-            surface.blit(edge_surface, (0, 0))
+        edge_surface, strips = get_combo_edge_frame()
+        # The frame is baked at full strength; surface alpha scales every ring's alpha linearly
+        edge_surface.set_alpha(int(255 * edge_alpha / Cfg.combo_edge_max_alpha))
+        surface.blits([(edge_surface, strip, strip) for strip in strips], doreturn=False)
 
 
 def render_background(surface: pygame.Surface, shake_x: int, shake_y: int) -> None:
@@ -4381,25 +5071,23 @@ def render_game_objects(
     Globals:
         Reads g_asteroids, g_enemies, g_game_state
     """
+    finisher = g_game_state["finisher"]
+
     if g_drawing:
         g_drawing.draw_powerups(game_surface, g_powerups)
 
-    for asteroid in g_asteroids:
-        if g_drawing:
-            g_drawing.draw_asteroid(game_surface, asteroid, get_polygon_points)
+    if g_drawing:
+        g_drawing.draw_asteroids(game_surface, g_asteroids, get_polygons_batch(g_asteroids))
 
-    for enemy in g_enemies:
-        if g_drawing:
-            is_finisher_target = False
-            if g_game_state["finisher"]["ready"] and not g_game_state["finisher"]["executing"]:
-                target = check_finisher_collision(g_ship, g_ship.angle)
-                is_finisher_target = target == enemy
-            g_drawing.draw_enemy(game_surface, enemy, is_finisher_target, g_game_state)
+    if g_drawing:
+        finisher_target = finisher["cached_target"]
+        for enemy in g_enemies:
+            g_drawing.draw_enemy(game_surface, enemy, enemy is finisher_target, g_game_state)
 
-    if g_game_state["finisher"]["ready"] and not g_game_state["finisher"]["executing"]:
+    if finisher["ready"] and not finisher["executing"]:
         draw_finisher_target_indicator(game_surface)
 
-    if g_game_state["finisher"]["phase"] == FinisherPhase.LOCK_ON:
+    if finisher["phase"] == FinisherPhase.LOCK_ON:
         draw_lock_on_indicator(game_surface)
 
     if g_drawing:
@@ -4407,15 +5095,9 @@ def render_game_objects(
         g_drawing.draw_bullets(game_surface, g_bullets, g_enemy_bullets)
         g_drawing.draw_particles(game_surface, g_particle_pool)
 
-    if (
-        g_game_state["finisher"]["phase"] == FinisherPhase.IMPACT
-        and g_game_state["finisher"]["shockwave_radius"] > 0
-    ):
+    if finisher["phase"] == FinisherPhase.IMPACT and finisher["shockwave_radius"] > 0:
         draw_shockwave(
-            game_surface,
-            g_game_state["finisher"]["impact_x"],
-            g_game_state["finisher"]["impact_y"],
-            g_game_state["finisher"]["shockwave_radius"],
+            game_surface, finisher["impact_x"], finisher["impact_y"], finisher["shockwave_radius"]
         )
 
     draw_floating_texts(game_surface)
@@ -4455,6 +5137,31 @@ def render_effects_and_ui(
         draw_pause_overlay(surface)
 
 
+# Transparent layer for game objects, reused across frames and rebuilt when the target size changes
+g_game_surface: Optional[pygame.Surface] = None
+
+
+def get_game_surface(size: Tuple[int, int]) -> pygame.Surface:
+    """Get the reusable SRCALPHA game-object layer, cleared to transparent.
+
+    Args:
+        size: Required (width, height)
+
+    Returns:
+        Transparent surface of the requested size
+
+    Globals:
+        Reads/writes g_game_surface
+    """
+    global g_game_surface
+
+    if g_game_surface is None or g_game_surface.get_size() != size:
+        g_game_surface = pygame.Surface(size, pygame.SRCALPHA)
+    else:
+        g_game_surface.fill((0, 0, 0, 0))
+    return g_game_surface
+
+
 def render_to_surface(
     surface: pygame.Surface,
     shake_x: int,
@@ -4472,11 +5179,11 @@ def render_to_surface(
         controller_input: Controller state
 
     Globals:
-        Reads various game state and object lists
+        Reads various game state and object lists, reuses g_game_surface
     """
     render_background(surface, shake_x, shake_y)
 
-    game_surface = pygame.Surface((surface.get_width(), surface.get_height()), pygame.SRCALPHA)
+    game_surface = get_game_surface(surface.get_size())
     render_game_objects(game_surface, keys, controller_input)
     render_effects_and_ui(surface, game_surface, shake_x, shake_y)
 
@@ -4547,10 +5254,13 @@ def reset_game() -> None:
                 "execution_timer": 0,
                 "phase": FinisherPhase.IDLE,
                 "target": None,
+                "target_index": -1,
+                "damage_frames": (),
                 "shockwave_radius": 0,
                 "lock_on_progress": 0.0,
                 "impact_x": 0,
                 "impact_y": 0,
+                "cached_target": None,
             },
         }
     )
@@ -4565,7 +5275,7 @@ def reset_game() -> None:
     g_ship.respawning = 0
     g_ship.aura_pulse = 0
     g_ship.dashing = 0
-    g_ship.dash_trail = []
+    g_ship.dash_trail.clear()
 
     update_scaled_values()
 
@@ -4589,6 +5299,19 @@ def reset_game() -> None:
 # === [MAIN GAME LOOP] ===
 
 
+# Event types handle_events reacts to; everything else is dropped by SDL before queueing.
+# Held keys and stick axes are polled (key.get_pressed, get_controller_input), not read from events.
+ALLOWED_EVENT_TYPES = (
+    pygame.QUIT,
+    pygame.VIDEORESIZE,
+    pygame.WINDOWFOCUSLOST,
+    pygame.KEYDOWN,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYDEVICEADDED,
+    pygame.JOYDEVICEREMOVED,
+)
+
+
 def handle_events() -> bool:
     """Process all pygame events.
 
@@ -4621,6 +5344,10 @@ def handle_events() -> bool:
         if event.type == pygame.JOYBUTTONDOWN and g_controller_connected:
             handle_controller_button_event(event)
 
+        # Hot-plug is event-driven, so the joystick subsystem is not polled every frame
+        if event.type == pygame.JOYDEVICEADDED or event.type == pygame.JOYDEVICEREMOVED:
+            check_controller_connection()
+
     return True
 
 
@@ -4654,37 +5381,46 @@ def update_game_state(keys: dict, controller_input: Dict[str, Any]) -> None:
         controller_input: Controller state
 
     Side effects:
-        Updates all game objects and systems
+        Updates all game objects and systems, refreshes g_game_state['finisher']['cached_target']
 
     Globals:
         Reads/writes various game state
     """
+    # Only reset_game replaces these sub-dicts, and it never runs inside an update
+    effects = g_game_state["effects"]
+
     update_visual_effects()
     update_finisher()
 
-    if g_game_state["effects"]["level_transition"] == 0:
+    if effects["level_transition"] == 0:
         update_ship(keys, controller_input)
         update_game_objects()
         handle_collisions()
 
-    if not g_asteroids and g_game_state["effects"]["level_transition"] == 0:
+    if not g_asteroids and effects["level_transition"] == 0:
         g_game_state["level"] += 1
-        g_game_state["effects"]["level_transition"] = Cfg.level_transition_duration
-        g_game_state["effects"]["level_transition_text"] = f"LEVEL {g_game_state['level']}"
-        g_game_state["effects"]["screen_shake"] = 10
+        effects["level_transition"] = Cfg.level_transition_duration
+        effects["level_transition_text"] = f"LEVEL {g_game_state['level']}"
+        if g_big_font:
+            vfx.prepare_level_transition_text(effects["level_transition_text"], g_big_font)
+        effects["screen_shake"] = 10
         play_sound("level_transition", g_screen_width // 2)
 
-    if g_game_state["effects"]["level_transition"] > 0:
-        g_game_state["effects"]["level_transition"] = update_timer(
-            g_game_state["effects"]["level_transition"]
-        )
-        if g_game_state["effects"]["level_transition"] == 0:
+    if effects["level_transition"] > 0:
+        effects["level_transition"] = update_timer(effects["level_transition"])
+        if effects["level_transition"] == 0:
             start_new_level()
 
-    if g_game_state["effects"]["damage_flash"] > 0:
-        g_game_state["effects"]["damage_flash"] = update_timer(
-            g_game_state["effects"]["damage_flash"], 2
-        )
+    if effects["damage_flash"] > 0:
+        effects["damage_flash"] = update_timer(effects["damage_flash"], 2)
+
+    # Resolve the finisher target once here; the draw path reads it instead of re-checking
+    finisher = g_game_state["finisher"]
+    finisher["cached_target"] = (
+        check_finisher_collision(g_ship, g_ship.angle)
+        if finisher["ready"] and not finisher["executing"] and g_enemies
+        else None
+    )
 
 
 def run_game_loop() -> None:
@@ -4694,15 +5430,16 @@ def run_game_loop() -> None:
         Reads/writes most game state
     """
     prev_controller_shoot = False
-    prev_controller_dash = False
-    prev_keys_dash = False
+    prev_dash = False
+
+    # Loop-invariant lookups bound once; tick() sleeps via SDL_Delay, which can oversleep
+    # on coarse OS timers, so precise_timing busy-waits the end of the frame instead
+    fps = Cfg.fps
+    tick = g_clock.tick_busy_loop if Cfg.precise_timing else g_clock.tick
+    get_pressed = pygame.key.get_pressed
 
     running = True
     while running:
-        keys = pygame.key.get_pressed()
-        check_controller_connection()
-        controller_input = get_controller_input()
-
         running = handle_events()
         if not running:
             break
@@ -4722,12 +5459,13 @@ def run_game_loop() -> None:
             and not g_game_state["paused"]
             and not g_game_state["show_upgrade_menu"]
         ):
+            keys = get_pressed()
+            controller_input = get_controller_input()
+
             current_dash = (
                 keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT] or controller_input["dash"]
             )
-            prev_keys_dash, prev_controller_dash = handle_dash_input(
-                current_dash, prev_keys_dash, prev_controller_dash
-            )
+            prev_dash = handle_dash_input(current_dash, prev_dash)
 
             if (
                 controller_input["shoot"]
@@ -4740,6 +5478,11 @@ def run_game_loop() -> None:
 
             keys, controller_input = handle_input(keys, controller_input)
             update_game_state(keys, controller_input)
+        else:
+            # Held input is only polled during gameplay (menus and pause are event-driven),
+            # so render with nothing held rather than a stale in-game snapshot
+            keys = NO_KEYS_PRESSED
+            controller_input = NO_CONTROLLER_INPUT
 
         update_pause_menu_fade()
 
@@ -4749,7 +5492,7 @@ def run_game_loop() -> None:
 
         render_frame(shake_x, shake_y, keys, controller_input)
 
-        g_clock.tick(Cfg.fps)
+        tick(fps)
 
 
 def handle_keyboard_event(event: pygame.event.Event) -> None:
@@ -4783,22 +5526,56 @@ def handle_upgrade_menu_keys(event: pygame.event.Event) -> None:
         Reads/writes g_game_state
     """
     if event.key == pygame.K_UP:
-        g_game_state["selected_upgrade"] = (g_game_state["selected_upgrade"] - 1) % len(
-            Cfg.upgrades
-        )
+        g_game_state["selected_upgrade"] = (g_game_state["selected_upgrade"] - 1) % len(UPGRADE_KEYS)
     elif event.key == pygame.K_DOWN:
-        g_game_state["selected_upgrade"] = (g_game_state["selected_upgrade"] + 1) % len(
-            Cfg.upgrades
-        )
+        g_game_state["selected_upgrade"] = (g_game_state["selected_upgrade"] + 1) % len(UPGRADE_KEYS)
     elif event.key == pygame.K_RETURN:
-        upgrade_keys = list(Cfg.upgrades.keys())
-        selected = upgrade_keys[g_game_state["selected_upgrade"]]
+        selected = UPGRADE_KEYS[g_game_state["selected_upgrade"]]
         if apply_upgrade_wrapper(selected):
             play_sound("powerup_life")
 
 
+def shoot_if_ready() -> None:
+    """Fire on key press if the weapon is off cooldown and the ship is in play.
+
+    Globals:
+        Reads g_game_state, g_ship
+    """
+    if not g_game_state["game_over"] and g_game_state["bullet_cooldown"] <= 0 and g_ship.respawning == 0:
+        shoot_bullet()
+
+
+def restart_if_game_over() -> None:
+    """Restart the game from the game over screen.
+
+    Globals:
+        Reads g_game_state
+    """
+    if g_game_state["game_over"]:
+        reset_game()
+
+
+def open_upgrade_menu() -> None:
+    """Open the upgrade menu with the first upgrade selected.
+
+    Globals:
+        Writes g_game_state
+    """
+    g_game_state["show_upgrade_menu"] = True
+    g_game_state["selected_upgrade"] = 0
+
+
+# === [LLM EXTENSION POINT: Add new gameplay key bindings here] ===
+GAME_KEY_HANDLERS: Dict[int, Callable[[], None]] = {
+    pygame.K_SPACE: shoot_if_ready,
+    pygame.K_RETURN: restart_if_game_over,
+    pygame.K_s: toggle_sound,
+    pygame.K_u: open_upgrade_menu,
+}
+
+
 def handle_game_keys(event: pygame.event.Event) -> None:
-    """Handle input during gameplay.
+    """Handle input during gameplay using lookup table.
 
     Args:
         event: Pygame keyboard event
@@ -4806,20 +5583,9 @@ def handle_game_keys(event: pygame.event.Event) -> None:
     Globals:
         Reads/writes g_game_state, g_ship
     """
-    if (
-        event.key == pygame.K_SPACE
-        and not g_game_state["game_over"]
-        and g_game_state["bullet_cooldown"] <= 0
-        and g_ship.respawning == 0
-    ):
-        shoot_bullet()
-    elif event.key == pygame.K_RETURN and g_game_state["game_over"]:
-        reset_game()
-    elif event.key == pygame.K_s:
-        toggle_sound()
-    elif event.key == pygame.K_u:
-        g_game_state["show_upgrade_menu"] = True
-        g_game_state["selected_upgrade"] = 0
+    handler = GAME_KEY_HANDLERS.get(event.key)
+    if handler:
+        handler()
 
 
 def toggle_pause() -> None:
@@ -4861,18 +5627,15 @@ def handle_controller_button_event(event: pygame.event.Event) -> None:
         toggle_sound()
 
 
-def handle_dash_input(
-    current_dash: bool, prev_keys_dash: bool, prev_controller_dash: bool
-) -> Tuple[bool, bool]:
-    """Handle dash/finisher input.
+def handle_dash_input(current_dash: bool, prev_dash: bool) -> bool:
+    """Handle dash/finisher input on the press edge.
 
     Args:
-        current_dash: Current dash input state
-        prev_keys_dash: Previous keyboard dash state
-        prev_controller_dash: Previous controller dash state
+        current_dash: Current dash input state (keyboard or controller)
+        prev_dash: Dash input state from the previous gameplay frame
 
     Returns:
-        Updated (prev_keys_dash, prev_controller_dash)
+        State to pass as prev_dash next frame
 
     Side effects:
         May execute dash or finisher move
@@ -4880,22 +5643,24 @@ def handle_dash_input(
     Globals:
         Reads g_game_state, g_ship, g_enemies
     """
-    if current_dash and not prev_keys_dash and not prev_controller_dash:
-        if g_game_state["dash"]["cooldown"] <= 0 and g_ship.respawning == 0 and g_ship.dashing == 0:
-            if (
-                g_game_state["finisher"]["ready"]
-                and not g_game_state["finisher"]["executing"]
-                and g_enemies
-            ):
-                target = check_finisher_collision(g_ship, g_ship.angle)
-                if target:
-                    start_finisher_execution(target)
-                else:
-                    execute_normal_dash()
-            else:
-                execute_normal_dash()
+    # Held or released input never acts, so the state checks only run on a fresh press
+    if not current_dash or prev_dash:
+        return current_dash
 
-    return current_dash, current_dash
+    if g_game_state["dash"]["cooldown"] > 0 or g_ship.respawning != 0 or g_ship.dashing != 0:
+        return current_dash
+
+    finisher = g_game_state["finisher"]
+    target = None
+    if finisher["ready"] and not finisher["executing"] and g_enemies:
+        target = check_finisher_collision(g_ship, g_ship.angle)
+
+    if target:
+        start_finisher_execution(target)
+    else:
+        execute_normal_dash()
+
+    return current_dash
 
 
 def execute_normal_dash() -> None:
@@ -4921,14 +5686,14 @@ def update_pause_menu_fade() -> None:
     Globals:
         Reads/writes g_game_state
     """
-    if g_game_state["effects"]["pause_menu_alpha"] < 255 and g_game_state["paused"]:
-        g_game_state["effects"]["pause_menu_alpha"] = min(
-            255, g_game_state["effects"]["pause_menu_alpha"] + Cfg.pause_fade_speed
-        )
-    elif g_game_state["effects"]["pause_menu_alpha"] > 0 and not g_game_state["paused"]:
-        g_game_state["effects"]["pause_menu_alpha"] = max(
-            0, g_game_state["effects"]["pause_menu_alpha"] - Cfg.pause_fade_speed
-        )
+    effects = g_game_state["effects"]
+    pause_menu_alpha = effects["pause_menu_alpha"]
+    paused = g_game_state["paused"]
+
+    if pause_menu_alpha < 255 and paused:
+        effects["pause_menu_alpha"] = min(255, pause_menu_alpha + Cfg.pause_fade_speed)
+    elif pause_menu_alpha > 0 and not paused:
+        effects["pause_menu_alpha"] = max(0, pause_menu_alpha - Cfg.pause_fade_speed)
 
 
 def calculate_screen_shake() -> Tuple[int, int]:
@@ -4943,21 +5708,20 @@ def calculate_screen_shake() -> Tuple[int, int]:
     Globals:
         Reads/writes g_game_state
     """
-    shake_x, shake_y = 0, 0
-    if g_game_state["effects"]["screen_shake"] > 0:
-        if not g_game_state["paused"]:
-            g_game_state["effects"]["screen_shake"] = max(
-                0, g_game_state["effects"]["screen_shake"] - Cfg.screen_shake_decay
-            )
-        shake_x = random.randint(
-            -int(g_game_state["effects"]["screen_shake"]),
-            int(g_game_state["effects"]["screen_shake"]),
-        )
-        shake_y = random.randint(
-            -int(g_game_state["effects"]["screen_shake"]),
-            int(g_game_state["effects"]["screen_shake"]),
-        )
-    return shake_x, shake_y
+    effects = g_game_state["effects"]
+    shake = effects["screen_shake"]
+    if shake <= 0:
+        return 0, 0
+
+    if not g_game_state["paused"]:
+        shake = effects["screen_shake"] = max(0, shake - Cfg.screen_shake_decay)
+
+    # One random() draw picks a uniform cell of the span x span offset grid, which
+    # skips randint's randrange argument checks and a second RNG call
+    magnitude = int(shake)
+    span = 2 * magnitude + 1
+    cell = int(random.random() * span * span)
+    return cell // span - magnitude, cell % span - magnitude
 
 
 # === [ENTRY POINT] ===
@@ -4982,6 +5746,10 @@ def main() -> None:
     pygame.display.set_caption("Asteroids Enhanced")
     g_clock = pygame.time.Clock()
 
+    # Mouse motion and other unused events would otherwise flood the queue
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(ALLOWED_EVENT_TYPES)
+
     # Initialize progression system with dependency injection
     g_progression = ProgressionSystem(
         create_floating_text=create_floating_text, update_scaled_values=update_scaled_values
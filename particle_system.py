@@ -6,7 +6,7 @@ This module contains the ParticlePool class for efficient particle management.
 
 import math
 import random
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from data_structures import Particle, ParticleType
 from config import Cfg
@@ -37,6 +37,36 @@ class ParticlePool:
             return particle
         return None
 
+    def get_many(self, count: int) -> List[Particle]:
+        """Get up to count inactive particles from the pool in one step.
+
+        Args:
+            count: Number of particles requested
+
+        Returns:
+            List of activated Particle objects (shorter than count if pool runs low)
+        """
+        take = min(count, len(self.inactive_indices))
+        if take <= 0:
+            return []
+
+        indices = self.inactive_indices[-take:]
+        del self.inactive_indices[-take:]
+        self.active_indices.extend(indices)
+
+        particles = [self.pool[idx] for idx in indices]
+        for particle in particles:
+            particle.active = True
+        return particles
+
+    def free_count(self) -> int:
+        """Get the number of particles still available.
+
+        Returns:
+            Count of inactive particles
+        """
+        return len(self.inactive_indices)
+
     def update(self, time_scale: float, ship=None) -> None:
         """Update all active particles.
 
@@ -47,50 +77,59 @@ class ParticlePool:
         Side effects:
             Modifies particle positions and life, manages active/inactive lists
         """
-
-        new_active = []
-
-        for idx in self.active_indices:
-            particle = self.pool[idx]
+        # Frame constants: friction only depends on time_scale, not on the particle
+        friction_factor = 0.95**time_scale
+        streak_type = ParticleType.STREAK
+        attract = ship is not None
+        streak_min_life = Cfg.particle_streak_min_life
+        attraction_distance = Cfg.particle_streak_attraction_distance
+        pull = Cfg.particle_streak_attraction_force * time_scale
+        sqrt = math.sqrt
+        pool = self.pool
+        active_indices = self.active_indices
+
+        # Walk backwards so an expired slot can be filled with the (already updated) last
+        # index and popped; draw order does not matter, so no list is rebuilt per frame
+        for i in range(len(active_indices) - 1, -1, -1):
+            idx = active_indices[i]
+            particle = pool[idx]
 
             particle.x += particle.vx * time_scale
             particle.y += particle.vy * time_scale
             particle.life -= time_scale
 
             # Special behavior for streak particles
-            if (
-                particle.type == ParticleType.STREAK
-                and particle.life > Cfg.particle_streak_min_life
-                and ship
-            ):
+            if particle.type is streak_type and particle.life > streak_min_life and attract:
                 dx = ship.x - particle.x
                 dy = ship.y - particle.y
                 dist_sq = dx * dx + dy * dy
-                if dist_sq > Cfg.particle_streak_attraction_distance:
-                    dist = math.sqrt(dist_sq)
-                    attraction = Cfg.particle_streak_attraction_force
-                    particle.vx += (dx / dist) * attraction * time_scale
-                    particle.vy += (dy / dist) * attraction * time_scale
+                if dist_sq > attraction_distance:
+                    # One sqrt and one division scale both components of the unit vector
+                    inv_dist_pull = pull / sqrt(dist_sq)
+                    particle.vx += dx * inv_dist_pull
+                    particle.vy += dy * inv_dist_pull
             else:
-                friction_factor = 0.95**time_scale
                 particle.vx *= friction_factor
                 particle.vy *= friction_factor
 
-            if particle.life > 0:
-                new_active.append(idx)
-            else:
+            if particle.life <= 0:
                 particle.active = False
+                active_indices[i] = active_indices[-1]
+                active_indices.pop()
                 self.inactive_indices.append(idx)
 
-        self.active_indices = new_active
+    def iter_active(self) -> Iterator[Particle]:
+        """Iterate over all active particles without building a list.
 
-    def get_active_particles(self) -> List[Particle]:
-        """Get list of all active particles.
+        update() keeps active_indices limited to live particles, so no
+        per-particle active check is needed. Do not get or update particles
+        while iterating.
 
         Returns:
-            List of active Particle objects
+            Iterator of active Particle objects
         """
-        return [self.pool[idx] for idx in self.active_indices if self.pool[idx].active]
+        pool = self.pool
+        return (pool[idx] for idx in self.active_indices)
 
     def clear(self) -> None:
         """Reset all particles to inactive state.
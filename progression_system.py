@@ -10,8 +10,25 @@ import os
 from typing import Dict, Optional, Callable, Set, Any
 from dataclasses import dataclass
 
+# Try to import orjson for faster save/load serialization (falls back to stdlib json)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from config import Cfg
 
+# Required save file fields and their accepted types, built once for every validation
+SAVE_DATA_SCHEMA: Dict[str, Any] = {
+    "high_score": (int, float),  # Allow both int and float for backwards compatibility
+    "lifetime_crystals": (int, float),
+    "achievements_unlocked": (list, set),  # Allow both list and set
+    "upgrade_levels": dict,
+    "boss_kills": (int, float),
+}
+
 
 @dataclass
 class GameContext:
@@ -60,24 +77,20 @@ class ProgressionSystem:
         """
         return {key: 0 for key in Cfg.upgrades}
 
-    def validate_save_data(self, save_data: dict) -> bool:
+    def validate_save_data(self, save_data: Any) -> bool:
         """Validate save data structure and types.
 
         Args:
-            save_data: Dictionary containing save data
+            save_data: Decoded save file contents; anything other than a dict is rejected
 
         Returns:
             True if save data is valid, False otherwise
         """
-        required_fields = {
-            "high_score": (int, float),  # Allow both int and float for backwards compatibility
-            "lifetime_crystals": (int, float),
-            "achievements_unlocked": (list, set),  # Allow both list and set
-            "upgrade_levels": dict,
-            "boss_kills": (int, float),
-        }
+        if not isinstance(save_data, dict):
+            print(f"[validate_save_data] Expected a JSON object, got {type(save_data)}")
+            return False
 
-        for field, expected_types in required_fields.items():
+        for field, expected_types in SAVE_DATA_SCHEMA.items():
             if field not in save_data:
                 print(f"[validate_save_data] Missing required field: {field}")
                 return False
@@ -114,16 +127,28 @@ class ProgressionSystem:
             "boss_kills": ctx.game_state.get("boss_kills", 0),
         }
 
+        # Write beside the save and swap it in, so a crash mid-write never leaves a truncated file
+        temp_file = Cfg.save_file + ".tmp"
         try:
-            with open(Cfg.save_file, "w") as f:
-                json.dump(save_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(save_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(save_data, indent=2).encode("utf-8")
+            with open(temp_file, "wb") as f:
+                f.write(payload)
+            os.replace(temp_file, Cfg.save_file)
             return True
         except (IOError, OSError, PermissionError) as e:
             print(f"[save_game_state] Failed to save: {e}")
-            return False
         except Exception as e:
             print(f"[save_game_state] Unexpected error: {e}")
-            return False
+
+        # Don't leave a partial temp file behind after a failed save
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        return False
 
     def load_game_state(self, ctx: GameContext) -> bool:
         """Load persistent game state from file with robust error handling.
@@ -148,8 +173,10 @@ class ProgressionSystem:
                 ctx.game_state.update(default_state)
                 return False
 
-            with open(Cfg.save_file, "r") as f:
-                save_data = json.load(f)
+            with open(Cfg.save_file, "rb") as f:
+                payload = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+            save_data = orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
 
             # Validate save data structure
             if not self.validate_save_data(save_data):
@@ -205,11 +232,12 @@ class ProgressionSystem:
         Returns:
             True if achievement was newly unlocked, False otherwise
         """
-        if achievement_id not in Cfg.achievements:
-            print(f"[check_achievement] Unknown achievement: {achievement_id}")
+        # Already-unlocked is the common case; loaded sets only hold known IDs
+        if achievement_id in ctx.game_state["achievements_unlocked"]:
             return False
 
-        if achievement_id in ctx.game_state["achievements_unlocked"]:
+        if achievement_id not in Cfg.achievements:
+            print(f"[check_achievement] Unknown achievement: {achievement_id}")
             return False
 
         if achievement_id not in self.achievement_conditions:
@@ -7,7 +7,7 @@ This module handles all sound generation, management, and playback functionality
 import pygame
 import random
 import math
-from typing import Dict, Optional, Union, Tuple
+from typing import Any, Dict, Optional, Sequence, Union, Tuple
 
 # Try to import numpy for sound generation
 try:
@@ -21,6 +21,14 @@ except ImportError:
 # Sound system globals
 g_sounds: Dict[str, pygame.mixer.Sound] = {}
 
+# Sounds with several generated takes; play_sound picks one at random
+SOUND_VARIATIONS: Dict[str, Tuple[str, ...]] = {
+    "shoot": ("shoot1", "shoot2", "shoot3"),
+    "explosion_small": ("explosion_small1", "explosion_small2"),
+    "explosion_medium": ("explosion_medium1", "explosion_medium2"),
+    "explosion_large": ("explosion_large1", "explosion_large2"),
+}
+
 
 class SoundConfig:
     """Sound system configuration."""
@@ -58,20 +66,11 @@ def play_sound(
         return False
 
     try:
-        sound_variations = {
-            "shoot": ["shoot1", "shoot2", "shoot3"],
-            "explosion_small": ["explosion_small1", "explosion_small2"],
-            "explosion_medium": ["explosion_medium1", "explosion_medium2"],
-            "explosion_large": ["explosion_large1", "explosion_large2"],
-        }
-
-        actual_sound_name = sound_name
-        if sound_name in sound_variations:
-            actual_sound_name = random.choice(sound_variations[sound_name])
-
-        if actual_sound_name in g_sounds:
-            sound = g_sounds[actual_sound_name]
+        group = SOUND_VARIATIONS.get(sound_name)
+        actual_sound_name = group[random.randrange(len(group))] if group else sound_name
 
+        sound = g_sounds.get(actual_sound_name)
+        if sound is not None:
             if x_pos is not None:
                 pan = max(0, min(1, x_pos / screen_width))
                 channel = sound.play()
@@ -152,9 +151,11 @@ if NUMPY_AVAILABLE:
         elif wave_type == "sweep":
             if isinstance(frequency, tuple):
                 freq_start, freq_end = frequency
-                freq_sweep = np.linspace(freq_start, freq_end, frames)
-                phase = 2 * np.pi * np.cumsum(freq_sweep) / sample_rate
-                wave = np.sin(phase)
+                # Integrate frequency into phase in place: one buffer instead of four temporaries
+                phase = np.linspace(freq_start, freq_end, frames)
+                np.cumsum(phase, out=phase)
+                phase *= 2 * np.pi / sample_rate
+                wave = np.sin(phase, out=phase)
             else:
                 wave = np.sin(2 * np.pi * frequency * t)
         elif wave_type == "noise":
@@ -180,46 +181,105 @@ if NUMPY_AVAILABLE:
             decay_rate: Decay rate for exponential envelope
 
         Returns:
-            Sound with envelope applied
+            Sound with envelope applied (the input array, modified in place)
         """
         frames = len(sound)
         if frames == 0:
             return sound
 
         if envelope_type == "exp":
-            envelope = np.exp(-np.linspace(0, decay_rate, frames))
+            envelope = np.linspace(0, -decay_rate, frames)
+            np.exp(envelope, out=envelope)
         elif envelope_type == "linear":
             envelope = np.linspace(1, 0, frames)
         else:
-            envelope = np.ones(frames)
+            return sound
 
-        return sound * envelope
+        sound *= envelope
+        return sound
 
-    def mix_sounds(*sounds) -> np.ndarray:
-        """Mix multiple sounds together.
+    def mix_into(out: np.ndarray, sources: Tuple[np.ndarray, ...], gains: Tuple[float, ...]) -> np.ndarray:
+        """Mix scaled sources into a preallocated buffer, then normalize it.
 
         Args:
-            *sounds: Variable number of sound arrays
+            out: Zeroed output buffer, at least as long as every source
+            sources: Throwaway sound arrays; each is scaled by its gain in place
+            gains: Gain applied to the matching source
 
         Returns:
-            Mixed sound array
+            The output buffer, mixed and normalized in place
         """
-        if not sounds:
-            return np.array([])
+        for sound, gain in zip(sources, gains):
+            if gain != 1.0:
+                sound *= gain
+            out[: len(sound)] += sound
 
-        max_length = max(len(s) for s in sounds)
-        mixed = np.zeros(max_length)
+        return normalize_sound(out)
 
-        for sound in sounds:
-            if len(sound) > 0:
-                mixed[: len(sound)] += sound
+    def normalize_sound(sound: np.ndarray, peak: float = 0.8) -> np.ndarray:
+        """Scale a sound in place so its loudest sample hits peak, to prevent clipping.
 
-        # Normalize to prevent clipping
-        max_val = np.max(np.abs(mixed))
+        Args:
+            sound: Sound samples
+            peak: Target absolute peak
+
+        Returns:
+            The input array, normalized in place
+        """
+        max_val = np.max(np.abs(sound)) if len(sound) > 0 else 0
         if max_val > 0:
-            mixed = mixed / max_val * 0.8
+            sound *= peak / max_val
+
+        return sound
+
+    def synth_arpeggio(
+        out: np.ndarray,
+        freqs: Sequence[float],
+        starts: Sequence[int],
+        note_duration: float,
+        decay_rate: float,
+        gain: float,
+        sample_rate: int = 22050,
+    ) -> np.ndarray:
+        """Add a sequence of enveloped sine notes into a buffer.
 
-        return mixed
+        All notes are synthesized in one 2-D pass with the same shaping generate_sound and
+        apply_envelope give a single tone: edge fades, then exponential decay.
+
+        Args:
+            out: Buffer to add the notes into; notes running past its end are cut off
+            freqs: Note frequencies in Hz
+            starts: Start frame of each note
+            note_duration: Length of every note in seconds
+            decay_rate: Decay rate for the exponential envelope
+            gain: Gain applied to every note
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            The output buffer, modified in place
+        """
+        note_frames = int(note_duration * sample_rate)
+        if note_frames <= 0 or not freqs:
+            return out
+
+        shape = np.linspace(0, -decay_rate, note_frames)
+        np.exp(shape, out=shape)
+        fade_frames = min(int(0.01 * sample_rate), note_frames // 4)
+        if fade_frames > 0:
+            shape[:fade_frames] *= np.linspace(0, 1, fade_frames)
+            shape[-fade_frames:] *= np.linspace(1, 0, fade_frames)
+        shape *= gain
+
+        notes = np.outer(freqs, np.arange(note_frames) * (2 * np.pi / sample_rate))
+        np.sin(notes, out=notes)
+        notes *= shape
+
+        for note, start in zip(notes, starts):
+            end = min(start + note_frames, len(out))
+            if start < end:
+                out[start:end] += note[: end - start]
+
+        return out
 
     def numpy_to_pygame_sound(
         numpy_array: np.ndarray, sample_rate: int = 22050
@@ -233,10 +293,13 @@ if NUMPY_AVAILABLE:
         Returns:
             Pygame Sound object
         """
-        sound = np.array(numpy_array * 32767, dtype=np.int16)
-        stereo_sound = np.zeros((len(sound), 2), dtype=np.int16)
-        stereo_sound[:, 0] = sound
-        stereo_sound[:, 1] = sound
+        # Clamp before the cast; out-of-range floats would otherwise wrap around in int16
+        sound = numpy_array * 32767
+        np.clip(sound, -32768, 32767, out=sound)
+
+        # One broadcast assignment casts and fills both interleaved channels
+        stereo_sound = np.empty((len(sound), 2), dtype=np.int16)
+        stereo_sound[:] = sound[:, None]
 
         return pygame.sndarray.make_sound(stereo_sound)
 
@@ -258,9 +321,10 @@ def init_sounds() -> None:
             freq_start = 800 + i * 100
             freq_end = 200 - i * 50
             sweep = generate_sound(0.1, (freq_start, freq_end), "sweep")
-            click = generate_sound(0.01, 2000 + i * 200, "sine") * 0.3
+            click = generate_sound(0.01, 2000 + i * 200, "sine")
+            noise = generate_sound(0.1, 0, "noise")
 
-            shoot_sound = mix_sounds(sweep * 0.7, click, generate_sound(0.1, 0, "noise") * 0.1)
+            shoot_sound = mix_into(np.zeros(len(sweep)), (sweep, click, noise), (0.7, 0.3, 0.1))
             shoot_sound = apply_envelope(shoot_sound, "exp", 10)
 
             g_sounds[f"shoot{i + 1}"] = numpy_to_pygame_sound(
@@ -285,9 +349,8 @@ def init_sounds() -> None:
                 rumble = generate_sound(
                     config["duration"], config["rumble"] + random.randint(-10, 10), "sine"
                 )
-                rumble *= 0.3
 
-                explosion = mix_sounds(crack * 0.5, noise * 0.7, rumble)
+                explosion = mix_into(np.zeros(len(noise)), (crack, noise, rumble), (0.5, 0.7, 0.3))
 
                 g_sounds[f"explosion_{size}{i + 1}"] = numpy_to_pygame_sound(
                     explosion * SoundConfig.sound_explosion_volume * SoundConfig.sound_master_volume
@@ -295,8 +358,8 @@ def init_sounds() -> None:
 
         # Dash sound
         dash_sweep = generate_sound(0.3, (3000, 500), "sweep")
-        dash_noise = generate_sound(0.3, 0, "noise") * 0.2
-        dash_sound = mix_sounds(dash_sweep, dash_noise)
+        dash_noise = generate_sound(0.3, 0, "noise")
+        dash_sound = mix_into(np.zeros(len(dash_sweep)), (dash_sweep, dash_noise), (1.0, 0.2))
         dash_sound[: int(0.02 * sample_rate)] *= np.linspace(0, 1, int(0.02 * sample_rate))
         g_sounds["dash"] = numpy_to_pygame_sound(dash_sound * SoundConfig.sound_master_volume)
 
@@ -307,10 +370,14 @@ def init_sounds() -> None:
             enemy_sound * 0.7 * SoundConfig.sound_master_volume
         )
 
-        enemy_exp = mix_sounds(
-            generate_sound(0.3, 150, "sine") * 0.3,
-            generate_sound(0.3, 0, "noise") * 0.4,
-            generate_sound(0.3, 300, "sine") * 0.2,
+        enemy_exp = mix_into(
+            np.zeros(int(0.3 * sample_rate)),
+            (
+                generate_sound(0.3, 150, "sine"),
+                generate_sound(0.3, 0, "noise"),
+                generate_sound(0.3, 300, "sine"),
+            ),
+            (0.3, 0.4, 0.2),
         )
         enemy_exp = apply_envelope(enemy_exp, "exp", 10)
         g_sounds["enemy_explosion"] = numpy_to_pygame_sound(
@@ -320,49 +387,45 @@ def init_sounds() -> None:
         # Crystal pickup sound
         crystal_freqs = [523, 659, 784, 1047, 1319, 1568]
         crystal_sound = np.zeros(int(0.5 * sample_rate))
-        for i, freq in enumerate(crystal_freqs):
-            start = int(i * 0.08 * sample_rate)
-            duration = int(0.15 * sample_rate)
-            if start + duration <= len(crystal_sound):
-                tone = generate_sound(0.15, freq, "sine")
-                tone = apply_envelope(tone, "exp", 3)
-                crystal_sound[start : start + len(tone)] += tone * 0.4
+        crystal_starts = [int(i * 0.08 * sample_rate) for i in range(len(crystal_freqs))]
+        # Notes that would run past the end are dropped rather than cut off
+        crystal_count = sum(
+            1 for start in crystal_starts if start + int(0.15 * sample_rate) <= len(crystal_sound)
+        )
+        synth_arpeggio(
+            crystal_sound, crystal_freqs[:crystal_count], crystal_starts[:crystal_count], 0.15, 3, 0.4
+        )
 
         g_sounds["powerup_crystal"] = numpy_to_pygame_sound(
             crystal_sound * SoundConfig.powerup_volume * SoundConfig.sound_master_volume
         )
 
         # Powerup sounds
-        powerup_configs = {
+        powerup_configs: Dict[str, Dict[str, Any]] = {
             "life": {"freqs": [523, 659, 784], "duration": 0.3},
             "rapid": {"freqs": [400, 600, 800], "duration": 0.3},
             "triple": {"freqs": [440, 550, 660], "duration": 0.3},
             "shield": {"freqs": [300, 400, 500], "duration": 0.3},
         }
 
-        for ptype, config in powerup_configs.items():
-            sound_frames = int(config["duration"] * sample_rate)
-            powerup_sound = np.zeros(sound_frames)
-
-            for i, freq in enumerate(config["freqs"]):
-                start = int(i * 0.1 * sample_rate)
-                if start < sound_frames:
-                    tone = generate_sound(0.1, freq, "sine")
-                    tone = apply_envelope(tone, "exp", 5)
-                    end = min(start + len(tone), sound_frames)
-                    powerup_sound[start:end] += tone[: end - start] * 0.5
+        for ptype, powerup_config in powerup_configs.items():
+            powerup_sound = np.zeros(int(powerup_config["duration"] * sample_rate))
+            powerup_starts = [int(i * 0.1 * sample_rate) for i in range(len(powerup_config["freqs"]))]
+            synth_arpeggio(powerup_sound, powerup_config["freqs"], powerup_starts, 0.1, 5, 0.5)
 
             g_sounds[f"powerup_{ptype}"] = numpy_to_pygame_sound(
                 powerup_sound * SoundConfig.powerup_volume * SoundConfig.sound_master_volume
             )
 
         # Thrust sound
-        thrust_base = generate_sound(1.0, 60, "sine")
-        thrust_wobble = generate_sound(1.0, 5, "sine") * 10
-        thrust_freq = 60 + thrust_wobble
-        thrust_frames = int(1.0 * sample_rate)
-        thrust_t = np.arange(thrust_frames) / sample_rate
-        thrust_sound = np.sin(2 * np.pi * thrust_freq * thrust_t)
+        # 60 Hz carrier wobbling +/-10 Hz at 5 Hz; integrate the instantaneous frequency into
+        # phase (sin(2*pi*f(t)*t) would also scale the wobble with t), reusing one buffer
+        thrust_phase = generate_sound(1.0, 5, "sine")
+        thrust_phase *= 10
+        thrust_phase += 60
+        np.cumsum(thrust_phase, out=thrust_phase)
+        thrust_phase *= 2 * np.pi / sample_rate
+        thrust_sound = np.sin(thrust_phase, out=thrust_phase)
         thrust_sound += generate_sound(1.0, 0, "noise") * 0.05
 
         g_sounds["thrust"] = numpy_to_pygame_sound(
@@ -372,13 +435,8 @@ def init_sounds() -> None:
         # Level transition sound
         transition_sound = np.zeros(int(0.5 * sample_rate))
         chord_freqs = [392, 523, 659, 784]
-        for i, freq in enumerate(chord_freqs):
-            start = int(i * 0.12 * sample_rate)
-            if start < len(transition_sound):
-                tone = generate_sound(0.2, freq, "sine")
-                tone = apply_envelope(tone, "exp", 2)
-                end = min(start + len(tone), len(transition_sound))
-                transition_sound[start:end] += tone[: end - start] * 0.4
+        chord_starts = [int(i * 0.12 * sample_rate) for i in range(len(chord_freqs))]
+        synth_arpeggio(transition_sound, chord_freqs, chord_starts, 0.2, 2, 0.4)
 
         g_sounds["level_transition"] = numpy_to_pygame_sound(
             transition_sound * SoundConfig.sound_master_volume
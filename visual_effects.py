@@ -8,15 +8,39 @@ space dust, vignette, CRT effects, level transitions, and damage flash.
 import pygame
 import math
 import random
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from config import Cfg
 
+# Try to import numpy for vectorized starfield updates (falls back to per-star loops)
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 # Module globals for visual effects
+# Shared numpy Generator handed over from main's g_rng by init_visual_effects (None without numpy)
+g_rng: Optional[Any] = None
 g_stars: List[Dict[str, Any]] = []
+# Structure-of-arrays starfield used instead of g_stars when numpy is available
+g_star_arrays: Optional[Dict[str, Any]] = None
 g_dust_particles: List[Dict[str, Any]] = []
+# Structure-of-arrays dust used instead of g_dust_particles when numpy is available
+g_dust_arrays: Optional[Dict[str, Any]] = None
 g_vignette_surface: Optional[pygame.Surface] = None
+# Float staging buffer for the numpy vignette alpha field, reused while the screen size holds
+g_vignette_buffer: Optional[Any] = None
+# Pre-rendered scanline overlay keyed by (width, height, spacing)
+g_scanline_cache: Optional[Tuple[Tuple[int, int, int], pygame.Surface]] = None
+# Damage flash layers per flash color, drawn once at full intensity; cleared in init_visual_effects
+g_damage_flash_masks: Dict[Tuple[int, int, int], pygame.Surface] = {}
+g_damage_tint_surfaces: Dict[Tuple[int, int, int], pygame.Surface] = {}
+# Level transition text pre-scaled at LEVEL_TEXT_SCALE_STEPS sizes; cleared in init_visual_effects
+g_level_text_cache: Dict[str, Any] = {"text": None, "steps": []}
+LEVEL_TEXT_SCALE_STEPS: int = 12
 
 
 # Helper functions (duplicated to avoid circular imports)
@@ -34,9 +58,11 @@ def init_visual_effects(ctx: Dict[str, Any]) -> None:
     """Initialize visual effects with game context.
 
     Args:
-        ctx: Context dict with screen_width, screen_height, scale_factor
+        ctx: Context dict with screen_width, screen_height, scale_factor, rng
     """
-    global g_stars, g_dust_particles, g_vignette_surface
+    global g_stars, g_dust_particles, g_vignette_surface, g_rng
+
+    g_rng = ctx.get("rng")
 
     # Initialize starfield
     create_starfield(ctx["screen_width"], ctx["screen_height"])
@@ -47,6 +73,14 @@ def init_visual_effects(ctx: Dict[str, Any]) -> None:
     # Initialize vignette
     create_vignette(ctx["screen_width"], ctx["screen_height"], ctx["scale_factor"])
 
+    # Damage flash layers depend on screen size and scale
+    g_damage_flash_masks.clear()
+    g_damage_tint_surfaces.clear()
+
+    # Fonts are rebuilt at the new scale, so the pre-scaled level text is stale
+    g_level_text_cache["text"] = None
+    g_level_text_cache["steps"] = []
+
 
 def create_starfield(screen_width: int, screen_height: int) -> None:
     """Generate random starfield background.
@@ -56,14 +90,37 @@ def create_starfield(screen_width: int, screen_height: int) -> None:
         screen_height: Screen height
 
     Side effects:
-        Populates global g_stars list
+        Populates g_star_arrays when the shared g_rng is set, otherwise the g_stars list
     """
-    global g_stars
+    global g_stars, g_star_arrays
     g_stars = []
 
     area_multiplier = (screen_width * screen_height) / (Cfg.screen_width * Cfg.screen_height)
     star_count = int(Cfg.star_count_base * math.sqrt(area_multiplier))
 
+    if g_rng is not None:
+        # One batched draw per field instead of seven Python RNG calls per star
+        uniform = g_rng.uniform
+        size = np.where(g_rng.random(star_count) < 0.25, 2, 1).astype(np.int32)
+        g_star_arrays = {
+            "x": g_rng.integers(0, screen_width + 1, star_count).astype(np.float64),
+            "y": g_rng.integers(0, screen_height + 1, star_count).astype(np.float64),
+            "base_brightness": g_rng.integers(30, 151, star_count).astype(np.float64),
+            "size": size,
+            "twinkle_speed": uniform(Cfg.star_twinkle_speed_min, Cfg.star_twinkle_speed_max, star_count),
+            "twinkle_phase": uniform(0, math.pi * 2, star_count),
+            "twinkle_amount": uniform(Cfg.star_twinkle_amount_min, Cfg.star_twinkle_amount_max, star_count),
+        }
+        # Per-star constants the draw pass would otherwise rederive every frame
+        g_star_arrays["parallax"] = g_star_arrays["base_brightness"] * (Cfg.star_parallax_factor / 150.0)
+        g_star_arrays["is_small"] = size == 1
+        g_star_arrays["glow_indices"] = np.flatnonzero(size != 1)
+        # Per-frame work buffers, so the draw pass allocates nothing for brightness
+        g_star_arrays["twinkle"] = np.empty(star_count, dtype=np.float64)
+        g_star_arrays["brightness"] = np.empty(star_count, dtype=np.int32)
+        g_star_arrays["blue"] = np.empty(star_count, dtype=np.int32)
+        return
+
     for i in range(star_count):
         g_stars.append(
             {
@@ -100,27 +157,106 @@ def draw_stars(
         screen_width: Screen width
         screen_height: Screen height
     """
+    if g_star_arrays is not None:
+        draw_stars_vectorized(surface, g_star_arrays, shake_x, shake_y, frame_count, screen_width, screen_height)
+        return
+
+    # Parallax is base_brightness / 150 * star_parallax_factor; fold the frame-constant part once
+    shake_scale_x = shake_x * Cfg.star_parallax_factor / 150.0
+    shake_scale_y = shake_y * Cfg.star_parallax_factor / 150.0
+
+    sin = math.sin
+
+    # Lock once for the whole pass instead of per set_at call
+    set_at = surface.set_at
+    surface.lock()
     for star in g_stars:
-        twinkle = math.sin(star["twinkle_phase"] + frame_count * star["twinkle_speed"])
+        base_brightness = star["base_brightness"]
+        twinkle = sin(star["twinkle_phase"] + frame_count * star["twinkle_speed"])
         brightness_factor = 1.0 + (twinkle * star["twinkle_amount"])
-        brightness = int(star["base_brightness"] * brightness_factor)
+        brightness = int(base_brightness * brightness_factor)
         brightness = max(20, min(255, brightness))
 
         color = (brightness, brightness, min(255, brightness + 30))
 
-        parallax_factor = star["base_brightness"] / 150.0
-        x = int(star["x"] + shake_x * parallax_factor * Cfg.star_parallax_factor)
-        y = int(star["y"] + shake_y * parallax_factor * Cfg.star_parallax_factor)
+        x = int(star["x"] + base_brightness * shake_scale_x)
+        y = int(star["y"] + base_brightness * shake_scale_y)
+        pos = (x % screen_width, y % screen_height)
 
         if star["size"] == 1:
-            surface.set_at((x % screen_width, y % screen_height), color)
+            set_at(pos, color)
         else:
             glow_radius = star["size"] + 1
             glow_color = (color[0] // 3, color[1] // 3, color[2] // 2)
-            pygame.draw.circle(
-                surface, glow_color, (x % screen_width, y % screen_height), glow_radius
-            )
-            pygame.draw.circle(surface, color, (x % screen_width, y % screen_height), star["size"])
+            pygame.draw.circle(surface, glow_color, pos, glow_radius)
+            pygame.draw.circle(surface, color, pos, star["size"])
+    surface.unlock()
+
+
+def draw_stars_vectorized(
+    surface: pygame.Surface,
+    stars: Dict[str, Any],
+    shake_x: int,
+    shake_y: int,
+    frame_count: int,
+    screen_width: int,
+    screen_height: int,
+) -> None:
+    """Draw a structure-of-arrays starfield with whole-array numpy math.
+
+    Args:
+        surface: Surface to draw on
+        stars: Starfield arrays built by create_starfield (g_star_arrays)
+        shake_x: Screen shake X offset
+        shake_y: Screen shake Y offset
+        frame_count: Current frame for animation
+        screen_width: Screen width
+        screen_height: Screen height
+    """
+    # brightness = clip(int(base * (1 + sin(phase + frame * speed) * amount)), 20, 255), all in place
+    twinkle = stars["twinkle"]
+    np.multiply(stars["twinkle_speed"], frame_count, out=twinkle)
+    twinkle += stars["twinkle_phase"]
+    np.sin(twinkle, out=twinkle)
+    twinkle *= stars["twinkle_amount"]
+    twinkle += 1.0
+    twinkle *= stars["base_brightness"]
+    brightness = stars["brightness"]
+    np.copyto(brightness, twinkle, casting="unsafe")
+    np.clip(brightness, 20, 255, out=brightness)
+    blue = stars["blue"]
+    np.add(brightness, 30, out=blue)
+    np.minimum(blue, 255, out=blue)
+
+    parallax = stars["parallax"]
+    px = (stars["x"] + parallax * shake_x).astype(np.int32) % screen_width
+    py = (stars["y"] + parallax * shake_y).astype(np.int32) % screen_height
+
+    # Single-pixel stars go in as one fancy-indexed write on 24/32 bit surfaces; stars on the
+    # far edge fall off the surface. Other formats send every star through the loop below.
+    loop_indices = stars["glow_indices"]
+    if surface.get_bytesize() in (3, 4):
+        surface_width, surface_height = surface.get_size()
+        small = stars["is_small"] & (px < surface_width) & (py < surface_height)
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[px[small], py[small]] = np.stack((brightness[small], brightness[small], blue[small]), axis=1)
+        del pixels  # Releases the surface lock before drawing circles
+    else:
+        loop_indices = np.arange(len(px))
+
+    draw_circle = pygame.draw.circle
+    set_at = surface.set_at
+    sizes = stars["size"]
+    for i in loop_indices.tolist():
+        b = int(brightness[i])
+        color = (b, b, int(blue[i]))
+        pos = (int(px[i]), int(py[i]))
+        size = int(sizes[i])
+        if size == 1:
+            set_at(pos, color)
+        else:
+            draw_circle(surface, (b // 3, b // 3, color[2] // 2), pos, size + 1)
+            draw_circle(surface, color, pos, size)
 
 
 def create_space_dust(screen_width: int, screen_height: int, count: Optional[int] = None) -> None:
@@ -132,9 +268,9 @@ def create_space_dust(screen_width: int, screen_height: int, count: Optional[int
         count: Number of dust particles (defaults to Cfg.dust_count_base)
 
     Side effects:
-        Clears and repopulates g_dust_particles list
+        Repopulates g_dust_arrays when the shared g_rng is set, otherwise the g_dust_particles list
     """
-    global g_dust_particles
+    global g_dust_particles, g_dust_arrays
 
     if count is None:
         count = Cfg.dust_count_base
@@ -143,6 +279,15 @@ def create_space_dust(screen_width: int, screen_height: int, count: Optional[int
     area_multiplier = (screen_width * screen_height) / (Cfg.screen_width * Cfg.screen_height)
     dust_count = int(count * math.sqrt(area_multiplier))
 
+    if g_rng is not None:
+        g_dust_arrays = {
+            "x": g_rng.integers(0, screen_width + 1, dust_count).astype(np.float64),
+            "y": g_rng.integers(0, screen_height + 1, dust_count).astype(np.float64),
+            "size": np.where(g_rng.random(dust_count) < 0.25, 2, 1).astype(np.int32),
+            "brightness": g_rng.integers(40, 81, dust_count).astype(np.int32),
+        }
+        return
+
     for _ in range(dust_count):
         g_dust_particles.append(
             {
@@ -175,25 +320,96 @@ def update_and_draw_dust(
     screen_width = ctx["screen_width"]
     screen_height = ctx["screen_height"]
 
+    # Drift of zero during level transitions keeps dust still with a single pass
+    dx = dy = 0.0
     if game_state["effects"]["level_transition"] == 0:
         parallax_scale = min(screen_width / 800, screen_height / 600)
 
-        dx = -ship.vel_x * Cfg.dust_parallax * parallax_scale * game_state["time_scale"]
-        dy = -ship.vel_y * Cfg.dust_parallax * parallax_scale * game_state["time_scale"]
+        drift = Cfg.dust_parallax * parallax_scale * game_state["time_scale"]
+        dx = -ship.vx * drift
+        dy = -ship.vy * drift
 
-        for dust in g_dust_particles:
-            dust["x"] = (dust["x"] + dx) % screen_width
-            dust["y"] = (dust["y"] + dy) % screen_height
+    if g_dust_arrays is not None:
+        update_and_draw_dust_vectorized(
+            surface, g_dust_arrays, dx, dy, offset_x, offset_y, screen_width, screen_height
+        )
+        return
 
+    surface_width, surface_height = surface.get_size()
+    set_at = surface.set_at
+    surface.lock()
     for dust in g_dust_particles:
-        color = (dust["brightness"], dust["brightness"], dust["brightness"] + 20)
-        dust_x = int(dust["x"] - offset_x)
-        dust_y = int(dust["y"] - offset_y)
-        if 0 <= dust_x < surface.get_width() and 0 <= dust_y < surface.get_height():
+        x = dust["x"] = (dust["x"] + dx) % screen_width
+        y = dust["y"] = (dust["y"] + dy) % screen_height
+
+        dust_x = int(x - offset_x)
+        dust_y = int(y - offset_y)
+        if 0 <= dust_x < surface_width and 0 <= dust_y < surface_height:
+            brightness = dust["brightness"]
+            color = (brightness, brightness, brightness + 20)
             if dust["size"] == 1:
-                surface.set_at((dust_x, dust_y), color)
+                set_at((dust_x, dust_y), color)
             else:
                 pygame.draw.circle(surface, color, (dust_x, dust_y), dust["size"])
+    surface.unlock()
+
+
+def update_and_draw_dust_vectorized(
+    surface: pygame.Surface,
+    dust: Dict[str, Any],
+    dx: float,
+    dy: float,
+    offset_x: int,
+    offset_y: int,
+    screen_width: int,
+    screen_height: int,
+) -> None:
+    """Move and draw structure-of-arrays dust with whole-array numpy math.
+
+    Args:
+        surface: Surface to draw on
+        dust: Dust arrays built by create_space_dust (g_dust_arrays)
+        dx: X drift for this frame
+        dy: Y drift for this frame
+        offset_x: X offset for drawing
+        offset_y: Y offset for drawing
+        screen_width: Screen width
+        screen_height: Screen height
+
+    Side effects:
+        Modifies the dust position arrays in place
+    """
+    x = dust["x"]
+    y = dust["y"]
+    np.mod(x + dx, screen_width, out=x)
+    np.mod(y + dy, screen_height, out=y)
+
+    surface_width, surface_height = surface.get_size()
+    dust_x = (x - offset_x).astype(np.int32)
+    dust_y = (y - offset_y).astype(np.int32)
+    visible = (dust_x >= 0) & (dust_x < surface_width) & (dust_y >= 0) & (dust_y < surface_height)
+    brightness = dust["brightness"]
+    size = dust["size"]
+
+    # Single-pixel dust goes in as one fancy-indexed write on 24/32 bit surfaces
+    small = visible & (size == 1)
+    if surface.get_bytesize() in (3, 4):
+        pixels = pygame.surfarray.pixels3d(surface)
+        b = brightness[small]
+        pixels[dust_x[small], dust_y[small]] = np.stack((b, b, b + 20), axis=1)
+        del pixels  # Releases the surface lock before drawing circles
+        visible &= ~small
+
+    draw_circle = pygame.draw.circle
+    set_at = surface.set_at
+    for i in np.flatnonzero(visible).tolist():
+        b = int(brightness[i])
+        color = (b, b, b + 20)
+        pos = (int(dust_x[i]), int(dust_y[i]))
+        if size[i] == 1:
+            set_at(pos, color)
+        else:
+            draw_circle(surface, color, pos, int(size[i]))
 
 
 def create_vignette(screen_width: int, screen_height: int, scale_factor: float) -> None:
@@ -205,15 +421,39 @@ def create_vignette(screen_width: int, screen_height: int, scale_factor: float)
         scale_factor: Global scale factor
 
     Side effects:
-        Sets global g_vignette_surface
+        Sets global g_vignette_surface; with numpy, reuses it and g_vignette_buffer at an unchanged size
     """
-    global g_vignette_surface
-    g_vignette_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+    global g_vignette_surface, g_vignette_buffer
 
     center_x = screen_width // 2
     center_y = screen_height // 2
     max_radius = math.sqrt(center_x**2 + center_y**2)
 
+    if NUMPY_AVAILABLE:
+        # The alpha channel is fully rewritten below, so a same-sized surface can be kept
+        if g_vignette_surface is None or g_vignette_surface.get_size() != (screen_width, screen_height):
+            g_vignette_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+            g_vignette_buffer = np.empty((screen_width, screen_height), dtype=np.float64)
+
+        # Same falloff as the ring loop below (progress = 1 - distance / max_radius), computed
+        # per pixel in one pass instead of compositing vignette_steps full-screen ring surfaces
+        dist_x = np.arange(screen_width, dtype=np.float64)[:, None] - center_x
+        dist_y = np.arange(screen_height, dtype=np.float64)[None, :] - center_y
+        falloff = np.hypot(dist_x, dist_y, out=g_vignette_buffer)
+        falloff *= -1.0 / max_radius
+        falloff += 1.0
+        np.clip(falloff, 0.0, 1.0, out=falloff)
+        falloff *= falloff
+        falloff *= 255 * Cfg.vignette_strength
+
+        # Cast straight into the surface's alpha plane; no intermediate uint8 array or byte copy
+        alpha_plane = pygame.surfarray.pixels_alpha(g_vignette_surface)
+        np.copyto(alpha_plane, falloff, casting="unsafe")
+        del alpha_plane  # Releases the surface lock
+        return
+
+    g_vignette_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+
     for step in range(Cfg.vignette_steps):
         progress = step / Cfg.vignette_steps
         radius = int(max_radius * (1 - progress))
@@ -241,19 +481,26 @@ def draw_crt_effects(
         screen_width: Screen width
         screen_height: Screen height
         scale_factor: Global scale factor
+
+    Globals:
+        Reads and rebuilds g_scanline_cache when the size or spacing changes
     """
-    scanline_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+    global g_scanline_cache
 
     scanline_spacing = max(2, int(scaled(Cfg.scanline_spacing, scale_factor)))
-    for y in range(0, screen_height, scanline_spacing):
-        if (y // scanline_spacing) % 2 == 0:
-            alpha = Cfg.scanline_alpha
-        else:
-            alpha = Cfg.scanline_alpha // 2
+    cache_key = (screen_width, screen_height, scanline_spacing)
+    if g_scanline_cache is None or g_scanline_cache[0] != cache_key:
+        scanline_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+        for y in range(0, screen_height, scanline_spacing):
+            if (y // scanline_spacing) % 2 == 0:
+                alpha = Cfg.scanline_alpha
+            else:
+                alpha = Cfg.scanline_alpha // 2
 
-        pygame.draw.line(scanline_surface, (0, 0, 0, alpha), (0, y), (screen_width, y), 1)
+            pygame.draw.line(scanline_surface, (0, 0, 0, alpha), (0, y), (screen_width, y), 1)
+        g_scanline_cache = (cache_key, scanline_surface)
 
-    surface.blit(scanline_surface, (0, 0))
+    surface.blit(g_scanline_cache[1], (0, 0))
 
     if g_vignette_surface:
         surface.blit(g_vignette_surface, (0, 0))
@@ -285,10 +532,8 @@ def draw_level_transition(
 
         flash_alpha = int(255 * (1 - ring_progress) * 0.5)
         if flash_alpha > 0:
-            flash_surface = pygame.Surface((screen_width, screen_height))
-            flash_surface.set_alpha(flash_alpha)
-            flash_surface.fill((255, 255, 255))
-            surface.blit(flash_surface, (0, 0))
+            # Additive fill in place; matches a white overlay at this alpha on the dark playfield
+            surface.fill((flash_alpha, flash_alpha, flash_alpha), special_flags=pygame.BLEND_RGB_ADD)
 
         ring_radius = int(ring_progress * math.sqrt(screen_width**2 + screen_height**2))
         ring_thickness = max(1, int(10 * (1 - ring_progress) * scale_factor))
@@ -307,6 +552,33 @@ def draw_level_transition(
         )
 
 
+def prepare_level_transition_text(text: str, font: pygame.font.Font) -> None:
+    """Pre-render the level transition text at every scale step it animates through.
+
+    Args:
+        text: Transition text
+        font: Font to render with
+
+    Side effects:
+        Rebuilds g_level_text_cache
+    """
+    base_surface = font.render(text, True, (255, 255, 255))
+    base_width, base_height = base_surface.get_size()
+    last_step = LEVEL_TEXT_SCALE_STEPS - 1
+
+    steps = []
+    for i in range(LEVEL_TEXT_SCALE_STEPS):
+        scale = Cfg.level_text_scale_min + (Cfg.level_text_scale_max - Cfg.level_text_scale_min) * (
+            i / last_step
+        )
+        steps.append(
+            pygame.transform.smoothscale(base_surface, (int(base_width * scale), int(base_height * scale)))
+        )
+
+    g_level_text_cache["text"] = text
+    g_level_text_cache["steps"] = steps
+
+
 def draw_level_transition_text(
     surface: pygame.Surface,
     progress: float,
@@ -324,6 +596,9 @@ def draw_level_transition_text(
         screen_width: Screen width
         screen_height: Screen height
         scale_factor: Global scale factor
+
+    Globals:
+        Reads g_level_text_cache, rebuilding it if the text was not prepared
     """
     # Import font here to avoid circular imports
     from main import g_big_font
@@ -335,14 +610,12 @@ def draw_level_transition_text(
         1 - Cfg.level_text_appear_threshold
     )
 
+    last_step = LEVEL_TEXT_SCALE_STEPS - 1
     if text_progress < Cfg.level_text_fade_threshold:
-        scale = (
-            Cfg.level_text_scale_min
-            + (Cfg.level_text_scale_max - Cfg.level_text_scale_min) * text_progress
-        )
+        step = round(text_progress * last_step)
         alpha = 255
     else:
-        scale = Cfg.level_text_scale_max
+        step = last_step
         fade_progress = (text_progress - Cfg.level_text_fade_threshold) / (
             1 - Cfg.level_text_fade_threshold
         )
@@ -352,18 +625,53 @@ def draw_level_transition_text(
         return
 
     text = game_state["effects"]["level_transition_text"]
-    text_surface = g_big_font.render(text, True, (255, 255, 255))
-
-    if scale != 1.0:
-        new_width = int(text_surface.get_width() * scale)
-        new_height = int(text_surface.get_height() * scale)
-        text_surface = pygame.transform.scale(text_surface, (new_width, new_height))
+    if g_level_text_cache["text"] != text:
+        prepare_level_transition_text(text, g_big_font)
 
+    text_surface = g_level_text_cache["steps"][step]
     text_surface.set_alpha(alpha)
     text_rect = text_surface.get_rect(center=(screen_width // 2, screen_height // 2))
     surface.blit(text_surface, text_rect)
 
 
+def create_damage_flash_mask(
+    color: Tuple[int, int, int], screen_width: int, screen_height: int, scale_factor: float
+) -> pygame.Surface:
+    """Render the layered edge borders of the damage flash at full intensity.
+
+    Args:
+        color: Flash color
+        screen_width: Screen width
+        screen_height: Screen height
+        scale_factor: Global scale factor
+
+    Returns:
+        SRCALPHA surface whose per-pixel alpha is scaled by set_alpha at draw time
+    """
+    mask = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+
+    max_layers = 6
+    for i in range(max_layers):
+        alpha = int(200 * (1 - i * 0.15))
+        inset = int(i * 50 * scale_factor)
+        thickness = int((80 - i * 10) * scale_factor)
+
+        layer_color = (*color, alpha)
+
+        pygame.draw.rect(mask, layer_color, (0, inset, screen_width, thickness))
+        pygame.draw.rect(
+            mask, layer_color, (0, screen_height - inset - thickness, screen_width, thickness)
+        )
+        pygame.draw.rect(mask, layer_color, (inset, inset, thickness, screen_height - inset * 2))
+        pygame.draw.rect(
+            mask,
+            layer_color,
+            (screen_width - inset - thickness, inset, thickness, screen_height - inset * 2),
+        )
+
+    return mask
+
+
 def draw_damage_flash(
     surface: pygame.Surface,
     game_state: Dict[str, Any],
@@ -379,12 +687,13 @@ def draw_damage_flash(
         screen_width: Screen width
         screen_height: Screen height
         scale_factor: Global scale factor
+
+    Globals:
+        Caches border masks in g_damage_flash_masks and tint layers in g_damage_tint_surfaces
     """
     if game_state["effects"]["damage_flash"] <= 0:
         return
 
-    vignette = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-
     max_duration = (
         Cfg.damage_flash_duration
         if game_state["effects"]["damage_flash_color"][0] > 200
@@ -402,34 +711,24 @@ def draw_damage_flash(
         )
         intensity = min(1.0, intensity + pulse)
 
-    max_layers = 6
-    for i in range(max_layers):
-        layer_intensity = intensity * (1 - i * 0.15)
-        if layer_intensity <= 0:
-            continue
-
-        alpha = int(200 * layer_intensity)
-        inset = int(i * 50 * scale_factor)
-        thickness = int((80 - i * 10) * scale_factor)
-
-        color = (*game_state["effects"]["damage_flash_color"], alpha)
-
-        pygame.draw.rect(vignette, color, (0, inset, screen_width, thickness))
-        pygame.draw.rect(
-            vignette, color, (0, screen_height - inset - thickness, screen_width, thickness)
-        )
-        pygame.draw.rect(vignette, color, (inset, inset, thickness, screen_height - inset * 2))
-        pygame.draw.rect(
-            vignette,
-            color,
-            (screen_width - inset - thickness, inset, thickness, screen_height - inset * 2),
-        )
+    if intensity <= 0:
+        return
 
-    surface.blit(vignette, (0, 0))
+    # Every layer's alpha is proportional to intensity, so one surface alpha scales the whole mask
+    flash_color = game_state["effects"]["damage_flash_color"]
+    mask = g_damage_flash_masks.get(flash_color)
+    if mask is None:
+        mask = create_damage_flash_mask(flash_color, screen_width, screen_height, scale_factor)
+        g_damage_flash_masks[flash_color] = mask
+    mask.set_alpha(int(255 * min(1.0, intensity)))
+    surface.blit(mask, (0, 0))
 
     if intensity > Cfg.damage_flash_tint_threshold:
         tint_alpha = int(Cfg.damage_flash_tint_alpha * (intensity - 0.5))
-        tint = pygame.Surface((screen_width, screen_height))
+        tint = g_damage_tint_surfaces.get(flash_color)
+        if tint is None:
+            tint = pygame.Surface((screen_width, screen_height))
+            tint.fill(flash_color)
+            g_damage_tint_surfaces[flash_color] = tint
         tint.set_alpha(tint_alpha)
-        tint.fill(game_state["effects"]["damage_flash_color"])
         surface.blit(tint, (0, 0))